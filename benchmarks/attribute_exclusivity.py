@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Benchmark of the attribute-exclusivity pruning (i.e., two selectors with the same attribute are never combined) in the VLSD, BSD and IDSD algorithms. For each dataset and algorithm, it reports the execution time of the 'fit' method and, for VLSD, the number of joins between Vertical Lists which are computed along with how many of them are between two Vertical Lists whose last selectors have the same attribute (i.e., joins which are always empty). Run it against a version without this pruning to compare both.
+
+The reduction grows with the cardinality of the attributes (an attribute with c values has c*(c-1)/2 pairs of selectors which are never combined), so, apart from the datasets included in the library, synthetic datasets with high-cardinality attributes are generated.
+
+Usage: python benchmarks/attribute_exclusivity.py [--datasets mushroom synthetic-30 ...] [--algorithms vlsd bsd idsd] [--repetitions 3]
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+from numpy.random import default_rng
+from pandas import DataFrame
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.algorithms.subgroup_sets.bsd import BSD
+from subgroups.algorithms.subgroup_sets.idsd import IDSD
+from subgroups.data_structures.vertical_list_with_bitsets import VerticalListWithBitsets
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups import datasets
+
+def load_synthetic_dataset(cardinality, number_of_attributes=6, number_of_instances=2000, seed=0):
+    """Generate a dataset with 'number_of_attributes' nominal attributes with 'cardinality' values each and a binary target which depends on the first attribute.
+    """
+    rng = default_rng(seed)
+    columns = {"a" + str(index) : ["v" + str(value) for value in rng.integers(0, cardinality, number_of_instances)] for index in range(number_of_attributes)}
+    columns["class"] = ["yes" if (value in ("v0", "v1")) or (rng.random() < 0.3) else "no" for value in columns["a0"]]
+    return DataFrame(columns)
+
+# Dataset name -> (loading function, target).
+DATASETS = {
+    "mushroom" : (datasets.load_mushroom_csv, ("class", "p")),
+    "car-evaluation" : (datasets.load_car_evaluation_csv, ("class", "unacc")),
+    "synthetic-10" : (lambda : load_synthetic_dataset(10), ("class", "yes")),
+    "synthetic-30" : (lambda : load_synthetic_dataset(30), ("class", "yes")),
+    "synthetic-100" : (lambda : load_synthetic_dataset(100), ("class", "yes")),
+}
+
+ALGORITHMS = ["vlsd", "bsd", "idsd"]
+
+# Number of joins between Vertical Lists computed in the current execution of VLSD and number of them whose last selectors have the same attribute (see 'count_joins').
+number_of_joins = 0
+number_of_same_attribute_joins = 0
+
+def count_joins(join_with_many):
+    def wrapper(self, others, *args, **kwargs):
+        global number_of_joins, number_of_same_attribute_joins
+        number_of_joins = number_of_joins + len(others)
+        attribute_name = self.list_of_selectors[-1].attribute_name
+        number_of_same_attribute_joins = number_of_same_attribute_joins + sum(1 for other in others if other.list_of_selectors[-1].attribute_name == attribute_name)
+        return join_with_many(self, others, *args, **kwargs)
+    return wrapper
+
+VerticalListWithBitsets.join_with_many = count_joins(VerticalListWithBitsets.join_with_many)
+
+def run_algorithm(algorithm, df, target):
+    if algorithm == "vlsd":
+        model = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), 0.002 * len(df.index), sort_criterion_in_s1=VLSD.SORT_CRITERION_QUALITY_DESCENDING, max_depth=3)
+    elif algorithm == "bsd":
+        model = BSD(0.01 * len(df.index), WRAcc(), WRAccOptimisticEstimate1(), 10, 3)
+    else:
+        model = IDSD(10, max_complexity=2, coverage_thld=0.01)
+    model.fit(df, target)
+    return model
+
+def main():
+    global number_of_joins, number_of_same_attribute_joins
+    parser = ArgumentParser(description="Benchmark of the attribute-exclusivity pruning in the VLSD, BSD and IDSD algorithms.")
+    parser.add_argument("--datasets", nargs="+", default=list(DATASETS), choices=list(DATASETS))
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS, choices=ALGORITHMS)
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+    print("dataset;algorithm;best time (s);computed joins;same-attribute joins")
+    for dataset_name in args.datasets:
+        load_function, target = DATASETS[dataset_name]
+        df = load_function()
+        for algorithm in args.algorithms:
+            # Execution time (best of several repetitions).
+            best_time = float("inf")
+            for _ in range(args.repetitions):
+                number_of_joins = 0
+                number_of_same_attribute_joins = 0
+                start = perf_counter()
+                run_algorithm(algorithm, df, target)
+                best_time = min(best_time, perf_counter() - start)
+            if algorithm == "vlsd":
+                print(dataset_name + ";" + algorithm + ";" + "{:.3f}".format(best_time) + ";" + str(number_of_joins) + ";" + str(number_of_same_attribute_joins))
+            else:
+                print(dataset_name + ";" + algorithm + ";" + "{:.3f}".format(best_time) + ";-;-")
+
+if __name__ == "__main__":
+    main()
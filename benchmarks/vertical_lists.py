@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Benchmark of the Vertical List implementations available in the VLSD algorithm. For each dataset and implementation, it reports the execution time of the 'fit' method, the peak of memory allocated during its execution (measured in a different run by means of 'tracemalloc'), the peak of memory allocated during the search (i.e., from the moment in which the Vertical Lists of size 1 have been built, so the dataset, the covers of the selectors and S1 are not counted) and the number of visited nodes.
+
+IMPORTANT: the Vertical Lists of size 1 store complete sequences in all the implementations, so the differences between implementations in the memory used by the rest of Vertical Lists (e.g., the saving of the diffsets) are only shown by the peak of memory during the search.
+
+Usage: python benchmarks/vertical_lists.py [--datasets mushroom tic-tac-toe ...] [--implementations bitsets sets ...] [--oe-minimum-threshold 0.03] [--repetitions 3]
+
+IMPORTANT: the optimistic estimate used (WRAccOptimisticEstimate1) is not normalized, so the minimum threshold passed by parameter is multiplied by the number of instances of each dataset.
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+import tracemalloc
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups import datasets
+
+# Dataset name -> (loading function, target).
+DATASETS = {
+    "mushroom" : (datasets.load_mushroom_csv, ("class", "p")),
+    "tic-tac-toe" : (datasets.load_tic_tac_toe_csv, ("class", "positive")),
+    "car-evaluation" : (datasets.load_car_evaluation_csv, ("class", "unacc")),
+    "vote" : (datasets.load_vote_csv, ("class", "democrat")),
+}
+
+class SearchMemoryVLSD(VLSD):
+    """VLSD algorithm which stores the memory allocated (according to 'tracemalloc') when the Vertical Lists of size 1 have been built and resets the peak of memory at that moment, so that the peak of memory after the 'fit' method is the peak during the search.
+    """
+
+    __slots__ = "memory_after_s1"
+
+    def _generate_subgroups_s1(self, covers_of_the_selectors, target_attribute_as_a_mask, TP, FP):
+        S1 = super()._generate_subgroups_s1(covers_of_the_selectors, target_attribute_as_a_mask, TP, FP)
+        self.memory_after_s1 = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        return S1
+
+def run_vlsd(df, target, vertical_lists_implementation, oe_minimum_threshold, vlsd_class=VLSD):
+    vlsd = vlsd_class(WRAcc(), 0, WRAccOptimisticEstimate1(), oe_minimum_threshold * len(df.index), sort_criterion_in_s1=VLSD.SORT_CRITERION_QUALITY_DESCENDING, vertical_lists_implementation=vertical_lists_implementation)
+    vlsd.fit(df, target)
+    return vlsd
+
+def main():
+    parser = ArgumentParser(description="Benchmark of the Vertical List implementations available in the VLSD algorithm.")
+    parser.add_argument("--datasets", nargs="+", default=list(DATASETS), choices=list(DATASETS))
+    parser.add_argument("--implementations", nargs="+", default=VLSD.VERTICAL_LISTS_IMPLEMENTATION, choices=VLSD.VERTICAL_LISTS_IMPLEMENTATION)
+    parser.add_argument("--oe-minimum-threshold", type=float, default=0.03)
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+    print("dataset;implementation;best time (s);peak memory (MiB);search peak memory (MiB);visited nodes")
+    for dataset_name in args.datasets:
+        load_function, target = DATASETS[dataset_name]
+        df = load_function()
+        for vertical_lists_implementation in args.implementations:
+            # Execution time (best of several repetitions).
+            best_time = float("inf")
+            for _ in range(args.repetitions):
+                start = perf_counter()
+                vlsd = run_vlsd(df, target, vertical_lists_implementation, args.oe_minimum_threshold)
+                best_time = min(best_time, perf_counter() - start)
+            # Peak of memory (a different run, because 'tracemalloc' slows down the execution).
+            tracemalloc.start()
+            run_vlsd(df, target, vertical_lists_implementation, args.oe_minimum_threshold)
+            peak_memory = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+            # Peak of memory during the search (another run, because the peak is reset when S1 has been built).
+            tracemalloc.start()
+            search_memory_vlsd = run_vlsd(df, target, vertical_lists_implementation, args.oe_minimum_threshold, vlsd_class=SearchMemoryVLSD)
+            search_peak_memory = (tracemalloc.get_traced_memory()[1] - search_memory_vlsd.memory_after_s1) / (1024 * 1024)
+            tracemalloc.stop()
+            print(dataset_name + ";" + vertical_lists_implementation + ";" + "{:.3f}".format(best_time) + ";" + "{:.1f}".format(peak_memory) + ";" + "{:.2f}".format(search_peak_memory) + ";" + str(vlsd.visited_nodes))
+
+if __name__ == "__main__":
+    main()
@@ -255,14 +255,26 @@ class BSD(Algorithm):
                         selCondAux = Pattern([s[1]])
                     # We remove the selector from the list of relevant selectors to avoid evaluating it again
                     newSelRelAux.remove(s[1])
+                    selRelOfTheChild = self._remove_selectors_of_the_same_attribute(s[1], newSelRelAux)
                     cCurrPos = self._logicalAnd(CcondPos, self._bitset_pos[s[1]])
                     cCurrNeg = self._logicalAnd(CcondNeg, self._bitset_neg[s[1]])
-                    self._BSD(selCondAux, newSelRelAux, cCurrPos, cCurrNeg, depth+1)
+                    self._BSD(selCondAux, selRelOfTheChild, cCurrPos, cCurrNeg, depth+1)
                 # If the optimistic estimate is less than the quality of the worst subgroup, we prune the subgroup
                 else:
                     self._pruned_subgroups += 1
                     self._unselected_subgroups +=1
 
+    def _remove_selectors_of_the_same_attribute(self, selector : Selector, selRel : list) -> list:
+        """Private method to remove from a list of relevant selectors those with the same attribute as a given selector. They are not evaluated with it, because the resulting pattern never appears in the dataset (they are directly counted as unselected subgroups, so the counters are the same as if they were evaluated).
+
+        :param selector: the selector which is added to the conditioned selectors.
+        :param selRel: list of relevant selectors.
+        :return: a new list with the relevant selectors whose attribute is different from the attribute of the given selector.
+        """
+        selRelOfTheChild = [sel for sel in selRel if sel.attribute_name != selector.attribute_name]
+        self._unselected_subgroups += len(selRel) - len(selRelOfTheChild)
+        return selRelOfTheChild
+
     def _checkRelevancies(self,cCurrPos : bitarray, cCurrNeg : bitarray ,sg : Pattern) -> None:
         """Internal method to check relevacies in _k_subgroups after the addition of a new subgroups sg.
 
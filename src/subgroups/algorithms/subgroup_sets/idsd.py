@@ -188,6 +188,7 @@ class IDSD(Algorithm):
         :param tuple_target_attribute_value: the tuple which contains the target attribute name and the target attribute values.
         """
         selectors = []
+        # IMPORTANT: the selectors of each attribute are generated consecutively, because '_grow_tree' only checks the attribute of the last added selector to avoid the patterns with two selectors of the same attribute.
         for column in df.columns:
             # We don't generate selectors for the target attribute.
             if column != tuple_target_attribute_value[0]:
@@ -320,7 +321,7 @@ class IDSD(Algorithm):
             if len(self._top_k_subgroups) > self._num_subgroups:
                 self._top_k_subgroups.pop()
     
-    def _grow_tree(self,df : DataFrame,tuple_target_attribute_value: tuple,selectors: list[Selector],complexity: int, pattern:Pattern, pattern_appearance: Series) -> None:
+    def _grow_tree(self,df : DataFrame,tuple_target_attribute_value: tuple,selectors: list[Selector],complexity: int, pattern:Pattern, pattern_appearance: Series, last_attribute_name: Union[str,None] = None) -> None:
         """ Recurssive method to grow the tree of patterns.
         :param df: the dataset.
         :param tuple_target_attribute_value: the tuple which contains the target attribute name and the target attribute values.
@@ -329,6 +330,7 @@ class IDSD(Algorithm):
         :param top_k_subgroups: the list of best subgroups for the current complexity.
         :param pattern: the current pattern (node of the tree).
         :param pattern_appearance: the appearance of the current pattern.
+        :param last_attribute_name: the attribute name of the last selector added to the current pattern (None for the empty pattern).
         """
         
         # We count the number of unique visited subgroups only if the current complexity is the maximum complexity so we don't count the same subgroup twice.
@@ -364,13 +366,21 @@ class IDSD(Algorithm):
             return
         # If we have not pruned the branch and we have not reached the maximum depth, we continue growing the tree.
         for i in range(len(selectors)):
+            # The patterns with two selectors of the same attribute never appear in the database, so the intersection is not computed and they are directly counted as the visited and pruned subgroups that they are (see the beginning of this method). Since the selectors of each attribute are consecutive (see '_generate_selectors'), only the selectors of the attribute of the last added selector have to be checked.
+            if selectors[i].attribute_name == last_attribute_name:
+                if len(pattern) + 1 == complexity:
+                    self._visited_subgroups += 1
+                self._non_unique_visited_subgroups += 1
+                if complexity == self._max_complexity:
+                    self._pruned_subgroups += 1
+                continue
             # Pattern with the new selector.
             new_pattern = pattern.copy()
             new_pattern.add_selector(selectors[i])
             # The new pattern appearance is the intersection of the appearance of the current pattern and the appearance of the new selector.
             new_pattern_appearance = pattern_appearance & self._selector_appearances[selectors[i]]
             # We do not use the full list of patterns in each call to avoid repeating the same patterns.
-            self._grow_tree(df, tuple_target_attribute_value, selectors[i+1:], complexity, new_pattern, new_pattern_appearance)
+            self._grow_tree(df, tuple_target_attribute_value, selectors[i+1:], complexity, new_pattern, new_pattern_appearance, selectors[i].attribute_name)
 
     def fit(self, pandas_dataframe: DataFrame, tuple_target_attribute_value: tuple) -> None:
         """Main method to run the QFinder algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
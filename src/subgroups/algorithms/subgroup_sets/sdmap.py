@@ -12,25 +12,54 @@ from subgroups.algorithms.algorithm import Algorithm
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.exceptions import InconsistentMethodParametersError, DatasetAttributeTypeError
 from subgroups.data_structures.fp_tree_for_sdmap import FPTreeForSDMap
+from subgroups.data_structures.fp_tree_with_arrays_for_sdmap import FPTreeWithArraysForSDMap
 from subgroups.core.pattern import Pattern
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from subgroups.core.subgroup import Subgroup
 from numpy import sum
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from io import StringIO
+from os import cpu_count
+from math import comb
 
 # Python annotations.
-from typing import Union
+from typing import Union, ClassVar
 
-def _generate_all_combinations(list_of_selectors : list[Selector]):
-    """Private method to generate all the combinations (including the empty list) of the list of selectors passed by parameter.
+def _generate_combinations(list_of_selectors : list, index : int, maximum_size : Union[int, None] = None):
+    """Private generator which lazily yields all the combinations of the list of selectors passed by parameter whose first selector is the one in the position 'index' (i.e., the combinations of list_of_selectors[index:] containing list_of_selectors[index]).
     
-    :param list_of_selectors: the list of selectors which is used.
-    :return: all combinations (including the empty list) of the list of selectors passed by parameter.
+    :param list_of_selectors: the list of selectors which is used. It could be a list of selectors or a list of integer item ids depending on the implementation of the FPTree.
+    :param index: the position of the first selector of all the generated combinations.
+    :param maximum_size: the maximum number of selectors of the generated combinations (or None, in order not to limit it). By default, None.
+    :return: a generator of the combinations.
     """
-    if list_of_selectors == []:
-        return [[]]
-    x = _generate_all_combinations(list_of_selectors[1:])
-    return x + [[list_of_selectors[0]] + y for y in x]
+    first_selector = [list_of_selectors[index]]
+    yield first_selector
+    # The combinations with only one selector are not extended.
+    if (maximum_size is not None) and (maximum_size < 2):
+        return
+    next_maximum_size = None if (maximum_size is None) else (maximum_size - 1)
+    # The combinations are generated in the same order as the recursive enumeration of all the combinations of the list (from the last selector to the first one).
+    for next_index in range(len(list_of_selectors)-1, index, -1):
+        for combination in _generate_combinations(list_of_selectors, next_index, next_maximum_size):
+            yield first_selector + combination
+
+def _number_of_combinations(number_of_selectors : int, maximum_size : Union[int, None]) -> int:
+    """Private method to compute the number of combinations generated by the method '_generate_combinations' from a selector followed by 'number_of_selectors' selectors.
+    
+    :param number_of_selectors: the number of selectors after the first selector of the combinations.
+    :param maximum_size: the maximum number of selectors of the combinations (or None, if it is not limited).
+    :return: the number of combinations.
+    """
+    if (maximum_size is None) or (maximum_size > number_of_selectors):
+        return 2 ** number_of_selectors
+    # The first selector along with up to 'maximum_size - 1' of the other selectors.
+    number_of_combinations = 0
+    for size in range(maximum_size):
+        number_of_combinations = number_of_combinations + comb(number_of_selectors, size)
+    return number_of_combinations
 
 def _delete_subgroup_parameters_from_a_dictionary(dict_of_parameters : dict[str, Union[int, float]]):
     """Private method to delete the subgroup parameters (i.e., tp, fp, TP and FP) from a dictionary of parameters. IMPORTANT: this method modifies the parameter, does not return a new dictionary.
@@ -54,6 +83,41 @@ def _delete_subgroup_parameters_from_a_dictionary(dict_of_parameters : dict[str,
     except KeyError:
         pass
 
+# State shared by all the branches searched in a worker process (see the 'n_jobs' parameter of the SDMap algorithm). It is set only once per worker process by means of the function '_initialize_worker'.
+_worker_state = None
+
+def _initialize_worker(sdmap : 'SDMap', fptree : Union[FPTreeForSDMap, FPTreeWithArraysForSDMap], target : tuple[str, str], TP : int, FP : int) -> None:
+    """Private method to initialize a worker process of the SDMap algorithm. IMPORTANT: the FPTree is only read in the worker process.
+    
+    :param sdmap: the SDMap instance (without an open file) whose configuration is used in the worker process.
+    :param fptree: the FPTree generated from the complete dataset.
+    :param target: a tuple with 2 elements: the target attribute name and the target value.
+    :param TP: the true population of the dataset.
+    :param FP: the false population of the dataset.
+    """
+    global _worker_state
+    _worker_state = (sdmap, fptree, target, TP, FP)
+
+def _fpgrowth_branch_in_worker(ai : Union[Selector, int]) -> tuple[str, int, int, int]:
+    """Private method to search, in a worker process, the branch of the SDMap algorithm which starts with the item ai of the header table of the FPTree generated from the complete dataset.
+    
+    :param ai: the item of the header table from which the branch starts.
+    :return: a tuple with 4 elements: (1) the results written by the branch (empty str if the results are not written in a file), (2) the number of selected subgroups in the branch, (3) the number of unselected subgroups in the branch and (4) the number of pruned subgroups in the branch.
+    """
+    sdmap, fptree, target, TP, FP = _worker_state
+    sdmap._selected_subgroups = 0
+    sdmap._unselected_subgroups = 0
+    sdmap._pruned_subgroups = 0
+    # The results of the branch are written in memory and are returned to the main process, which writes them in the final file in a deterministic order.
+    if (sdmap._file_path is not None):
+        sdmap._file = StringIO()
+    sdmap._fpgrowth_branch(fptree, ai, None, target, TP, FP)
+    written_results = ""
+    if (sdmap._file_path is not None):
+        written_results = sdmap._file.getvalue()
+        sdmap._file = None
+    return (written_results, sdmap._selected_subgroups, sdmap._unselected_subgroups, sdmap._pruned_subgroups)
+
 class SDMap(Algorithm):
     """This class represents the SDMap algorithm. Two threshold types could be used: (1) the true positives tp and the false positives fp separately or (2) the subgroup description size n (n = tp + fp). This means that: (1) if 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and (2) if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.
     
@@ -65,11 +129,20 @@ class SDMap(Algorithm):
     :param additional_parameters_for_the_quality_measure: if the quality measure passed by parameter needs more parameters apart from tp, fp, TP and FP to be computed, they need to be specified here.
     :param write_results_in_file: whether the results obtained will be written in a file. By default, False.
     :param file_path: if 'write_results_in_file' is True, path of the file in which the results will be written.
+    :param fp_tree_implementation: the implementation of the FPTree. Two values are possible: "nodes" (each node of the tree is a python object with a dictionary of children and the items are the selectors, see 'FPTreeForSDMap') and "arrays" (the nodes of the tree are stored in parallel arrays and the items are integer ids, see 'FPTreeWithArraysForSDMap', which needs much less memory and is faster to build on large datasets). Both implementations generate the same subgroups in the same order. By default, "nodes".
+    :param n_jobs: the number of worker processes in which the branches of the search space (i.e., one per item of the header table of the FPTree generated from the complete dataset) are searched. If -1, all the available processors are used. The results are always handled in the same order as in the sequential execution. By default, 1 (i.e., sequential execution).
+    :param max_depth: the maximum number of selectors in the description of a subgroup (i.e., the maximum depth of the search). The conditional FPTrees of the patterns with this number of selectors are not built. If None, the depth of the search is not limited. By default, None.
+    :param optimistic_estimate: an optimistic estimate of the quality measure which is used to prune the search space (or None, in order not to use it). If the optimistic estimate of a pattern is less than the minimum quality measure value threshold, its conditional FPTree is not built, since none of its refinements can reach that threshold. In the same way, when an FPTree is a single path, the combinations of a group with the same counters tp and fp (i.e., with the same most unfrequent selector) are not generated if the optimistic estimate of these counters is less than that threshold. The generated subgroups which reach the threshold are the same and are generated in the same order. By default, None.
+    :param additional_parameters_for_the_optimistic_estimate: if the optimistic estimate passed by parameter needs more parameters apart from tp, fp, TP and FP to be computed, they need to be specified here.
     """
     
-    __slots__ = ("_quality_measure", "_minimum_quality_measure_value", "_minimum_tp", "_minimum_fp", "_minimum_n", "_additional_parameters_for_the_quality_measure", "_unselected_subgroups", "_selected_subgroups", "_file_path", "_file")
+    FP_TREE_WITH_NODES : ClassVar[str] = "nodes"
+    FP_TREE_WITH_ARRAYS : ClassVar[str] = "arrays"
+    FP_TREE_IMPLEMENTATION : ClassVar[list[str]] = [FP_TREE_WITH_NODES, FP_TREE_WITH_ARRAYS]
+    
+    __slots__ = ("_quality_measure", "_minimum_quality_measure_value", "_minimum_tp", "_minimum_fp", "_minimum_n", "_additional_parameters_for_the_quality_measure", "_unselected_subgroups", "_selected_subgroups", "_file_path", "_file", "_fp_tree_implementation", "_n_jobs", "_max_depth", "_optimistic_estimate", "_additional_parameters_for_the_optimistic_estimate", "_pruned_subgroups")
     
-    def __init__(self, quality_measure : QualityMeasure, minimum_quality_measure_value : Union[int, float], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None, additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), write_results_in_file : bool = False, file_path : Union[str, None] = None) -> None:
+    def __init__(self, quality_measure : QualityMeasure, minimum_quality_measure_value : Union[int, float], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None, additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), write_results_in_file : bool = False, file_path : Union[str, None] = None, fp_tree_implementation : str = FP_TREE_WITH_NODES, n_jobs : int = 1, max_depth : Union[int, None] = None, optimistic_estimate : Union[QualityMeasure, None] = None, additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict()) -> None:
         if not isinstance(quality_measure, QualityMeasure):
             raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
         if (type(minimum_quality_measure_value) is not int) and (type(minimum_quality_measure_value) is not float):
@@ -86,6 +159,23 @@ class SDMap(Algorithm):
             raise TypeError("The type of the parameter 'write_results_in_file' must be 'bool'")
         if ((type(file_path) is not str) and (file_path is not None)):
             raise TypeError("The type of the parameter 'file_path' must be 'str' or 'NoneType'.")
+        if (fp_tree_implementation not in SDMap.FP_TREE_IMPLEMENTATION):
+            raise ValueError("The value of the parameter 'fp_tree_implementation' is not valid. See the documentation.")
+        if (type(n_jobs) is not int):
+            raise TypeError("The type of the parameter 'n_jobs' must be 'int'.")
+        if (n_jobs < 1) and (n_jobs != -1):
+            raise ValueError("The value of the parameter 'n_jobs' must be greater than 0 or -1.")
+        if (type(max_depth) is not int) and (max_depth is not None):
+            raise TypeError("The type of the parameter 'max_depth' must be 'int' or 'NoneType'.")
+        if (max_depth is not None) and (max_depth < 1):
+            raise ValueError("The value of the parameter 'max_depth' must be greater than 0.")
+        if (not isinstance(optimistic_estimate, QualityMeasure)) and (optimistic_estimate is not None):
+            raise TypeError("The parameter 'optimistic_estimate' must be an instance of a subclass of the 'QualityMeasure' class or 'NoneType'.")
+        if (type(additional_parameters_for_the_optimistic_estimate) is not dict):
+            raise TypeError("The type of the parameter 'additional_parameters_for_the_optimistic_estimate' must be 'dict'")
+        # We check whether 'optimistic_estimate' is an optimistic estimate of 'quality_measure'.
+        if (optimistic_estimate is not None) and (quality_measure.get_name() not in optimistic_estimate.optimistic_estimate_of()):
+            raise ValueError("The quality measure " + optimistic_estimate.get_name() + " is not an optimistic estimate of the quality measure " + quality_measure.get_name() + ".")
         # If 'write_results_in_file' is True, 'file_path' must not be None.
         if (write_results_in_file) and (file_path is None):
             raise ValueError("If the parameter 'write_results_in_file' is True, the parameter 'file_path' must not be None.")
@@ -106,6 +196,16 @@ class SDMap(Algorithm):
             else:
                 self._file_path = None
             self._file = None
+            self._fp_tree_implementation = fp_tree_implementation
+            if (n_jobs == -1):
+                self._n_jobs = cpu_count() or 1
+            else:
+                self._n_jobs = n_jobs
+            self._max_depth = max_depth
+            self._optimistic_estimate = optimistic_estimate
+            self._additional_parameters_for_the_optimistic_estimate = additional_parameters_for_the_optimistic_estimate.copy()
+            _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_optimistic_estimate)
+            self._pruned_subgroups = 0
         else:
             raise InconsistentMethodParametersError("If 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.")
     
@@ -127,12 +227,32 @@ class SDMap(Algorithm):
     def _get_additional_parameters_for_the_quality_measure(self) -> dict[str, Union[int, float]]:
         return self._additional_parameters_for_the_quality_measure
     
+    def _get_fp_tree_implementation(self) -> str:
+        return self._fp_tree_implementation
+    
+    def _get_n_jobs(self) -> int:
+        return self._n_jobs
+
+    def _get_max_depth(self) -> Union[int, None]:
+        return self._max_depth
+
+    def _get_optimistic_estimate(self) -> Union[QualityMeasure, None]:
+        return self._optimistic_estimate
+
+    def _get_additional_parameters_for_the_optimistic_estimate(self) -> dict[str, Union[int, float]]:
+        return self._additional_parameters_for_the_optimistic_estimate
+    
     quality_measure = property(_get_quality_measure, None, None, "The quality measure which is used.")
     minimum_quality_measure_value = property(_get_minimum_quality_measure_value, None, None, "The minimum quality measure value threshold.")
     minimum_tp = property(_get_minimum_tp, None, None, "The minimum true positives (tp) threshold.")
     minimum_fp = property(_get_minimum_fp, None, None, "The minimum false positives (fp) threshold.")
     minimum_n = property(_get_minimum_n, None, None, "The minimum subgroup description size (n) threshold.")
     additional_parameters_for_the_quality_measure = property(_get_additional_parameters_for_the_quality_measure, None, None, "The additional needed parameters with which to compute the quality measure.")
+    fp_tree_implementation = property(_get_fp_tree_implementation, None, None, "The implementation of the FPTree.")
+    n_jobs = property(_get_n_jobs, None, None, "The number of worker processes in which the branches of the search space are searched.")
+    max_depth = property(_get_max_depth, None, None, "The maximum number of selectors in the description of a subgroup (None if the depth of the search is not limited).")
+    optimistic_estimate = property(_get_optimistic_estimate, None, None, "The optimistic estimate of the quality measure which is used to prune the search space (None if it is not used).")
+    additional_parameters_for_the_optimistic_estimate = property(_get_additional_parameters_for_the_optimistic_estimate, None, None, "The additional needed parameters with which to compute the optimistic estimate.")
     
     def _get_unselected_subgroups(self) -> int:
         return self._unselected_subgroups
@@ -143,9 +263,13 @@ class SDMap(Algorithm):
     def _get_visited_nodes(self) -> int:
         return self._unselected_subgroups + self._selected_subgroups
 
+    def _get_pruned_subgroups(self) -> int:
+        return self._pruned_subgroups
+
     unselected_subgroups = property(_get_unselected_subgroups, None, None, "Number of unselected subgroups after executing the SDMap algorithm (before executing the 'fit' method, this attribute is 0).")
     selected_subgroups = property(_get_selected_subgroups, None, None, "Number of selected subgroups after executing the SDMap algorithm (before executing the 'fit' method, this attribute is 0).")
     visited_nodes = property(_get_visited_nodes, None, None, "Number of visited nodes after executing the SDMap algorithm (before executing the 'fit' method, this attribute is 0).")
+    pruned_subgroups = property(_get_pruned_subgroups, None, None, "Number of subgroups whose conditional FPTree has not been built (or which have not been generated from a single path) because of the optimistic estimate after executing the SDMap algorithm (before executing the 'fit' method, this attribute is 0).")
 
     def _handle_individual_result(self, individual_result : tuple[Pattern, tuple[str, str], int, int, int, int]) -> None:
         """Private method to handle each individual result generated by the SDMap algorithm.
@@ -182,63 +306,91 @@ class SDMap(Algorithm):
         else: # If the quality measure is not greater or equal, increment the number of unselected subgroups.
             self._unselected_subgroups = self._unselected_subgroups + 1
     
-    def _fpgrowth(self, fptree : FPTreeForSDMap, alpha : Union[list[Selector], None], target : tuple[str, str], TP : int, FP : int) -> None:
+    def _fpgrowth(self, fptree : Union[FPTreeForSDMap, FPTreeWithArraysForSDMap], alpha : Union[list[Selector], list[int], None], target : tuple[str, str], TP : int, FP : int) -> None:
         """Private method to run the adapted FPGrowth algorithm in order to generate frequent patterns.
         
-        :param fptree: the current FPTree. At the beginning, it is the FPTreeForSDMap generated from the complete dataset. Although, it will change between recursive calls to this method.
-        :param alpha: a list of selectors (or None, in the first call to this method).
+        :param fptree: the current FPTree. At the beginning, it is the FPTreeForSDMap (or the FPTreeWithArraysForSDMap) generated from the complete dataset. Although, it will change between recursive calls to this method.
+        :param alpha: a list of items of the FPTree, i.e., selectors or integer item ids depending on the implementation of the FPTree (or None, in the first call to this method).
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
         :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
         """
         # Check if fptree contains a single path.
         if fptree.there_is_a_single_path():
-            # Generate all the combinations of the selectors in the single path.
-            all_combinations = _generate_all_combinations(fptree._sorted_header_table)
-            # Remove the empty list.
-            all_combinations.remove([])
-            # Iterate throughout the combinations.
-            for beta in all_combinations:
-                # Generate the patter 'beta U alpha'.
-                # IMPORTANT: in this case, we can use the class Pattern for the frequent patterns because each frequent pattern will be the description of a final subgroup.
-                if alpha:
-                    pattern = Pattern(beta + alpha)
-                else:
-                    pattern = Pattern(beta)
-                # The values of the counters tp and fp of 'pattern' will be those of the selector in beta with the less values of the counters tp and fp in the fptree (in the header table of the fptree).
-                most_unfrequent_selector = None
-                index = 0
-                # IMPORTANT: this is not an infinite loop because ALL the selectors in beta are always also in the header table (because all the combinations had generated from the header table).
-                while (most_unfrequent_selector is None):
-                    if (fptree._sorted_header_table[index] in beta): # This comparison has been extracted from the SDMap implementation in Vikamine.
-                        most_unfrequent_selector = fptree._sorted_header_table[index]
-                    index = index + 1
+            # IMPORTANT: in a single path, the values of the counters tp and fp of a combination are those of its most unfrequent selector (i.e., its first selector in the sorted header table of the fptree). For this reason, the combinations are lazily generated grouped by their most unfrequent selector (from the most frequent one to the less frequent one, i.e., in the same order as the enumeration of all the combinations of the sorted header table).
+            sorted_header_table = fptree._sorted_header_table
+            # The combinations are joined with 'alpha', so their number of selectors is limited by the maximum depth minus the number of selectors in 'alpha'.
+            if (self._max_depth is None):
+                maximum_size = None
+            elif alpha:
+                maximum_size = self._max_depth - len(alpha)
+            else:
+                maximum_size = self._max_depth
+            for index in range(len(sorted_header_table)-1, -1, -1):
+                most_unfrequent_selector = sorted_header_table[index]
                 tp = fptree.header_table[most_unfrequent_selector][0][0]
                 fp = fptree.header_table[most_unfrequent_selector][0][1]
-                # Handle this result.
-                self._handle_individual_result( (pattern, target, tp, fp, TP, FP) )
+                # All the combinations of this group have the same counters, so their quality measure values are less than or equal to the optimistic estimate of these counters. If it is less than the minimum quality measure value threshold, none of them can reach that threshold and they are pruned without generating them.
+                if (self._optimistic_estimate is not None):
+                    dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+                    dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
+                    if (self._optimistic_estimate.compute(dict_of_parameters) < self._minimum_quality_measure_value):
+                        self._pruned_subgroups = self._pruned_subgroups + _number_of_combinations(len(sorted_header_table) - 1 - index, maximum_size)
+                        continue
+                # Iterate throughout the combinations.
+                for beta in _generate_combinations(sorted_header_table, index, maximum_size):
+                    # Generate the patter 'beta U alpha'.
+                    # IMPORTANT: in this case, we can use the class Pattern for the frequent patterns because each frequent pattern will be the description of a final subgroup.
+                    if alpha:
+                        pattern = Pattern(fptree.get_selectors(beta + alpha))
+                    else:
+                        pattern = Pattern(fptree.get_selectors(beta))
+                    # Handle this result.
+                    self._handle_individual_result( (pattern, target, tp, fp, TP, FP) )
         else:
             # Iterate throughout the selectors in the sorted header table of the fptree.
             for ai in fptree._sorted_header_table:
-                # Generate the pattern 'beta = ai U a'.
-                #  -> As list in order to build the conditional FPTree and as Pattern in order to add it to the final result.
-                # IMPORTANT: in this case, we can use the class Pattern for the frequent patterns because each frequent pattern will be the description of a final subgroup.
-                if alpha:
-                    beta_as_list = [ai] + alpha
-                    beta_as_Pattern = Pattern(beta_as_list)
-                else:
-                    beta_as_list = [ai]
-                    beta_as_Pattern = Pattern(beta_as_list)
-                # The values of the counters tp and fp of 'beta' will be those of the selector ai in the header table.
-                tp = fptree.header_table[ai][0][0]
-                fp = fptree.header_table[ai][0][1]
-                # Handle this result.
-                self._handle_individual_result( (beta_as_Pattern, target, tp, fp, TP, FP) )
-                # Build the conditional FPTree.
-                conditional_fp_tree = fptree.generate_conditional_fp_tree(beta_as_list, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n)
-                # Recursive call.
-                if not conditional_fp_tree.is_empty():
-                    self._fpgrowth(conditional_fp_tree, beta_as_list, target, TP, FP)
+                self._fpgrowth_branch(fptree, ai, alpha, target, TP, FP)
+    
+    def _fpgrowth_branch(self, fptree : Union[FPTreeForSDMap, FPTreeWithArraysForSDMap], ai : Union[Selector, int], alpha : Union[list[Selector], list[int], None], target : tuple[str, str], TP : int, FP : int) -> None:
+        """Private method to run the adapted FPGrowth algorithm from the pattern 'beta = ai U alpha' (i.e., to handle it and to search its conditional FPTree), where ai is an item of the header table of the current FPTree.
+        
+        :param fptree: the current FPTree.
+        :param ai: the item of the header table of the current FPTree.
+        :param alpha: a list of items of the FPTree, i.e., selectors or integer item ids depending on the implementation of the FPTree (or None, in the first call to the method '_fpgrowth').
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
+        :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
+        """
+        # Generate the pattern 'beta = ai U a'.
+        #  -> As list in order to build the conditional FPTree and as Pattern in order to add it to the final result.
+        # IMPORTANT: in this case, we can use the class Pattern for the frequent patterns because each frequent pattern will be the description of a final subgroup.
+        if alpha:
+            beta_as_list = [ai] + alpha
+            beta_as_Pattern = Pattern(fptree.get_selectors(beta_as_list))
+        else:
+            beta_as_list = [ai]
+            beta_as_Pattern = Pattern(fptree.get_selectors(beta_as_list))
+        # The values of the counters tp and fp of 'beta' will be those of the selector ai in the header table.
+        tp = fptree.header_table[ai][0][0]
+        fp = fptree.header_table[ai][0][1]
+        # Handle this result.
+        self._handle_individual_result( (beta_as_Pattern, target, tp, fp, TP, FP) )
+        # The refinements of 'beta' are not generated if it already has the maximum number of selectors.
+        if (self._max_depth is not None) and (len(beta_as_list) >= self._max_depth):
+            return
+        # If the optimistic estimate of 'beta' is less than the minimum quality measure value threshold, none of its refinements can reach that threshold (because their counters tp and fp are less than or equal to those of 'beta'), so the conditional FPTree is not built.
+        if (self._optimistic_estimate is not None):
+            dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+            dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
+            if (self._optimistic_estimate.compute(dict_of_parameters) < self._minimum_quality_measure_value):
+                self._pruned_subgroups = self._pruned_subgroups + 1
+                return
+        # Build the conditional FPTree.
+        conditional_fp_tree = fptree.generate_conditional_fp_tree(beta_as_list, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n)
+        # Recursive call.
+        if not conditional_fp_tree.is_empty():
+            self._fpgrowth(conditional_fp_tree, beta_as_list, target, TP, FP)
     
     def fit(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
         """Main method to run the SDMap algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
@@ -254,8 +406,11 @@ class SDMap(Algorithm):
         for column in pandas_dataframe.columns:
             if not is_string_dtype(pandas_dataframe[column]):
                 raise DatasetAttributeTypeError("Error in attribute '" + str(column) + "'. This algorithm only supports nominal attributes (i.e., type 'str').")
-        # Create an empty FPTreeForSDMap.
-        fptree = FPTreeForSDMap()
+        # Create an empty FPTreeForSDMap (or FPTreeWithArraysForSDMap).
+        if (self._fp_tree_implementation == SDMap.FP_TREE_WITH_ARRAYS):
+            fptree = FPTreeWithArraysForSDMap()
+        else:
+            fptree = FPTreeForSDMap()
         # Generate the set of frequent selectors.
         set_of_frequent_selectors = fptree.generate_set_of_frequent_selectors(pandas_dataframe, target, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n)
         # Build the FPTree.
@@ -268,7 +423,20 @@ class SDMap(Algorithm):
             # Call to the adapated FPGrowth algorithm in order to obtain frequent patterns. In this point, we also open and close the file.
             if (self._file_path is not None):
                 self._file = open(self._file_path, "w")
-            self._fpgrowth(fptree, None, target, TP, FP)
+            if (self._n_jobs == 1) or fptree.there_is_a_single_path() or (len(fptree._sorted_header_table) < 2):
+                self._fpgrowth(fptree, None, target, TP, FP)
+            else:
+                # Each branch (i.e., each item of the sorted header table) is searched in a worker process (the FPTree is only read there). The configuration is sent without the file, because the results are written by this process.
+                sdmap_for_workers = copy(self)
+                sdmap_for_workers._file = None
+                with ProcessPoolExecutor(max_workers=self._n_jobs, initializer=_initialize_worker, initargs=(sdmap_for_workers, fptree, target, TP, FP)) as executor:
+                    # IMPORTANT: the 'map' method returns the results in the same order as the branches (as soon as each one of them is available), so the final results are merged deterministically.
+                    for written_results, selected_subgroups, unselected_subgroups, pruned_subgroups in executor.map(_fpgrowth_branch_in_worker, fptree._sorted_header_table):
+                        if (self._file_path is not None):
+                            self._file.write(written_results)
+                        self._selected_subgroups = self._selected_subgroups + selected_subgroups
+                        self._unselected_subgroups = self._unselected_subgroups + unselected_subgroups
+                        self._pruned_subgroups = self._pruned_subgroups + pruned_subgroups
             if (self._file_path is not None):
                 self._file.close()
                 self._file = None
@@ -10,26 +10,56 @@ from pandas import DataFrame
 from pandas.api.types import is_string_dtype
 from subgroups.algorithms.algorithm import Algorithm
 from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.piatetsky_shapiro import PiatetskyShapiro
 from subgroups.exceptions import InconsistentMethodParametersError, DatasetAttributeTypeError
 from subgroups.data_structures.fp_tree_for_sdmapstar import FPTreeForSDMapStar
+from subgroups.data_structures.fp_tree_with_arrays_for_sdmapstar import FPTreeWithArraysForSDMapStar
 from subgroups.core.pattern import Pattern
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from subgroups.core.subgroup import Subgroup
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Value
+from multiprocessing.sharedctypes import Synchronized
+from copy import copy
+from io import StringIO
+from os import cpu_count
+from math import comb, floor
 
 # Python annotations.
-from typing import Union
+from typing import Union, ClassVar
 
-def _generate_all_combinations(list_of_selectors : list[Selector]):
-    """Private method to generate all the combinations (including the empty list) of the list of selectors passed by parameter.
+def _generate_combinations(list_of_selectors : list, index : int, maximum_size : Union[int, None] = None):
+    """Private generator which lazily yields all the combinations of the list of selectors passed by parameter whose first selector is the one in the position 'index' (i.e., the combinations of list_of_selectors[index:] containing list_of_selectors[index]).
     
-    :param list_of_selectors: the list of selectors which is used.
-    :return: all combinations (including the empty list) of the list of selectors passed by parameter.
+    :param list_of_selectors: the list of selectors which is used. It could be a list of selectors or a list of integer item ids depending on the implementation of the FPTree.
+    :param index: the position of the first selector of all the generated combinations.
+    :param maximum_size: the maximum number of selectors of the generated combinations (or None, in order not to limit it). By default, None.
+    :return: a generator of the combinations.
     """
-    if list_of_selectors == []:
-        return [[]]
-    x = _generate_all_combinations(list_of_selectors[1:])
-    return x + [[list_of_selectors[0]] + y for y in x]
+    first_selector = [list_of_selectors[index]]
+    yield first_selector
+    # The combinations with only one selector are not extended.
+    if (maximum_size is not None) and (maximum_size < 2):
+        return
+    next_maximum_size = None if (maximum_size is None) else (maximum_size - 1)
+    # The combinations are generated in the same order as the recursive enumeration of all the combinations of the list (from the last selector to the first one).
+    for next_index in range(len(list_of_selectors)-1, index, -1):
+        for combination in _generate_combinations(list_of_selectors, next_index, next_maximum_size):
+            yield first_selector + combination
+
+def _number_of_combinations(number_of_selectors : int, maximum_size : Union[int, None]) -> int:
+    """Private method to compute the number of combinations generated by the method '_generate_combinations' from a selector followed by 'number_of_selectors' selectors.
+    
+    :param number_of_selectors: the number of selectors after the first selector of the combinations.
+    :param maximum_size: the maximum number of selectors of the combinations (or None, if it is not limited).
+    :return: the number of combinations.
+    """
+    if (maximum_size is None) or (maximum_size > number_of_selectors):
+        return 2 ** number_of_selectors
+    # The first selector along with up to 'maximum_size - 1' of the other selectors.
+    return sum(comb(number_of_selectors, size) for size in range(maximum_size))
 
 def _delete_subgroup_parameters_from_a_dictionary(dict_of_parameters : dict[str, Union[int, float]]):
     """Private method to delete the subgroup parameters (i.e., tp, fp, TP and FP) from a dictionary of parameters. IMPORTANT: this method modifies the parameter, does not return a new dictionary.
@@ -53,8 +83,47 @@ def _delete_subgroup_parameters_from_a_dictionary(dict_of_parameters : dict[str,
     except KeyError:
         pass
 
+# State shared by all the branches searched in a worker process (see the 'n_jobs' parameter of the SDMapStar algorithm). It is set only once per worker process by means of the function '_initialize_worker'.
+_worker_state = None
+
+def _initialize_worker(sdmap : 'SDMapStar', fptree : Union[FPTreeForSDMapStar, FPTreeWithArraysForSDMapStar], target : tuple[str, str], TP : int, FP : int, shared_k_subgroups_threshold : Union[Synchronized, None]) -> None:
+    """Private method to initialize a worker process of the SDMapStar algorithm. IMPORTANT: the FPTree is only read in the worker process.
+    
+    :param sdmap: the SDMapStar instance (without an open file) whose configuration is used in the worker process.
+    :param fptree: the FPTree generated from the complete dataset.
+    :param target: a tuple with 2 elements: the target attribute name and the target value.
+    :param TP: the true population of the dataset.
+    :param FP: the false population of the dataset.
+    :param shared_k_subgroups_threshold: the shared-memory value with the quality measure value of the worst of the best k subgroups found so far by all the worker processes (or None, if 'num_subgroups' is 0).
+    """
+    global _worker_state
+    sdmap._shared_k_subgroups_threshold = shared_k_subgroups_threshold
+    _worker_state = (sdmap, fptree, target, TP, FP)
+
+def _fpgrowth_branch_in_worker(ai : Union[Selector, int]) -> tuple[str, int, int, int, int, list[float]]:
+    """Private method to search, in a worker process, the branch of the SDMapStar algorithm which starts with the item ai of the header table of the FPTree generated from the complete dataset.
+    
+    :param ai: the item of the header table from which the branch starts.
+    :return: a tuple with 6 elements: (1) the results written by the branch (empty str if the results are not written in a file), (2) the number of selected subgroups in the branch, (3) the number of unselected subgroups in the branch, (4) the number of pruned subgroups in the branch, (5) the number of pruned conditional items in the branch and (6) the quality measure values of the best k subgroups found in the branch.
+    """
+    sdmap, fptree, target, TP, FP = _worker_state
+    sdmap._selected_subgroups = 0
+    sdmap._unselected_subgroups = 0
+    sdmap._pruned_subgroups = 0
+    sdmap._conditional_pruned_branches = 0
+    sdmap._k_subgroups = []
+    # The results of the branch are written in memory and are returned to the main process, which writes them in the final file in a deterministic order.
+    if (sdmap._file_path is not None):
+        sdmap._file = StringIO()
+    sdmap._fpgrowth_branch(fptree, ai, None, target, TP, FP)
+    written_results = ""
+    if (sdmap._file_path is not None):
+        written_results = sdmap._file.getvalue()
+        sdmap._file = None
+    return (written_results, sdmap._selected_subgroups, sdmap._unselected_subgroups, sdmap._pruned_subgroups, sdmap._conditional_pruned_branches, sdmap._k_subgroups)
+
 class SDMapStar(Algorithm):
-    """This class represents the SDMapStar algorithm.
+    """This class represents the SDMapStar algorithm. IMPORTANT: the optimistic estimate pruning of the conditional FPTrees is applied to the items of each conditional FPTree (i.e., an item whose optimistic estimate, computed with its counters in the conditional FPTree, is less than the quality measure value of the worst subgroup in k subgroups is removed from it) and not to the nodes of the horizontal list from which the conditional FPTree is built (removing one of these nodes decreased the counters of the remaining items, so some subgroups were missed). Therefore, the counter 'conditional_pruned_branches' is now the number of pruned conditional items, and the selected and unselected subgroups of a sequential execution might be different from those of previous versions (the best k quality measure values are now always exact).
 
     :param quality_measure: the quality measure which is used.
     :param optimistic_estimate: the optimistic estimate of the quality measure which is used.
@@ -66,11 +135,18 @@ class SDMapStar(Algorithm):
     :param write_results_in_file: whether the results obtained will be written in a file. By default, False.
     :param file_path: if 'write_results_in_file' is True, path of the file in which the results will be written.
     :param num_subgroups: the number of subgroups used to prune the search space. By default, 0. This value is equivalent to using the SDMap algorithm.
+    :param fp_tree_implementation: the implementation of the FPTree. Two values are possible: "nodes" (each node of the tree is a python object with a dictionary of children and the items are the selectors, see 'FPTreeForSDMapStar') and "arrays" (the nodes of the tree are stored in parallel arrays and the items are integer ids, see 'FPTreeWithArraysForSDMapStar', which needs much less memory and is faster to build on large datasets). Both implementations generate the same subgroups in the same order. By default, "nodes".
+    :param n_jobs: the number of worker processes in which the branches of the search space (i.e., one per item of the header table of the FPTree generated from the complete dataset) are searched. If -1, all the available processors are used. The results are always handled in the same order as in the sequential execution. If 'num_subgroups' is greater than 0, the worker processes share the quality measure value of the worst of the best k subgroups found so far, so the pruning depends on the order in which the branches are searched (and the subgroups and the counters might be different from those of the sequential execution). However, the best k quality measure values are the same, because a subgroup is only pruned when k subgroups is full and its optimistic estimate is less than the quality measure value of the worst subgroup in k subgroups. By default, 1 (i.e., sequential execution).
+    :param max_depth: the maximum number of selectors in the description of a subgroup (i.e., the maximum depth of the search). The conditional FPTrees of the patterns with this number of selectors are not built. If None, the depth of the search is not limited. By default, None.
     """
 
-    __slots__ = ("_quality_measure", "_optimistic_estimate" , "_minimum_quality_measure_value", "_minimum_tp", "_minimum_fp", "_minimum_n", "_additional_parameters_for_the_quality_measure", "_unselected_subgroups", "_selected_subgroups", "_file_path", "_file", "_num_subgroups","_additional_parameters_for_the_optimistic_estimate","_k_subgroups","_pruned_subgroups","_conditional_pruned_branches")
+    FP_TREE_WITH_NODES : ClassVar[str] = "nodes"
+    FP_TREE_WITH_ARRAYS : ClassVar[str] = "arrays"
+    FP_TREE_IMPLEMENTATION : ClassVar[list[str]] = [FP_TREE_WITH_NODES, FP_TREE_WITH_ARRAYS]
+
+    __slots__ = ("_quality_measure", "_optimistic_estimate" , "_minimum_quality_measure_value", "_minimum_tp", "_minimum_fp", "_minimum_n", "_additional_parameters_for_the_quality_measure", "_unselected_subgroups", "_selected_subgroups", "_file_path", "_file", "_num_subgroups","_additional_parameters_for_the_optimistic_estimate","_k_subgroups","_pruned_subgroups","_conditional_pruned_branches", "_fp_tree_implementation", "_n_jobs", "_max_depth", "_shared_k_subgroups_threshold")
 
-    def __init__(self, quality_measure : QualityMeasure, optimistic_estimate: QualityMeasure, minimum_quality_measure_value : Union[int, float], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None, additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), write_results_in_file : bool = False, file_path : Union[str, None] = None, num_subgroups : int = 0) -> None:
+    def __init__(self, quality_measure : QualityMeasure, optimistic_estimate: QualityMeasure, minimum_quality_measure_value : Union[int, float], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None, additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), write_results_in_file : bool = False, file_path : Union[str, None] = None, num_subgroups : int = 0, fp_tree_implementation : str = FP_TREE_WITH_NODES, n_jobs : int = 1, max_depth : Union[int, None] = None) -> None:
         if not isinstance(quality_measure, QualityMeasure):
             raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
         if (type(minimum_quality_measure_value) is not int) and (type(minimum_quality_measure_value) is not float):
@@ -89,6 +165,16 @@ class SDMapStar(Algorithm):
             raise TypeError("The type of the parameter 'num_subgroups' must be 'int'")
         if ((type(file_path) is not str) and (file_path is not None)):
             raise TypeError("The type of the parameter 'file_path' must be 'str' or 'NoneType'.")
+        if (fp_tree_implementation not in SDMapStar.FP_TREE_IMPLEMENTATION):
+            raise ValueError("The value of the parameter 'fp_tree_implementation' is not valid. See the documentation.")
+        if (type(n_jobs) is not int):
+            raise TypeError("The type of the parameter 'n_jobs' must be 'int'.")
+        if (n_jobs < 1) and (n_jobs != -1):
+            raise ValueError("The value of the parameter 'n_jobs' must be greater than 0 or -1.")
+        if (type(max_depth) is not int) and (max_depth is not None):
+            raise TypeError("The type of the parameter 'max_depth' must be 'int' or 'NoneType'.")
+        if (max_depth is not None) and (max_depth < 1):
+            raise ValueError("The value of the parameter 'max_depth' must be greater than 0.")
         # If 'write_results_in_file' is True, 'file_path' must not be None.
         if (write_results_in_file) and (file_path is None):
             raise ValueError("If the parameter 'write_results_in_file' is True, the parameter 'file_path' must not be None.")
@@ -120,8 +206,16 @@ class SDMapStar(Algorithm):
             #quality measure of the best k subgroups. This list is sorted in ascending order.
             self._k_subgroups = []
             self._pruned_subgroups = 0
-            #pruned branches when building conditional fptrees
+            #pruned conditional items when building conditional fptrees
             self._conditional_pruned_branches = 0
+            self._fp_tree_implementation = fp_tree_implementation
+            if (n_jobs == -1):
+                self._n_jobs = cpu_count() or 1
+            else:
+                self._n_jobs = n_jobs
+            self._max_depth = max_depth
+            # Shared-memory value with the quality measure value of the worst of the best k subgroups found so far by all the worker processes (only in a worker process and if 'num_subgroups' is greater than 0).
+            self._shared_k_subgroups_threshold = None
         else:
             raise InconsistentMethodParametersError("If 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.")
 
@@ -158,6 +252,15 @@ class SDMapStar(Algorithm):
     def _get_conditional_pruned_branches(self) -> int:
         return self._conditional_pruned_branches
 
+    def _get_fp_tree_implementation(self) -> str:
+        return self._fp_tree_implementation
+
+    def _get_n_jobs(self) -> int:
+        return self._n_jobs
+
+    def _get_max_depth(self) -> Union[int, None]:
+        return self._max_depth
+
     quality_measure = property(_get_quality_measure, None, None, "The quality measure which is used.")
     optimistic_estimate = property(_get_optimistic_estimate, None, None, "The optimistic estimate of the quality measure which is used.")
     minimum_quality_measure_value = property(_get_minimum_quality_measure_value, None, None, "The minimum quality measure value threshold.")
@@ -168,7 +271,10 @@ class SDMapStar(Algorithm):
     k_subgroups = property(_get_k_subgroups, None, None, "The list of the k subgroups used to prune.")
     num_subgroups = property(_get_num_subgroups, None, None, "The maximum number of subgroups in 'k_subgroups'.")
     pruned_subgroups = property(_get_pruned_subgroups, None, None, "The number of pruned subgroups because of the top k threshold.")
-    conditional_pruned_branches = property(_get_conditional_pruned_branches, None, None, "The number of conditional pruned branches.")
+    conditional_pruned_branches = property(_get_conditional_pruned_branches, None, None, "The number of pruned conditional items (i.e., the items removed from the conditional FPTrees because their optimistic estimate is less than the quality measure value of the worst subgroup in k subgroups).")
+    fp_tree_implementation = property(_get_fp_tree_implementation, None, None, "The implementation of the FPTree.")
+    n_jobs = property(_get_n_jobs, None, None, "The number of worker processes in which the branches of the search space are searched.")
+    max_depth = property(_get_max_depth, None, None, "The maximum number of selectors in the description of a subgroup (None if the depth of the search is not limited).")
 
     def _get_unselected_subgroups(self) -> int:
         return self._unselected_subgroups
@@ -218,110 +324,171 @@ class SDMapStar(Algorithm):
         else: # If the quality measure is not greater or equal, increment the number of unselected subgroups.
             self._unselected_subgroups = self._unselected_subgroups + 1
     
-    def _fpgrowth(self, fptree : FPTreeForSDMapStar, alpha : Union[list[Selector], None], target : tuple[str, str], TP : int, FP : int) -> None:
+    def _fpgrowth(self, fptree : Union[FPTreeForSDMapStar, FPTreeWithArraysForSDMapStar], alpha : Union[list[Selector], list[int], None], target : tuple[str, str], TP : int, FP : int) -> None:
         """Private method to run the adapted FPGrowth algorithm in order to generate frequent patterns.
         
-        :param fptree: the current FPTree. At the beginning, it is the FPTreeForSDMapStar generated from the complete dataset. Although, it will change between recursive calls to this method.
-        :param alpha: a list of selectors (or None, in the first call to this method).
+        :param fptree: the current FPTree. At the beginning, it is the FPTreeForSDMapStar (or the FPTreeWithArraysForSDMapStar) generated from the complete dataset. Although, it will change between recursive calls to this method.
+        :param alpha: a list of items of the FPTree, i.e., selectors or integer item ids depending on the implementation of the FPTree (or None, in the first call to this method).
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
         :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
         """
         # Check if fptree contains a single path.
         if fptree.there_is_a_single_path():
-            # Generate all the combinations of the selectors in the single path.
-            all_combinations = _generate_all_combinations(fptree._sorted_header_table)
-            # Remove the empty list.
-            all_combinations.remove([])
-            # Iterate throughout the combinations.
-            for beta in all_combinations:
-                # Generate the patter 'beta U alpha'.
-                # IMPORTANT: in this case, we can use the class Pattern for the frequent patterns because each frequent pattern will be the description of a final subgroup.
-                if alpha:
-                    pattern = Pattern(beta + alpha)
-                else:
-                    pattern = Pattern(beta)
-                # The values of the counters tp and fp of 'pattern' will be those of the selector in beta with the less values of the counters tp and fp in the fptree (in the header table of the fptree).
-                most_unfrequent_selector = None
-                index = 0
-                # IMPORTANT: this is not an infinite loop because ALL the selectors in beta are always also in the header table (because all the combinations had generated from the header table).
-                while (most_unfrequent_selector is None):
-                    if (fptree._sorted_header_table[index] in beta): # This comparison has been extracted from the SDMap implementation in Vikamine.
-                        most_unfrequent_selector = fptree._sorted_header_table[index]
-                    index = index + 1
+            # IMPORTANT: in a single path, the values of the counters tp and fp of a combination are those of its most unfrequent selector (i.e., its first selector in the sorted header table of the fptree). For this reason, the combinations are lazily generated grouped by their most unfrequent selector (from the most frequent one to the less frequent one, i.e., in the same order as the enumeration of all the combinations of the sorted header table).
+            sorted_header_table = fptree._sorted_header_table
+            # The combinations are joined with 'alpha', so their number of selectors is limited by the maximum depth minus the number of selectors in 'alpha'.
+            if (self._max_depth is None):
+                maximum_size = None
+            elif alpha:
+                maximum_size = self._max_depth - len(alpha)
+            else:
+                maximum_size = self._max_depth
+            for index in range(len(sorted_header_table)-1, -1, -1):
+                most_unfrequent_selector = sorted_header_table[index]
                 tp = fptree.header_table[most_unfrequent_selector][0][0]
                 fp = fptree.header_table[most_unfrequent_selector][0][1]
                 #If num_subgroups = 0, we do not use the SDMapStar optimizations.
                 if (self.num_subgroups > 0):
-                    #update the K subgroups
-                    self._updateKSubgroups(tp,fp,TP,FP)
-                    # if k subgroups treshold is higher than the optimistic estimate, we omit the conditional tree
+                    # All the combinations of this group have the same counters, so they also have the same optimistic estimate.
                     dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
                     dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
                     oe = self._optimistic_estimate.compute(dict_of_parameters)
-                    #k_subgroups is sorted, so the first element is the worst subgroup
-                    if (self.k_subgroups[0] > oe):
-                        self._pruned_subgroups += 1
-                        continue
-                # Handle this result.
-                self._handle_individual_result( (pattern, target, tp, fp, TP, FP) )
+                # Iterate throughout the combinations.
+                number_of_generated_combinations = 0
+                for beta in _generate_combinations(sorted_header_table, index, maximum_size):
+                    number_of_generated_combinations = number_of_generated_combinations + 1
+                    #If num_subgroups = 0, we do not use the SDMapStar optimizations.
+                    if (self.num_subgroups > 0):
+                        #update the K subgroups
+                        self._updateKSubgroups(tp,fp,TP,FP)
+                        # if k subgroups treshold is higher than the optimistic estimate, we omit the conditional tree
+                        #k_subgroups is sorted, so the first element is the worst subgroup
+                        if (self._get_k_subgroups_threshold() > oe):
+                            self._pruned_subgroups += 1
+                            # If the list of k subgroups is full and its worst subgroup is better than the optimistic estimate, the remaining combinations of this group can neither enter in that list nor beat the threshold (which never decreases), so all of them are pruned without generating them.
+                            if (len(self._k_subgroups) == self.num_subgroups) and (self._k_subgroups[0] > oe):
+                                self._pruned_subgroups += _number_of_combinations(len(sorted_header_table) - 1 - index, maximum_size) - number_of_generated_combinations
+                                break
+                            continue
+                    # Generate the patter 'beta U alpha'.
+                    # IMPORTANT: in this case, we can use the class Pattern for the frequent patterns because each frequent pattern will be the description of a final subgroup.
+                    if alpha:
+                        pattern = Pattern(fptree.get_selectors(beta + alpha))
+                    else:
+                        pattern = Pattern(fptree.get_selectors(beta))
+                    # Handle this result.
+                    self._handle_individual_result( (pattern, target, tp, fp, TP, FP) )
         else:
             sorted_selectors = []
             if (self.num_subgroups > 0):
                 # SDMapStar optimization: sort the selectors to select the most promising first using the optimistic estimate
-                for selector in fptree.header_table:
+                items_of_the_header_table = list(fptree.header_table)
+                for item, selector in zip(items_of_the_header_table, fptree.get_selectors(items_of_the_header_table)):
                     #calculate the optimistic estimate
-                    tp = fptree.header_table[selector][0][0]
-                    fp = fptree.header_table[selector][0][1]
+                    tp = fptree.header_table[item][0][0]
+                    fp = fptree.header_table[item][0][1]
                     dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
                     dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
                     oe = self._optimistic_estimate.compute(dict_of_parameters)
-                    #We store the optimistic estimate and the selector together to sort them
-                    sorted_selectors.append((oe,selector))
+                    #We store the optimistic estimate, the selector and the item together to sort them (in case of tie, the selectors are compared, and not the items)
+                    sorted_selectors.append((oe,selector,item))
                 # sort the selector by their optimistic estimate
-                optimistics_estimates, sorted_selectors = zip(*sorted(sorted_selectors,reverse=True))
+                optimistics_estimates, _, sorted_selectors = zip(*sorted(sorted_selectors,reverse=True))
             else:
                 #If num_subgroups = 0, we do not use the SDMapStar optimizations.
                 sorted_selectors = fptree.header_table
             # Iterate throughout the selectors in the sorted header table of the fptree.
             for ai in sorted_selectors:
-                # Generate the pattern 'beta = ai U a'.
-                #  -> As list in order to build the conditional FPTree and as Pattern in order to add it to the final result.
-                # IMPORTANT: in this case, we can use the class Pattern for the frequent patterns because each frequent pattern will be the description of a final subgroup.
-                if alpha:
-                    beta_as_list = [ai] + alpha
-                    beta_as_Pattern = Pattern(beta_as_list)
-                else:
-                    beta_as_list = [ai]
-                    beta_as_Pattern = Pattern(beta_as_list)
-                if (self.num_subgroups > 0):
-                    aux = fptree.header_table[ai][0]
-                    #update k subgroups (tp,fp)
-                    self._updateKSubgroups(aux[0],aux[1],TP,FP)
-                    # if k subgroups threshold is higher than the optimistic estimate, we omit the conditional tree
-                    dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : aux[0], QualityMeasure.FALSE_POSITIVES : aux[1], QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                    dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                    oe = self._optimistic_estimate.compute(dict_of_parameters)
-                    #k_subgroups is sorted, so the first element is the worst subgroup
-                    if (self.k_subgroups[0] > oe):
-                        self._pruned_subgroups += 1
-                        continue
-                # The values of the counters tp and fp of 'beta' will be those of the selector ai in the header table.
-                tp = fptree.header_table[ai][0][0]
-                fp = fptree.header_table[ai][0][1]
-                # Handle this result.
-                self._handle_individual_result( (beta_as_Pattern, target, tp, fp, TP, FP) )
-                # Build the conditional FPTree.
-                if (self.num_subgroups > 0):
-                    # Call conditionalFPTree with prune
-                    conditional_fptree, pruned_branches = fptree.generate_conditional_fp_tree_star(beta_as_list, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n,min_optimistic_estimate =  self.k_subgroups[0], optimistic_estimate = self._optimistic_estimate, additional_parameters=self._additional_parameters_for_the_optimistic_estimate)
-                    self._conditional_pruned_branches += pruned_branches
+                self._fpgrowth_branch(fptree, ai, alpha, target, TP, FP)
+
+    def _fpgrowth_branch(self, fptree : Union[FPTreeForSDMapStar, FPTreeWithArraysForSDMapStar], ai : Union[Selector, int], alpha : Union[list[Selector], list[int], None], target : tuple[str, str], TP : int, FP : int) -> None:
+        """Private method to run the adapted FPGrowth algorithm from the pattern 'beta = ai U alpha' (i.e., to handle it and to search its conditional FPTree), where ai is an item of the header table of the current FPTree.
+        
+        :param fptree: the current FPTree.
+        :param ai: the item of the header table of the current FPTree.
+        :param alpha: a list of items of the FPTree, i.e., selectors or integer item ids depending on the implementation of the FPTree (or None, in the first call to the method '_fpgrowth').
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
+        :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
+        """
+        # Generate the pattern 'beta = ai U a'.
+        #  -> As list in order to build the conditional FPTree and as Pattern in order to add it to the final result.
+        # IMPORTANT: in this case, we can use the class Pattern for the frequent patterns because each frequent pattern will be the description of a final subgroup.
+        if alpha:
+            beta_as_list = [ai] + alpha
+            beta_as_Pattern = Pattern(fptree.get_selectors(beta_as_list))
+        else:
+            beta_as_list = [ai]
+            beta_as_Pattern = Pattern(fptree.get_selectors(beta_as_list))
+        if (self.num_subgroups > 0):
+            aux = fptree.header_table[ai][0]
+            #update k subgroups (tp,fp)
+            self._updateKSubgroups(aux[0],aux[1],TP,FP)
+            # if k subgroups threshold is higher than the optimistic estimate, we omit the conditional tree
+            dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : aux[0], QualityMeasure.FALSE_POSITIVES : aux[1], QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+            dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
+            oe = self._optimistic_estimate.compute(dict_of_parameters)
+            #k_subgroups is sorted, so the first element is the worst subgroup
+            if (self._get_k_subgroups_threshold() > oe):
+                self._pruned_subgroups += 1
+                return
+        # The values of the counters tp and fp of 'beta' will be those of the selector ai in the header table.
+        tp = fptree.header_table[ai][0][0]
+        fp = fptree.header_table[ai][0][1]
+        # Handle this result.
+        self._handle_individual_result( (beta_as_Pattern, target, tp, fp, TP, FP) )
+        # The refinements of 'beta' are not generated if it already has the maximum number of selectors.
+        if (self._max_depth is not None) and (len(beta_as_list) >= self._max_depth):
+            return
+        # Build the conditional FPTree.
+        if (self.num_subgroups > 0):
+            # The support thresholds are tightened with the minimum tp needed to enter in k subgroups (if applicable). If the subgroup description size (n) threshold is used, the minimum tp is also a minimum n (because n = tp + fp).
+            minimum_tp = self.minimum_tp
+            minimum_n = self.minimum_n
+            minimum_tp_of_the_k_subgroups = self._get_minimum_tp_of_the_k_subgroups(TP, FP)
+            if (minimum_tp_of_the_k_subgroups is not None):
+                if (minimum_n is None):
+                    minimum_tp = max(minimum_tp, minimum_tp_of_the_k_subgroups)
                 else:
-                    # Call conditionalFPTree wihtout prune
-                    conditional_fptree = fptree.generate_conditional_fp_tree(beta_as_list, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n)
-                # Recursive call.
-                if not conditional_fptree.is_empty():
-                    self._fpgrowth(conditional_fptree, beta_as_list, target, TP, FP)
+                    minimum_n = max(minimum_n, minimum_tp_of_the_k_subgroups)
+            # Call conditionalFPTree with prune
+            conditional_fptree, pruned_branches = fptree.generate_conditional_fp_tree_star(beta_as_list, minimum_tp=minimum_tp, minimum_fp=self.minimum_fp, minimum_n=minimum_n,min_optimistic_estimate =  self._get_k_subgroups_threshold(), optimistic_estimate = self._optimistic_estimate, additional_parameters=self._additional_parameters_for_the_optimistic_estimate)
+            self._conditional_pruned_branches += pruned_branches
+        else:
+            # Call conditionalFPTree wihtout prune
+            conditional_fptree = fptree.generate_conditional_fp_tree(beta_as_list, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n)
+        # Recursive call.
+        if not conditional_fptree.is_empty():
+            self._fpgrowth(conditional_fptree, beta_as_list, target, TP, FP)
+
+    def _get_k_subgroups_threshold(self) -> float:
+        """Internal method to get the quality measure value of the worst subgroup in k subgroups, which is used to prune (in a worker process, the greatest between it and the one shared by all the worker processes). IMPORTANT: while k subgroups is not full, any subgroup could enter in it, so the threshold is minus infinity (in this way, the best k quality measure values do not depend on the order in which the search space is explored).
+        """
+        threshold = float("-inf")
+        if (len(self._k_subgroups) == self.num_subgroups):
+            threshold = self._k_subgroups[0]
+        # In a worker process, the shared one is always from a full k subgroups.
+        if (self._shared_k_subgroups_threshold is not None) and (self._shared_k_subgroups_threshold.value > threshold):
+            threshold = self._shared_k_subgroups_threshold.value
+        return threshold
+
+    def _get_minimum_tp_of_the_k_subgroups(self, TP : int, FP : int) -> Union[int, None]:
+        """Internal method to get a minimum true positives (tp) threshold derived from the quality measure value of the worst subgroup in k subgroups, which is used to prune the conditional FPTrees. A subgroup whose tp is less than this threshold (and all its refinements) cannot enter in k subgroups. This threshold is only computed for the quality measures WRAcc and Piatetsky-Shapiro (i.e., (tp*FP - fp*TP) / (TP+FP)^2 and (tp*FP - fp*TP) / (TP+FP)), whose values are less than or equal to tp*FP/(TP+FP)^2 and tp*FP/(TP+FP), respectively.
+
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        :return: the minimum tp threshold (or None, if it is not applicable).
+        """
+        threshold = self._get_k_subgroups_threshold()
+        if (threshold <= 0) or (FP == 0):
+            return None
+        if isinstance(self._quality_measure, WRAcc):
+            # The result is rounded down in order to be conservative with the floating-point errors.
+            return floor(threshold * (TP+FP) * (TP+FP) / FP)
+        if isinstance(self._quality_measure, PiatetskyShapiro):
+            return floor(threshold * (TP+FP) / FP)
+        return None
 
     def _updateKSubgroups(self,tp:int,fp:int,TP:int,FP:int) -> None:
         """Internal method to update and sort k subgroups.
@@ -340,6 +507,13 @@ class SDMapStar(Algorithm):
         dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
         dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
         quality_value = self.quality_measure.compute(dict_of_parameters)
+        self._add_to_k_subgroups(quality_value)
+
+    def _add_to_k_subgroups(self, quality_value : float) -> None:
+        """Internal method to add a quality measure value to k subgroups (if it is among the best k).
+
+        :param quality_value: the quality measure value.
+        """
         #if k-subgroups is not full
         if (len(self._k_subgroups) < self.num_subgroups):
             self._k_subgroups.append(quality_value)
@@ -348,6 +522,45 @@ class SDMapStar(Algorithm):
             if (self._k_subgroups[0] < quality_value):
                 self._k_subgroups[0] = quality_value
                 self._k_subgroups.sort()
+        # In a worker process, share the worst of the best k subgroups (only when k subgroups is full) if it is better than the shared one.
+        if (self._shared_k_subgroups_threshold is not None) and (len(self._k_subgroups) == self.num_subgroups):
+            with self._shared_k_subgroups_threshold.get_lock():
+                if (self._shared_k_subgroups_threshold.value < self._k_subgroups[0]):
+                    self._shared_k_subgroups_threshold.value = self._k_subgroups[0]
+
+    def _fpgrowth_in_parallel(self, fptree : Union[FPTreeForSDMapStar, FPTreeWithArraysForSDMapStar], target : tuple[str, str], TP : int, FP : int) -> None:
+        """Private method to run the adapted FPGrowth algorithm searching each branch (i.e., each item of the header table of the FPTree generated from the complete dataset) in a worker process. The results are merged in the same order as in the sequential execution.
+
+        :param fptree: the FPTree generated from the complete dataset. IMPORTANT: it must not be a single path.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
+        :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
+        """
+        items_of_the_header_table = list(fptree.header_table)
+        shared_k_subgroups_threshold = None
+        if (self.num_subgroups > 0):
+            # SDMapStar optimization: sort the selectors to select the most promising first using the optimistic estimate (in the same way as in the method '_fpgrowth').
+            sorted_selectors = []
+            for item, selector in zip(items_of_the_header_table, fptree.get_selectors(items_of_the_header_table)):
+                dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : fptree.header_table[item][0][0], QualityMeasure.FALSE_POSITIVES : fptree.header_table[item][0][1], QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+                dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
+                sorted_selectors.append((self._optimistic_estimate.compute(dict_of_parameters), selector, item))
+            _, _, items_of_the_header_table = zip(*sorted(sorted_selectors, reverse=True))
+            shared_k_subgroups_threshold = Value("d", float("-inf"))
+        # The configuration is sent without the file, because the results are written by this process.
+        sdmap_for_workers = copy(self)
+        sdmap_for_workers._file = None
+        with ProcessPoolExecutor(max_workers=self._n_jobs, initializer=_initialize_worker, initargs=(sdmap_for_workers, fptree, target, TP, FP, shared_k_subgroups_threshold)) as executor:
+            # IMPORTANT: the 'map' method returns the results in the same order as the branches (as soon as each one of them is available), so the final results are merged deterministically.
+            for written_results, selected_subgroups, unselected_subgroups, pruned_subgroups, conditional_pruned_branches, k_subgroups in executor.map(_fpgrowth_branch_in_worker, items_of_the_header_table):
+                if (self._file_path is not None):
+                    self._file.write(written_results)
+                self._selected_subgroups = self._selected_subgroups + selected_subgroups
+                self._unselected_subgroups = self._unselected_subgroups + unselected_subgroups
+                self._pruned_subgroups = self._pruned_subgroups + pruned_subgroups
+                self._conditional_pruned_branches = self._conditional_pruned_branches + conditional_pruned_branches
+                for quality_value in k_subgroups:
+                    self._add_to_k_subgroups(quality_value)
 
     def fit(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
         """Main method to run the SDMapStar algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
@@ -366,8 +579,11 @@ class SDMapStar(Algorithm):
         # Obtain TP and FP of the dataset.
         TP = sum(pandas_dataframe[target[0]] == target[1])
         FP = len(pandas_dataframe.index) - TP
-        # Create an empty FPTreeForSDMap.
-        fptree = FPTreeForSDMapStar(TP,FP)
+        # Create an empty FPTreeForSDMapStar (or FPTreeWithArraysForSDMapStar).
+        if (self._fp_tree_implementation == SDMapStar.FP_TREE_WITH_ARRAYS):
+            fptree = FPTreeWithArraysForSDMapStar(TP,FP)
+        else:
+            fptree = FPTreeForSDMapStar(TP,FP)
         # Generate the set of frequent selectors.
         set_of_frequent_selectors = fptree.generate_set_of_frequent_selectors(pandas_dataframe, target, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n)
         # Build the FPTree.
@@ -377,7 +593,10 @@ class SDMapStar(Algorithm):
             # Call to the adapated FPGrowth algorithm in order to obtain frequent patterns. In this point, we also open and close the file.
             if (self._file_path is not None):
                 self._file = open(self._file_path, "w")
-            self._fpgrowth(fptree, None, target, TP, FP)
+            if (self._n_jobs == 1) or fptree.there_is_a_single_path() or (len(fptree.header_table) < 2):
+                self._fpgrowth(fptree, None, target, TP, FP)
+            else:
+                self._fpgrowth_in_parallel(fptree, target, TP, FP)
             if (self._file_path is not None):
                 self._file.close()
                 self._file = None
\ No newline at end of file
@@ -6,7 +6,8 @@
 """This file contains the implementation of the VLSD algorithm.
 """
 
-from pandas import DataFrame
+from pandas import DataFrame, factorize
+from numpy import ndarray, full, inf, bincount, cumsum, split
 from pandas.api.types import is_string_dtype
 from subgroups.algorithms.algorithm import Algorithm
 from subgroups.quality_measures.quality_measure import QualityMeasure
@@ -14,13 +15,28 @@ from subgroups.exceptions import DatasetAttributeTypeError
 from subgroups.data_structures.vertical_list import VerticalList
 from subgroups.data_structures.vertical_list_with_bitsets import VerticalListWithBitsets
 from subgroups.data_structures.vertical_list_with_sets import VerticalListWithSets
+from subgroups.data_structures.vertical_list_with_word_arrays import VerticalListWithWordArrays
+from subgroups.data_structures.vertical_list_with_diffsets import VerticalListWithDiffsets
+from subgroups.data_structures.vertical_list_with_compressed_bitmaps import VerticalListWithCompressedBitmaps
+from subgroups.data_structures.vertical_list_with_sorted_arrays import VerticalListWithSortedArrays
+from subgroups.data_structures.vertical_list_with_hybrid_sequences import VerticalListWithHybridSequences
 from subgroups.core.pattern import Pattern
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from subgroups.core.subgroup import Subgroup
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heapreplace
+from itertools import chain
+from collections.abc import Collection, Iterator
+from copy import copy
+from io import StringIO
+from os import cpu_count, replace, remove, SEEK_END
+from pickle import Pickler, Unpickler, dump, load, HIGHEST_PROTOCOL
+from tempfile import TemporaryFile
+from time import monotonic
 
 # Python annotations.
-from typing import Union, ClassVar
+from typing import Union, ClassVar, BinaryIO
 
 def _delete_subgroup_parameters_from_a_dictionary(dict_of_parameters : dict[str, Union[int, float]]):
     """Private method to delete the subgroup parameters (i.e., tp, fp, TP and FP) from a dictionary of parameters. IMPORTANT: this method modifies the parameter, does not return a new dictionary.
@@ -44,21 +60,222 @@ def _delete_subgroup_parameters_from_a_dictionary(dict_of_parameters : dict[str,
     except KeyError:
         pass
 
-def _query_triangular_matrix(matrix : dict[Selector, dict[Selector, VerticalList]], index_a : Selector, index_b : Selector) -> Union[VerticalList, None]:
-    """Private method to query a triangular matrix.
+def _sequence_of_instances_to_str(sequence_of_instances : Collection[int]) -> str:
+    """Private method to transform a sequence of instances of a Vertical List to str in order to write it in the file of results.
+    
+    :param sequence_of_instances: the sequence of instances.
+    :return: the sequence of instances as a str. IMPORTANT: numpy arrays are transformed to lists first, because their str representation is summarized and can contain line breaks.
+    """
+    if isinstance(sequence_of_instances, ndarray):
+        return str(sequence_of_instances.tolist())
+    return str(sequence_of_instances)
+
+def _query_triangular_matrix(matrix : ndarray, number_of_rows : int, index_a : int, index_b : int) -> float:
+    """Private method to query a triangular matrix stored in a 1-dimensional array (row by row and only the elements above the main diagonal).
     
     :param matrix: the triangular matrix which is queried.
+    :param number_of_rows: the number of rows (and columns) of the triangular matrix.
     :param index_a: the first index in the query.
-    :param index_b: the second index in the query.
-    :return: either the Vertical List contained in matrix[index_a][index_b], or the Vertical List contained in matrix[index_b][index_a] if the firt one was None, or None if they were both None.
+    :param index_b: the second index in the query. It must be different from the first one.
+    :return: the value contained in matrix[index_a][index_b] (which is the same as the value contained in matrix[index_b][index_a]).
     """
-    try:
-        return matrix[index_a][index_b]
-    except KeyError:
-        try:
-            return matrix[index_b][index_a]
-        except KeyError:
-            return None
+    if index_a > index_b:
+        index_a, index_b = index_b, index_a
+    # The row 'index_a' starts after the (number_of_rows-1) + (number_of_rows-2) + ... + (number_of_rows-index_a) elements of the previous rows.
+    return matrix[ (index_a * (2*number_of_rows - index_a - 3)) // 2 + index_b - 1 ]
+
+# Version of the format of the checkpoint files (see the 'checkpoint_path' parameter of the VLSD algorithm).
+_CHECKPOINT_FORMAT_VERSION = 1
+
+class _CheckpointPickler(Pickler):
+    """Private pickler used to write the state of the search in a checkpoint file. The selectors of the Vertical Lists of size 1 are stored by means of their IDs (i.e., their positions in S1), not as objects.
+    
+    :param file: the binary file in which the state is written.
+    :param selector_ids: python dictionary which contains the ID of each selector of the Vertical Lists of size 1.
+    """
+    
+    def __init__(self, file, selector_ids : dict[Selector, int]) -> None:
+        super().__init__(file, protocol=HIGHEST_PROTOCOL)
+        self._selector_ids = selector_ids
+    
+    def persistent_id(self, obj : object) -> Union[int, None]:
+        if type(obj) is Selector:
+            return self._selector_ids.get(obj) # None (i.e., pickled as usual) if it is not the selector of a Vertical List of size 1 (e.g., the target).
+        return None
+
+class _CheckpointUnpickler(Unpickler):
+    """Private unpickler used to read the state of the search from a checkpoint file (see the class '_CheckpointPickler').
+    
+    :param file: the binary file from which the state is read.
+    :param selectors: the list of selectors of the Vertical Lists of size 1 (i.e., the selector with ID i is selectors[i]).
+    """
+    
+    def __init__(self, file, selectors : list[Selector]) -> None:
+        super().__init__(file)
+        self._selectors = selectors
+    
+    def persistent_load(self, pid : int) -> Selector:
+        return self._selectors[pid]
+
+class _SpillPickler(Pickler):
+    """Private pickler used to spill the pending Vertical Lists of a frame of the stack of the search to the scratch file (see the method '_spill_frames' of the VLSD algorithm). The objects which are kept alive during the search (i.e., the selectors, the shared prefix of the Vertical Lists with diffsets and the Vertical Lists of size 1, which are in S1) are not stored, but referenced by means of their positions in the attribute 'referenced_objects', and the IDs of the dataset instances are stored as persistent IDs (see the class '_SpillUnpickler'). In this way, none of these objects is duplicated when the pending Vertical Lists are loaded again (e.g., they are loaded again as diffsets of the same prefix object).
+    
+    :param file: the binary file in which the Vertical Lists are written.
+    :param pending_vertical_lists: the pending Vertical Lists which are spilled.
+    :param number_of_instance_ids: the integers lower than this number are stored as IDs of dataset instances (0 if the sequences of the Vertical Lists do not store the IDs as python ints).
+    """
+    
+    def __init__(self, file, pending_vertical_lists : list[VerticalList], number_of_instance_ids : int) -> None:
+        super().__init__(file, protocol=HIGHEST_PROTOCOL)
+        self._ids_of_the_pending_vertical_lists = set(id(vertical_list) for vertical_list in pending_vertical_lists)
+        # All the Vertical Lists of the search have the same type.
+        self._types_of_the_vertical_lists = set(type(vertical_list) for vertical_list in pending_vertical_lists if vertical_list is not None)
+        self._number_of_instance_ids = number_of_instance_ids
+        # Position of each referenced object (by means of its ID according to the 'id' function) in the attribute 'referenced_objects'.
+        self._positions_of_the_referenced_objects = {}
+        self.referenced_objects = []
+    
+    def persistent_id(self, obj : object) -> Union[int, tuple[int], None]:
+        # IMPORTANT: this method is called for each pickled object (e.g., for each ID of the sequences), so the type of the object is checked instead of using 'isinstance', which is slower with abstract classes.
+        type_of_the_object = type(obj)
+        if type_of_the_object is int:
+            # The ID of a dataset instance (the rest of integers are pickled as usual).
+            return obj if (0 <= obj < self._number_of_instance_ids) else None
+        if (type_of_the_object is Selector) or ((type_of_the_object in self._types_of_the_vertical_lists) and ((id(obj) not in self._ids_of_the_pending_vertical_lists) or (len(obj.list_of_selectors) == 1))):
+            # An object shared by several pending Vertical Lists (e.g., their prefix) is only referenced once.
+            position = self._positions_of_the_referenced_objects.get(id(obj))
+            if position is None:
+                position = len(self.referenced_objects)
+                self._positions_of_the_referenced_objects[id(obj)] = position
+                self.referenced_objects.append(obj)
+            return (position,)
+        return None
+    
+    def dump(self, obj : object) -> None:
+        super().dump(obj)
+        # IMPORTANT: the memo is cleared after each pickled Vertical List, because it keeps alive the temporary objects created to pickle it (e.g., the bytes of a bitset). The pending Vertical Lists only share the referenced objects, so nothing is lost.
+        self.clear_memo()
+
+class _SpillUnpickler(Unpickler):
+    """Private unpickler used to load the pending Vertical Lists of a spilled frame of the stack of the search from the scratch file (see the class '_SpillPickler').
+    
+    :param file: the binary file from which the Vertical Lists are read.
+    :param referenced_objects: the objects referenced by the spilled Vertical Lists (i.e., the attribute 'referenced_objects' of the pickler).
+    :param instance_ids: the list of IDs of the dataset instances (i.e., the ID i is instance_ids[i]), or None if they are not stored as persistent IDs. IMPORTANT: it is the attribute '_instance_ids' of the VLSD algorithm, so the IDs of the loaded Vertical Lists are the same python ints as those of the rest of Vertical Lists.
+    """
+    
+    def __init__(self, file, referenced_objects : list[object], instance_ids : Union[list[int], None]) -> None:
+        super().__init__(file)
+        self._referenced_objects = referenced_objects
+        self._instance_ids = instance_ids
+    
+    def persistent_load(self, pid : Union[int, tuple[int]]) -> object:
+        if type(pid) is int:
+            return self._instance_ids[pid]
+        return self._referenced_objects[pid[0]]
+
+# State shared by all the branches searched in a worker process (see the 'n_jobs' parameter of the VLSD algorithm). It is set only once per worker process by means of the function '_initialize_worker'.
+_worker_state = None
+
+def _initialize_worker(vlsd : 'VLSD', S1 : list[VerticalList], M : ndarray, selector_ids : dict[Selector, int], attribute_ids : list[int], target : tuple[str, str], TP : int, FP : int) -> None:
+    """Private method to initialize a worker process of the VLSD algorithm. IMPORTANT: S1 and M are only read in the worker process.
+    
+    :param vlsd: the VLSD instance (without an open file) whose configuration is used in the worker process.
+    :param S1: the list of Vertical Lists of size 1.
+    :param M: the 2-dimensional triangular matrix M with the optimistic estimate values of the Vertical Lists of size 2 (in this case, it is a 1-dimensional numpy array, see the function '_query_triangular_matrix'). IMPORTANT: its rows and columns are the IDs of the selectors.
+    :param selector_ids: python dictionary which contains the ID of each selector of the Vertical Lists of size 1 (i.e., its position in S1).
+    :param attribute_ids: the ID of the attribute of each selector of the Vertical Lists of size 1 (see the method '_generate_attribute_ids').
+    :param target: a tuple with 2 elements: the target attribute name and the target value.
+    :param TP: the true population of the dataset.
+    :param FP: the false population of the dataset.
+    """
+    global _worker_state
+    _worker_state = (vlsd, S1, M, selector_ids, attribute_ids, target, TP, FP)
+
+def _search_branch_in_worker(index : int) -> tuple[str, int, int, list[tuple[float, int, Subgroup, VerticalList]]]:
+    """Private method to search, in a worker process, the branch of the VLSD algorithm which starts with the Vertical List S1[index].
+    
+    :param index: the index in S1 of the Vertical List from which the branch starts.
+    :return: a tuple with 4 elements: (1) the results written by the branch (empty str if the results are not written in a file or if the top-k mode is used), (2) the number of selected subgroups in the branch, (3) the number of unselected subgroups in the branch, and (4) the best k subgroups found in the branch (empty list if the top-k mode is not used).
+    """
+    vlsd, S1, M, selector_ids, attribute_ids, target, TP, FP = _worker_state
+    vlsd._selected_subgroups = 0
+    vlsd._unselected_subgroups = 0
+    # IMPORTANT: the current threshold of the optimistic estimate is not reset, because it is the one reached by the main process before searching the branches (i.e., the branch is pruned at least as much as in the main process).
+    vlsd._k_subgroups = []
+    # The results of the branch are written in memory and are returned to the main process, which writes them in the final file in a deterministic order.
+    if (vlsd._file_path is not None):
+        vlsd._file = StringIO()
+    for vertical_list in vlsd._search_branch(index, S1, M, selector_ids, attribute_ids, target, TP, FP):
+        vlsd._handle_individual_result( (vertical_list, target, TP, FP) )
+    written_results = ""
+    if (vlsd._file_path is not None):
+        written_results = vlsd._file.getvalue()
+        vlsd._file = None
+    return (written_results, vlsd._selected_subgroups, vlsd._unselected_subgroups, vlsd._k_subgroups)
+
+class VLSDResult(object):
+    """This class represents a subgroup found by the VLSD algorithm when its results are consumed by means of the 'iter_subgroups' method. It is a lightweight (and read-only) record which only contains the information already computed during the search.
+    
+    :param list_of_selectors: the list of selectors of the description of the subgroup.
+    :param tp: the true positives of the subgroup.
+    :param fp: the false positives of the subgroup.
+    :param quality_value: the quality measure value of the subgroup.
+    :param optimistic_estimate_value: the optimistic estimate value of the subgroup.
+    :param sequence_of_instances_tp: the sequence of IDs of the dataset instances which are covered by the subgroup description and also by the target (with the representation of the implementation of the Vertical Lists), or None if it was not requested.
+    :param sequence_of_instances_fp: the sequence of IDs of the dataset instances which are covered by the subgroup description, but not by the target (with the representation of the implementation of the Vertical Lists), or None if it was not requested.
+    """
+    
+    __slots__ = ("_list_of_selectors", "_tp", "_fp", "_quality_value", "_optimistic_estimate_value", "_sequence_of_instances_tp", "_sequence_of_instances_fp")
+    
+    def __init__(self, list_of_selectors : list[Selector], tp : int, fp : int, quality_value : Union[int, float], optimistic_estimate_value : Union[int, float], sequence_of_instances_tp : Union[Collection[int], None] = None, sequence_of_instances_fp : Union[Collection[int], None] = None) -> None:
+        self._list_of_selectors = list_of_selectors
+        self._tp = tp
+        self._fp = fp
+        self._quality_value = quality_value
+        self._optimistic_estimate_value = optimistic_estimate_value
+        self._sequence_of_instances_tp = sequence_of_instances_tp
+        self._sequence_of_instances_fp = sequence_of_instances_fp
+    
+    def _get_list_of_selectors(self) -> list[Selector]:
+        return self._list_of_selectors
+    
+    def _get_tp(self) -> int:
+        return self._tp
+    
+    def _get_fp(self) -> int:
+        return self._fp
+    
+    def _get_quality_value(self) -> Union[int, float]:
+        return self._quality_value
+    
+    def _get_optimistic_estimate_value(self) -> Union[int, float]:
+        return self._optimistic_estimate_value
+    
+    def _get_sequence_of_instances_tp(self) -> Union[Collection[int], None]:
+        return self._sequence_of_instances_tp
+    
+    def _get_sequence_of_instances_fp(self) -> Union[Collection[int], None]:
+        return self._sequence_of_instances_fp
+    
+    list_of_selectors = property(_get_list_of_selectors, None, None, "The list of selectors of the description of the subgroup. IMPORTANT: it must not be modified.")
+    tp = property(_get_tp, None, None, "The true positives of the subgroup.")
+    fp = property(_get_fp, None, None, "The false positives of the subgroup.")
+    quality_value = property(_get_quality_value, None, None, "The quality measure value of the subgroup.")
+    optimistic_estimate_value = property(_get_optimistic_estimate_value, None, None, "The optimistic estimate value of the subgroup.")
+    sequence_of_instances_tp = property(_get_sequence_of_instances_tp, None, None, "The sequence of IDs of the dataset instances which are covered by the subgroup description and also by the target, or None if it was not requested. IMPORTANT: it must not be modified.")
+    sequence_of_instances_fp = property(_get_sequence_of_instances_fp, None, None, "The sequence of IDs of the dataset instances which are covered by the subgroup description, but not by the target, or None if it was not requested. IMPORTANT: it must not be modified.")
+    
+    def to_subgroup(self, target : tuple[str, str]) -> Subgroup:
+        """Method to create the subgroup represented by this record.
+        
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :return: the subgroup.
+        """
+        return Subgroup(Pattern(self._list_of_selectors), Selector(target[0], Operator.EQUAL, target[1]))
+    
+    def __repr__(self) -> str:
+        return "VLSDResult(list_of_selectors=" + str([str(selector) for selector in self._list_of_selectors]) + ", tp=" + str(self._tp) + ", fp=" + str(self._fp) + ", quality_value=" + str(self._quality_value) + ")"
 
 class VLSD(Algorithm):
     """This class represents the VLSD algorithm.
@@ -71,8 +288,16 @@ class VLSD(Algorithm):
     :param additional_parameters_for_the_optimistic_estimate: if the optimistic estimate passed by parameter needs more parameters apart from tp, fp, TP and FP to be computed, they need to be specified here.
     :param sort_criterion_in_s1: the criterion to use in order to sort the Vertical Lists with only one selector. Three values are possible: "quality-ascending" (sort ascending by quality value), "quality-descending" (sort descending by quality value), and "no-order" (do not sort and maintain the generation order). By default, "no-order".
     :param sort_criterion_in_other_sizes: the criterion to use in order to sort the Vertical Lists with more than one selector. Three values are possible: "quality-ascending" (sort ascending by quality value), "quality-descending" (sort descending by quality value), and "no-order" (do not sort and maintain the generation order). By default, "no-order".
+    :param vertical_lists_implementation: the implementation of the Vertical Lists. Seven values are possible: "bitsets" (sequences implemented using bitarrays), "sets" (sequences implemented using python sets), "word-arrays" (sequences implemented using numpy arrays of 64-bit words, in which each Vertical List is joined with all its siblings at once), "diffsets" (sequences implemented using python sets with the difference with respect to the prefix, which are smaller in dense datasets), "compressed-bitmaps" (sequences implemented using compressed bitmaps similar to Roaring bitmaps, whose size depends on the number of instances in them and not on the number of instances of the dataset), "sorted-arrays" (sequences implemented using sorted numpy arrays of integers), and "hybrid" (each sequence is implemented using a bitarray or a sorted numpy array of integers depending on its density, so that dense sequences near the root of the search tree are bitarrays and sparse sequences deeper in it are sorted numpy arrays). By default, "bitsets".
     :param write_results_in_file: whether the results obtained will be written in a file. By default, False.
     :param file_path: if 'write_results_in_file' is True, path of the file in which the results will be written.
+    :param n_jobs: the number of worker processes in which the branches of the search space (i.e., one per Vertical List of size 1) are searched. If -1, all the available processors are used. The results are always handled in the same order as in the sequential execution. By default, 1 (i.e., sequential execution).
+    :param num_subgroups: if it is greater than 0, only the best 'num_subgroups' subgroups (according to the quality measure) are kept in memory (top-k mode) and they are returned by the 'k_subgroups' attribute. In this mode, when 'num_subgroups' subgroups have been found, the threshold for the optimistic estimate is raised to the quality value of the worst one, so that the search space is pruned much more. If 'write_results_in_file' is True, only these subgroups are written in the file (sorted descending by quality value) when the 'fit' method finishes. By default, 0 (i.e., all the subgroups are handled and the threshold for the optimistic estimate is always 'oe_minimum_threshold').
+    :param max_depth: the maximum number of selectors in the description of a subgroup (i.e., the maximum depth of the search). If None, the depth of the search is not limited. By default, None.
+    :param checkpoint_path: if it is not None, path of the file in which the state of the search is periodically saved (see the 'resume_from' parameter of the 'fit' method). It contains the current branch, the pending Vertical Lists (whose selectors are stored by means of their IDs), the counters, the best k subgroups (in the top-k mode) and the position in the file of results. The file is removed when the 'fit' method finishes. IMPORTANT: checkpoints are only supported in the sequential execution (i.e., 'n_jobs' must be 1). By default, None.
+    :param checkpoint_interval: if 'checkpoint_path' is not None, minimum number of seconds between two consecutive checkpoints. By default, 600.
+    :param closed_only: whether only the closed subgroups are generated (i.e., the subgroups such that no refinement has the same tp and fp, and, therefore, the same sequences of instances and quality measure value). When a refinement with the same cover as its parent is found during the search, its selector is added to the description of the parent (and of all its refinements) instead of exploring it as a separate node, so the number of visited nodes and the size of the results are reduced. In this mode, each subgroup is handled when it is extended (instead of when it is generated), so the order of the results is different. IMPORTANT: the result is exact if the optimistic estimate does not increase when the cover of a subgroup is reduced (which is the case of the usual optimistic estimates). This mode is not compatible with 'max_depth' and is only supported in the sequential execution (i.e., 'n_jobs' must be 1). By default, False.
+    :param memory_limit: if it is not None, maximum number of bytes of memory (approximately, see the 'memory_usage' method of the Vertical Lists, which also counts once the prefix shared by the Vertical Lists with diffsets of each frame) used by the sequences of the pending Vertical Lists of the search (i.e., those which have been generated, but not extended yet). When it is exceeded, the pending Vertical Lists of the frames of the stack which will be processed later are spilled to a temporary scratch file (until the memory is not greater than half of the limit) and loaded again when their frame has to be processed. The shared prefix of the pending Vertical Lists with diffsets is not spilled (it is kept in memory and referenced by the spilled frame), so they are loaded again as diffsets of the same prefix. The Vertical Lists of size 1 and the triangular matrix M are not counted. IMPORTANT: the next frame to be processed (i.e., the top of the stack) is never spilled, so the limit can be overshot by its memory (the frames are not spilled if only that frame exceeds the limit). In the parallel execution, the limit is applied to each worker process. IMPORTANT: it is not compatible with checkpoints. By default, None.
     """
     
     SORT_CRITERION_QUALITY_ASCENDING : ClassVar[str] = "quality-ascending"
@@ -82,11 +307,16 @@ class VLSD(Algorithm):
     
     VERTICAL_LISTS_WITH_BITSETS : ClassVar[str] = "bitsets"
     VERTICAL_LISTS_WITH_SETS : ClassVar[str] = "sets"
-    VERTICAL_LISTS_IMPLEMENTATION : ClassVar[list[str]] = [VERTICAL_LISTS_WITH_BITSETS, VERTICAL_LISTS_WITH_SETS]
+    VERTICAL_LISTS_WITH_WORD_ARRAYS : ClassVar[str] = "word-arrays"
+    VERTICAL_LISTS_WITH_DIFFSETS : ClassVar[str] = "diffsets"
+    VERTICAL_LISTS_WITH_COMPRESSED_BITMAPS : ClassVar[str] = "compressed-bitmaps"
+    VERTICAL_LISTS_WITH_SORTED_ARRAYS : ClassVar[str] = "sorted-arrays"
+    VERTICAL_LISTS_WITH_HYBRID_SEQUENCES : ClassVar[str] = "hybrid"
+    VERTICAL_LISTS_IMPLEMENTATION : ClassVar[list[str]] = [VERTICAL_LISTS_WITH_BITSETS, VERTICAL_LISTS_WITH_SETS, VERTICAL_LISTS_WITH_WORD_ARRAYS, VERTICAL_LISTS_WITH_DIFFSETS, VERTICAL_LISTS_WITH_COMPRESSED_BITMAPS, VERTICAL_LISTS_WITH_SORTED_ARRAYS, VERTICAL_LISTS_WITH_HYBRID_SEQUENCES]
 
-    __slots__ = ("_quality_measure", "_q_minimum_threshold", "_optimistic_estimate", "_oe_minimum_threshold", "_additional_parameters_for_the_quality_measure", "_additional_parameters_for_the_optimistic_estimate", "_unselected_subgroups", "_selected_subgroups", "_sort_criterion_in_s1", "_sort_criterion_in_other_sizes", "_vertical_lists_implementation", "_file_path", "_file")
+    __slots__ = ("_quality_measure", "_q_minimum_threshold", "_optimistic_estimate", "_oe_minimum_threshold", "_additional_parameters_for_the_quality_measure", "_additional_parameters_for_the_optimistic_estimate", "_unselected_subgroups", "_selected_subgroups", "_sort_criterion_in_s1", "_sort_criterion_in_other_sizes", "_vertical_lists_implementation", "_file_path", "_file", "_n_jobs", "_num_subgroups", "_k_subgroups", "_number_of_subgroups_added_to_k_subgroups", "_current_oe_minimum_threshold", "_max_depth", "_checkpoint_path", "_checkpoint_interval", "_checkpoint_context", "_time_of_the_last_checkpoint", "_k_subgroups_of_the_previous_targets", "_closed_only", "_descriptions_of_the_closed_subgroups", "_memory_limit", "_instance_ids")
     
-    def __init__(self, quality_measure : QualityMeasure, q_minimum_threshold : Union[int, float], optimistic_estimate : QualityMeasure, oe_minimum_threshold : Union[int, float], additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), sort_criterion_in_s1 : str = SORT_CRITERION_NO_ORDER, sort_criterion_in_other_sizes : str = SORT_CRITERION_NO_ORDER, vertical_lists_implementation : str = VERTICAL_LISTS_WITH_BITSETS, write_results_in_file : bool = False, file_path : Union[str, None] = None) -> None:
+    def __init__(self, quality_measure : QualityMeasure, q_minimum_threshold : Union[int, float], optimistic_estimate : QualityMeasure, oe_minimum_threshold : Union[int, float], additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), sort_criterion_in_s1 : str = SORT_CRITERION_NO_ORDER, sort_criterion_in_other_sizes : str = SORT_CRITERION_NO_ORDER, vertical_lists_implementation : str = VERTICAL_LISTS_WITH_BITSETS, write_results_in_file : bool = False, file_path : Union[str, None] = None, n_jobs : int = 1, num_subgroups : int = 0, max_depth : Union[int, None] = None, checkpoint_path : Union[str, None] = None, checkpoint_interval : Union[int, float] = 600, closed_only : bool = False, memory_limit : Union[int, None] = None) -> None:
         if not isinstance(quality_measure, QualityMeasure):
             raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
         if (type(q_minimum_threshold) is not int) and (type(q_minimum_threshold) is not float):
@@ -115,6 +345,38 @@ class VLSD(Algorithm):
         # If 'write_results_in_file' is True, 'file_path' must not be None.
         if (write_results_in_file) and (file_path is None):
             raise ValueError("If the parameter 'write_results_in_file' is True, the parameter 'file_path' must not be None.")
+        if (type(n_jobs) is not int):
+            raise TypeError("The type of the parameter 'n_jobs' must be 'int'.")
+        if (n_jobs < 1) and (n_jobs != -1):
+            raise ValueError("The value of the parameter 'n_jobs' must be greater than 0 or -1.")
+        if (type(num_subgroups) is not int):
+            raise TypeError("The type of the parameter 'num_subgroups' must be 'int'.")
+        if (num_subgroups < 0):
+            raise ValueError("The value of the parameter 'num_subgroups' must be greater than or equal to 0.")
+        if (type(max_depth) is not int) and (max_depth is not None):
+            raise TypeError("The type of the parameter 'max_depth' must be 'int' or 'NoneType'.")
+        if (max_depth is not None) and (max_depth < 1):
+            raise ValueError("The value of the parameter 'max_depth' must be greater than 0.")
+        if ((type(checkpoint_path) is not str) and (checkpoint_path is not None)):
+            raise TypeError("The type of the parameter 'checkpoint_path' must be 'str' or 'NoneType'.")
+        if (type(checkpoint_interval) is not int) and (type(checkpoint_interval) is not float):
+            raise TypeError("The type of the parameter 'checkpoint_interval' must be 'int' or 'float'.")
+        if (checkpoint_interval < 0):
+            raise ValueError("The value of the parameter 'checkpoint_interval' must be greater than or equal to 0.")
+        if (checkpoint_path is not None) and (n_jobs != 1):
+            raise ValueError("Checkpoints are only supported in the sequential execution, so if the parameter 'checkpoint_path' is not None, the parameter 'n_jobs' must be 1.")
+        if (type(closed_only) is not bool):
+            raise TypeError("The type of the parameter 'closed_only' must be 'bool'.")
+        if closed_only and (n_jobs != 1):
+            raise ValueError("The closed mode is only supported in the sequential execution, so if the parameter 'closed_only' is True, the parameter 'n_jobs' must be 1.")
+        if closed_only and (max_depth is not None):
+            raise ValueError("The closed mode is not compatible with a maximum depth, so if the parameter 'closed_only' is True, the parameter 'max_depth' must be None.")
+        if ((type(memory_limit) is not int) and (memory_limit is not None)):
+            raise TypeError("The type of the parameter 'memory_limit' must be 'int' or 'NoneType'.")
+        if (memory_limit is not None) and (memory_limit <= 0):
+            raise ValueError("The value of the parameter 'memory_limit' must be greater than 0.")
+        if (memory_limit is not None) and (checkpoint_path is not None):
+            raise ValueError("A memory limit is not compatible with checkpoints, so if the parameter 'memory_limit' is not None, the parameter 'checkpoint_path' must be None.")
         self._quality_measure = quality_measure
         self._q_minimum_threshold = q_minimum_threshold
         self._optimistic_estimate = optimistic_estimate
@@ -133,6 +395,30 @@ class VLSD(Algorithm):
         else:
             self._file_path = None
         self._file = None
+        if (n_jobs == -1):
+            self._n_jobs = cpu_count() or 1
+        else:
+            self._n_jobs = n_jobs
+        self._num_subgroups = num_subgroups
+        # Min-heap with the best k subgroups (only in the top-k mode). Each element is a tuple (quality value, insertion order, subgroup, Vertical List), so the worst subgroup is always the first one. The insertion order is only used to break ties.
+        self._k_subgroups = []
+        self._number_of_subgroups_added_to_k_subgroups = 0
+        # Threshold for the optimistic estimate which is used during the search. It is only raised in the top-k mode.
+        self._current_oe_minimum_threshold = oe_minimum_threshold
+        # In the multi-target mode, list of tuples (subgroup, quality value) with the best k subgroups of the target values whose search has finished.
+        self._k_subgroups_of_the_previous_targets = []
+        self._max_depth = max_depth
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval = checkpoint_interval
+        self._closed_only = closed_only
+        self._memory_limit = memory_limit
+        # In the closed mode, python dictionary in which the key is a tuple (tp, fp) and the value is a list with the descriptions (as frozensets of selectors) of the closed subgroups with those tp and fp which have been already handled.
+        self._descriptions_of_the_closed_subgroups = dict()
+        # If the sequences of the Vertical Lists are python sets, list with the IDs of the dataset instances (i.e., the ID i is _instance_ids[i]), so that each ID is the same python int in all the Vertical Lists (see the method '_generate_subgroups_s1'). IMPORTANT: it is generated for each target.
+        self._instance_ids = None
+        # Information needed to save a checkpoint (only during the sequential search in the 'fit' method if 'checkpoint_path' is not None).
+        self._checkpoint_context = None
+        self._time_of_the_last_checkpoint = 0
     
     def _get_quality_measure(self) -> QualityMeasure:
         return self._quality_measure
@@ -181,10 +467,91 @@ class VLSD(Algorithm):
     sort_criterion_in_s1 = property(_get_sort_criterion_in_s1, None, None, "The criterion to use in order to sort the Vertical Lists with only one selector.")
     sort_criterion_in_other_sizes = property(_get_sort_criterion_in_other_sizes, None, None, "The criterion to use in order to sort the Vertical Lists with more than one selector.")
     
-    def _handle_individual_result(self, individual_result : tuple[VerticalList, tuple[str, str], int, int]) -> None:
+    def _get_n_jobs(self) -> int:
+        return self._n_jobs
+    
+    n_jobs = property(_get_n_jobs, None, None, "The number of worker processes in which the branches of the search space are searched.")
+    
+    def _get_num_subgroups(self) -> int:
+        return self._num_subgroups
+    
+    def _get_k_subgroups(self) -> list[tuple[Subgroup, float]]:
+        return self._k_subgroups_of_the_previous_targets + [(element[2], element[0]) for element in sorted(self._k_subgroups, reverse=True)]
+    
+    def _get_current_oe_minimum_threshold(self) -> Union[int, float]:
+        return self._current_oe_minimum_threshold
+    
+    num_subgroups = property(_get_num_subgroups, None, None, "The maximum number of subgroups in 'k_subgroups' (0 if the top-k mode is not used).")
+    k_subgroups = property(_get_k_subgroups, None, None, "List of tuples (subgroup, quality value) with the best 'num_subgroups' subgroups found by the VLSD algorithm, sorted descending by quality value (before executing the 'fit' method or if the top-k mode is not used, this attribute is an empty list). In the multi-target mode, it contains the best 'num_subgroups' subgroups of each target value, one after another, in the order of the list of target values.")
+    def _get_max_depth(self) -> Union[int, None]:
+        return self._max_depth
+    
+    max_depth = property(_get_max_depth, None, None, "The maximum number of selectors in the description of a subgroup (None if the depth of the search is not limited).")
+    
+    def _get_checkpoint_path(self) -> Union[str, None]:
+        return self._checkpoint_path
+    
+    def _get_checkpoint_interval(self) -> Union[int, float]:
+        return self._checkpoint_interval
+    
+    checkpoint_path = property(_get_checkpoint_path, None, None, "The path of the file in which the state of the search is periodically saved (None if checkpoints are not used).")
+    checkpoint_interval = property(_get_checkpoint_interval, None, None, "The minimum number of seconds between two consecutive checkpoints.")
+    
+    def _get_closed_only(self) -> bool:
+        return self._closed_only
+    
+    closed_only = property(_get_closed_only, None, None, "Whether only the closed subgroups are generated.")
+    
+    def _get_memory_limit(self) -> Union[int, None]:
+        return self._memory_limit
+    
+    memory_limit = property(_get_memory_limit, None, None, "The maximum number of bytes of memory used by the sequences of the pending Vertical Lists of the search (None if the memory is not limited).")
+    current_oe_minimum_threshold = property(_get_current_oe_minimum_threshold, None, None, "The threshold for the optimistic estimate which is used during the search. In the top-k mode, it is raised as better subgroups are found. In other case, it is always 'oe_minimum_threshold'.")
+    
+    def _write_individual_result(self, vertical_list : VerticalList, subgroup : Subgroup, quality_measure_value : float, TP : int, FP : int) -> None:
+        """Private method to write an individual result generated by the VLSD algorithm in the file defined in the __init__ method.
+        
+        :param vertical_list: the Vertical List of the subgroup.
+        :param subgroup: the subgroup.
+        :param quality_measure_value: the quality measure value of the subgroup.
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        """
+        self._file.write(str(subgroup) + " ; ")
+        self._file.write("Sequence of instances tp = " + _sequence_of_instances_to_str(vertical_list.sequence_of_instances_tp) + " ; ")
+        self._file.write("Sequence of instances fp = " + _sequence_of_instances_to_str(vertical_list.sequence_of_instances_fp) + " ; ")
+        self._file.write("Quality Measure " + self._quality_measure.get_name() + " = " + str(quality_measure_value) + " ; ")
+        self._file.write("Optimistic Estimate " + self._optimistic_estimate.get_name() + " = " + str(vertical_list.quality_value) + " ; ")
+        self._file.write("tp = " + str(vertical_list.tp) + " ; ")
+        self._file.write("fp = " + str(vertical_list.fp) + " ; ")
+        self._file.write("TP = " + str(TP) + " ; ")
+        self._file.write("FP = " + str(FP) + "\n")
+    
+    def _add_to_k_subgroups(self, element : tuple[float, int, Subgroup, VerticalList]) -> bool:
+        """Private method to add a subgroup to the best k subgroups (top-k mode) and, if there are already k subgroups, to raise the current threshold for the optimistic estimate to the quality value of the worst one.
+        
+        :param element: a tuple (quality value, insertion order, subgroup, Vertical List). IMPORTANT: the insertion order is replaced.
+        :return: whether the subgroup has been added (i.e., there were less than k subgroups or its quality value is greater than the quality value of the worst one).
+        """
+        element = (element[0], self._number_of_subgroups_added_to_k_subgroups, element[2], element[3])
+        if (len(self._k_subgroups) < self._num_subgroups):
+            heappush(self._k_subgroups, element)
+        elif (element[0] > self._k_subgroups[0][0]):
+            heapreplace(self._k_subgroups, element)
+        else:
+            return False
+        self._number_of_subgroups_added_to_k_subgroups = self._number_of_subgroups_added_to_k_subgroups + 1
+        # No subgroup with a quality value lower than the worst of the best k subgroups will be added, so its quality value is a valid threshold for the optimistic estimate.
+        if (len(self._k_subgroups) == self._num_subgroups) and (self._k_subgroups[0][0] > self._current_oe_minimum_threshold):
+            self._current_oe_minimum_threshold = self._k_subgroups[0][0]
+        return True
+    
+    
+    def _handle_individual_result(self, individual_result : tuple[VerticalList, tuple[str, str], int, int]) -> Union[float, None]:
         """Private method to handle each individual result generated by the VLSD algorithm.
         
         :param individual_result: the individual result which is handled. In this case, it is a Vertical List, a target as a tuple and the subgroup parameters TP and FP.
+        :return: the quality measure value of the subgroup if it is selected, or None in other case.
         """
         # Get the subgroup parameters.
         tp = individual_result[0].tp
@@ -195,129 +562,209 @@ class VLSD(Algorithm):
         dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
         dict_of_parameters.update(self._additional_parameters_for_the_quality_measure)
         quality_measure_value = self._quality_measure.compute(dict_of_parameters)
-        # Add the subgroup only if the quality measure value is greater or equal than the threshold.
-        if quality_measure_value >= self._q_minimum_threshold:
-            # If applicable, write in the file defined in the __init__ method.
-            if self._file_path is not None:
-                # Get the description and the target.
-                subgroup_description = Pattern(individual_result[0].list_of_selectors)
-                target_as_tuple = individual_result[1] # Attribute name -> target_as_tuple[0], Attribute value -> target_as_tuple[1]
-                # Create the subgroup.
-                subgroup = Subgroup(subgroup_description, Selector(target_as_tuple[0], Operator.EQUAL, target_as_tuple[1]))
-                # Write.
-                self._file.write(str(subgroup) + " ; ")
-                self._file.write("Sequence of instances tp = " + str(individual_result[0].sequence_of_instances_tp) + " ; ")
-                self._file.write("Sequence of instances fp = " + str(individual_result[0].sequence_of_instances_fp) + " ; ")
-                self._file.write("Quality Measure " + self._quality_measure.get_name() + " = " + str(quality_measure_value) + " ; ")
-                self._file.write("Optimistic Estimate " + self._optimistic_estimate.get_name() + " = " + str(individual_result[0].quality_value) + " ; ")
-                self._file.write("tp = " + str(tp) + " ; ")
-                self._file.write("fp = " + str(fp) + " ; ")
-                self._file.write("TP = " + str(TP) + " ; ")
-                self._file.write("FP = " + str(FP) + "\n")
+        # Add the subgroup only if the quality measure value is greater or equal than the threshold (and, in the top-k mode, only if it is one of the best k subgroups found so far).
+        if (quality_measure_value >= self._q_minimum_threshold) and ((self._num_subgroups == 0) or (len(self._k_subgroups) < self._num_subgroups) or (quality_measure_value > self._k_subgroups[0][0])):
+            # Get the description and the target.
+            subgroup_description = Pattern(individual_result[0].list_of_selectors)
+            target_as_tuple = individual_result[1] # Attribute name -> target_as_tuple[0], Attribute value -> target_as_tuple[1]
+            # Create the subgroup.
+            subgroup = Subgroup(subgroup_description, Selector(target_as_tuple[0], Operator.EQUAL, target_as_tuple[1]))
+            # In the top-k mode, the subgroup is kept in memory (and written in the file at the end). In other case, if applicable, write in the file defined in the __init__ method.
+            if self._num_subgroups > 0:
+                self._add_to_k_subgroups( (quality_measure_value, 0, subgroup, individual_result[0]) )
+            elif self._file is not None:
+                self._write_individual_result(individual_result[0], subgroup, quality_measure_value, TP, FP)
             # Increment the number of selected subgroups.
             self._selected_subgroups = self._selected_subgroups + 1
+            return quality_measure_value
         else: # If the quality measure is not greater or equal, increment the number of unselected subgroups.
             self._unselected_subgroups = self._unselected_subgroups + 1
+            return None
     
     # IMPORTANT: although the subgroup parameters TP and FP can be computed from 'pandas_dataframe', we also pass them by parameter in this method to avoid computing them twice (in the 'fit' method and in this method).
-    def _generate_subgroups_s1(self, pandas_dataframe : DataFrame, target : tuple[str, str], TP : int, FP : int) -> list[VerticalList]:
-        """Private method to generate the list of Vertical Lists of size 1 (i.e., whose list of selectors has only one selector), prune it and sort it.
+    def _generate_covers_of_the_selectors(self, pandas_dataframe : DataFrame, target_attribute : str) -> list[tuple[str, str, ndarray]]:
+        """Private method to generate the cover of each selector (i.e., each pair attribute-value) of the dataset, which does not depend on the target value.
         
         :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str') without missing values.
-        :param target: a tuple with 2 elements: the target attribute name and the target value.
-        :param TP: the true population of the dataset. IMPORTANT: although it can be computed from 'pandas_dataframe', we pass it by parameter to avoid computing it twice (in the 'fit' method and in this method).
-        :param FP: the false population of the dataset. IMPORTANT: although it can be computed from 'pandas_dataframe', we pass it by parameter to avoid computing it twice (in the 'fit' method and in this method).
+        :param target_attribute: the target attribute name (its column is not scanned).
+        :return: a list of tuples (attribute, value, cover), where the cover is the sorted numpy array with the indices of the registers in which the value appears. The values of each attribute are sorted.
+        """
+        result = []
+        # Iterate through the columns (except the target).
+        for column in pandas_dataframe.columns.drop(target_attribute):
+            # Encode the column as integer codes (the code of each value is its position in the sorted array of unique values).
+            codes, unique_values = factorize(pandas_dataframe[column], sort = True)
+            # All the covers of the column are obtained at once: the register indices are sorted by code (with a stable sort, so the indices of each code remain sorted) and split according to the number of registers of each code.
+            number_of_registers_per_code = bincount(codes, minlength = len(unique_values))
+            covers = split(codes.argsort(kind = "stable"), cumsum(number_of_registers_per_code)[:-1])
+            for value, registers in zip(unique_values, covers):
+                result.append( (column, value, registers) )
+        return result
+    
+    def _generate_subgroups_s1(self, covers_of_the_selectors : list[tuple[str, str, ndarray]], target_attribute_as_a_mask : ndarray, TP : int, FP : int) -> list[VerticalList]:
+        """Private method to generate the list of Vertical Lists of size 1 (i.e., whose list of selectors has only one selector), prune it and sort it.
+        
+        :param covers_of_the_selectors: the cover of each selector (see the method '_generate_covers_of_the_selectors').
+        :param target_attribute_as_a_mask: a boolean numpy array with one element per register: True if the value of the target attribute is equal to the target value and False otherwise.
+        :param TP: the true population of the dataset. IMPORTANT: although it can be computed from 'target_attribute_as_a_mask', we pass it by parameter to avoid computing it twice (in the 'fit' method and in this method).
+        :param FP: the false population of the dataset. IMPORTANT: although it can be computed from 'target_attribute_as_a_mask', we pass it by parameter to avoid computing it twice (in the 'fit' method and in this method).
         :return: a list in which each element is a Vertical List of size 1 (i.e., it only has one selector in its list of selectors). The list is pruned according to the threshold and sorted according to 'sort_criterion_in_s1' attribute.
         """
-        # Get the target column as a mask: True if the value is equal to the target value and False otherwise.
-        target_attribute_as_a_mask = (pandas_dataframe[target[0]] == target[1])
+        # In the implementations with python sets, the IDs of the dataset instances are the python ints of the attribute '_instance_ids' (instead of a new python int for each one in each set), so they are shared by the Vertical Lists of size 1 and by the Vertical Lists generated from them.
+        if (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_SETS) or (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_DIFFSETS):
+            self._instance_ids = list(range(TP+FP))
+        else:
+            self._instance_ids = None
+        instance_ids = self._instance_ids
         # Result.
         result = []
-        # Iterate through the columns (except the target).
-        for column in pandas_dataframe.columns.drop(target[0]):
-            # Use the 'groupby' method in order to group each value depending on whether appears with the target or not.
-            # - In this case, the property 'indices' is a dictionary in which the key is the tuple "(value, value)" and the
-            #   value is a sequence of register indices in which that combination appears.
-            values_and_target_grouped = pandas_dataframe.groupby([column, target_attribute_as_a_mask]).indices
-            # Set of values which have been already processed.
-            processed_values = set()
-            # Iterate through the tuples returned by the groupby method.
-            for value_target_tuple in values_and_target_grouped:
-                value = value_target_tuple[0]
-                # Process the tuple only if the value was not seen before.
-                if value not in processed_values:
-                    # Registers which have the target.
-                    try:
-                        registers_tp = values_and_target_grouped[(value,True)]
-                    except KeyError:
-                        registers_tp = [] # Empty sequence.
-                    # Registers which do not have the target.
-                    try:
-                        registers_fp = values_and_target_grouped[(value,False)]
-                    except KeyError:
-                        registers_fp = [] # Empty sequence.
-                    # Compute the optimistic estimate.
-                    dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : len(registers_tp), QualityMeasure.FALSE_POSITIVES : len(registers_fp), QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                    dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                    optimistic_estimate_value = self._optimistic_estimate.compute(dict_of_parameters)
-                    # Pruning: add the Vertical List only if the optimistic estimate value is greater or equal than the threshold.
-                    if optimistic_estimate_value >= self._oe_minimum_threshold:
-                        # Create the Vertical List (depending on the specified implementation).
-                        vl = None
-                        if (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_BITSETS):
-                            vl = VerticalListWithBitsets([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
-                        elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_SETS):
-                            vl = VerticalListWithSets([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
-                        # Add it to the final list.
-                        result.append(vl)
-                    # Finally, add the value to 'processed_values'.
-                    processed_values.add(value)
+        for column, value, registers in covers_of_the_selectors:
+            # Split the cover into the registers which have the target and the registers which do not have the target (both of them remain sorted).
+            registers_with_the_target = target_attribute_as_a_mask[registers]
+            registers_tp = registers[registers_with_the_target]
+            registers_fp = registers[~registers_with_the_target]
+            # Compute the optimistic estimate.
+            dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : len(registers_tp), QualityMeasure.FALSE_POSITIVES : len(registers_fp), QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+            dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
+            optimistic_estimate_value = self._optimistic_estimate.compute(dict_of_parameters)
+            # Pruning: add the Vertical List only if the optimistic estimate value is greater or equal than the threshold.
+            if optimistic_estimate_value >= self._oe_minimum_threshold:
+                # Create the Vertical List (depending on the specified implementation).
+                vl = None
+                if (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_BITSETS):
+                    vl = VerticalListWithBitsets([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_SETS):
+                    vl = VerticalListWithSets([Selector(column, Operator.EQUAL, value)], [instance_ids[i] for i in registers_tp.tolist()], [instance_ids[i] for i in registers_fp.tolist()], TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_WORD_ARRAYS):
+                    vl = VerticalListWithWordArrays([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_DIFFSETS):
+                    vl = VerticalListWithDiffsets([Selector(column, Operator.EQUAL, value)], [instance_ids[i] for i in registers_tp.tolist()], [instance_ids[i] for i in registers_fp.tolist()], TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_COMPRESSED_BITMAPS):
+                    vl = VerticalListWithCompressedBitmaps([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_SORTED_ARRAYS):
+                    # IMPORTANT: the arrays of the covers are sorted (and so are their parts), so they are not copied.
+                    vl = VerticalListWithSortedArrays([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_HYBRID_SEQUENCES):
+                    # IMPORTANT: the arrays of the covers are sorted (and so are their parts), so they are not copied if they are stored as sorted numpy arrays.
+                    vl = VerticalListWithHybridSequences([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                # Add it to the final list.
+                result.append(vl)
         # Sort by quality value (optimistic_estimate_value) according to 'sort_criterion_in_s1'.
         if (self._sort_criterion_in_s1 == VLSD.SORT_CRITERION_QUALITY_ASCENDING):
             result.sort(reverse=False, key=lambda x : x.quality_value)
         elif (self._sort_criterion_in_s1 == VLSD.SORT_CRITERION_QUALITY_DESCENDING):
             result.sort(reverse=True, key=lambda x : x.quality_value)
+        # If the Vertical Lists are implemented with word arrays, all their sequences are moved to the same word matrices in order to join them at once in the next level.
+        if (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_WORD_ARRAYS):
+            VerticalListWithWordArrays.share_word_matrices(result)
         # Return the list.
         return result
     
-    def _search(self, P : list[VerticalList], M : dict[Selector, dict[Selector, VerticalList]], target : tuple[str, str], TP : int, FP : int) -> None:
-        """Private search method.
+    def _search(self, stack : list[list], M : ndarray, selector_ids : dict[Selector, int], attribute_ids : list[int], target : tuple[str, str], TP : int, FP : int) -> Iterator[VerticalList]:
+        """Private search method. IMPORTANT: the search is made in depth-first order by means of an explicit stack (not by means of recursive calls), in which each frame is a list of Vertical Lists with the same size (i.e., a frontier) along with the position of the next one to process. This method is a generator which yields each generated Vertical List, which must be handled (see the method '_handle_individual_result') before continuing the search.
         
-        :param P: a list of Vertical Lists.
-        :param M: the 2-dimensional matrix M (in this case, it is a python dictionary).
+        :param stack: the stack of the search, in which each frame is a list with 3 elements: (1) a list of Vertical Lists with the same size, (2) the IDs of their last selectors (i.e., their rows and columns in M), and (3) the position of the next Vertical List to process. IMPORTANT: it is modified.
+        :param M: the 2-dimensional triangular matrix M with the optimistic estimate values of the Vertical Lists of size 2 (in this case, it is a 1-dimensional numpy array, see the function '_query_triangular_matrix'). IMPORTANT: its rows and columns are the IDs of the selectors.
+        :param selector_ids: python dictionary which contains the ID of each selector of the Vertical Lists of size 1 (i.e., its position in S1).
+        :param attribute_ids: the ID of the attribute of each selector of the Vertical Lists of size 1 (see the method '_generate_attribute_ids'). IMPORTANT: its indexes are the IDs of the selectors.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
         :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
+        :return: an iterator with the generated Vertical Lists.
         """
-        index_x = 0
-        # Main loop: while P list is not completely processed (the last element is never processed).
-        while (index_x < (len(P)-1)):
+        number_of_selectors = len(selector_ids)
+        s_xy_dict_of_parameters = {QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+        s_xy_dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
+        # In the closed mode, the last Vertical List of each frame is also processed, because it has to be handled.
+        number_of_unprocessed_vertical_lists = 0 if self._closed_only else 1
+        # If there is a memory limit, memory used by the pending Vertical Lists of each frame of the stack (in the same order), IDs of the prefixes already counted in each frame (see the 'memory_usage' method of the Vertical Lists) and scratch file in which the frames are spilled (see the method '_spill_frames').
+        memory_of_the_frames = None
+        ids_of_the_counted_prefixes_of_the_frames = None
+        if (self._memory_limit is not None):
+            ids_of_the_counted_prefixes_of_the_frames = [set() for _ in stack]
+            memory_of_the_frames = [VLSD._memory_of_the_frame(frame, ids_of_the_counted_prefixes) for frame, ids_of_the_counted_prefixes in zip(stack, ids_of_the_counted_prefixes_of_the_frames)]
+        scratch_file = None
+        # The IDs of the dataset instances are only stored as persistent IDs if they are the python ints of the attribute '_instance_ids' (see the class '_SpillPickler').
+        number_of_instance_ids = 0 if (self._instance_ids is None) else len(self._instance_ids)
+        # Main loop: while the stack is not empty.
+        while stack:
+            # At this point, all the generated Vertical Lists have been handled, so the state of the search can be saved.
+            if (self._checkpoint_context is not None):
+                self._save_checkpoint_if_needed(stack)
+            frame = stack[-1]
+            # If the pending Vertical Lists of the frame were spilled, they are loaded again. IMPORTANT: they are always at the end of the scratch file (the frames are spilled from the bottom of the stack), so the file is truncated.
+            if type(frame[0]) is tuple:
+                position_in_the_scratch_file, number_of_spilled_vertical_lists, referenced_objects = frame[0]
+                scratch_file.seek(position_in_the_scratch_file)
+                # IMPORTANT: each Vertical List is loaded by means of a new unpickler, because the memo of the pickler was cleared after each one (see the class '_SpillPickler').
+                frame[0] = [_SpillUnpickler(scratch_file, referenced_objects, self._instance_ids).load() for _ in range(number_of_spilled_vertical_lists)]
+                scratch_file.truncate(position_in_the_scratch_file)
+                ids_of_the_counted_prefixes_of_the_frames[-1] = set()
+                memory_of_the_frames[-1] = VLSD._memory_of_the_frame(frame, ids_of_the_counted_prefixes_of_the_frames[-1])
+            P, ids_of_the_last_selectors, index_x = frame
+            # If the frame is completely processed (the last element is never processed, except in the closed mode) or its Vertical Lists cannot be extended because of the maximum depth, it is removed from the stack (and its memory is released).
+            if (index_x >= (len(P)-number_of_unprocessed_vertical_lists)) or ((self._max_depth is not None) and (len(P[index_x].list_of_selectors) >= self._max_depth)):
+                stack.pop()
+                if (memory_of_the_frames is not None):
+                    memory_of_the_frames.pop()
+                    ids_of_the_counted_prefixes_of_the_frames.pop()
+                continue
             s_x = P[index_x]
             # Simulate the "pop_first" method.
             # --> IMPORTANT: we set None instead of directly delete the first element, because deleting an element that is not the last
             #     in a python list is O(n), because all the elements at the right of the deleted element are moved one position to the left.
             P[index_x] = None
             index_x = index_x + 1
-            # Get the last selector of s_x.
-            s_x_last_selector = s_x.list_of_selectors[-1]
+            frame[2] = index_x
+            # In the closed mode, s_x might have been removed because it has the same cover as a previous Vertical List of the frame.
+            if s_x is None:
+                continue
+            # The prefix of s_x is shared by the rest of the frame, so only the memory of its own sequences is released (the Vertical Lists of size 1 are not counted).
+            if (memory_of_the_frames is not None) and (len(s_x.list_of_selectors) > 1):
+                memory_of_the_frames[-1] = memory_of_the_frames[-1] - s_x.memory_usage(ids_of_the_counted_prefixes_of_the_frames[-1])
+            # In the top-k mode, the threshold might have been raised after generating s_x, so none of its refinements could be good enough.
+            if s_x.quality_value < self._current_oe_minimum_threshold:
+                continue
+            # Get the ID of the last selector of s_x (and the ID of its attribute).
+            s_x_last_selector_id = ids_of_the_last_selectors[index_x-1]
+            s_x_last_attribute_id = attribute_ids[s_x_last_selector_id]
+            # Nodes to the right of s_x whose join with s_x could have quality enough according to M.
+            nodes_to_join = []
+            positions_of_the_nodes_to_join = []
+            for index_y in range(index_x, len(P)): # In this case, it is not index_x+1 because the index was already increased.
+                # The last selectors of s_x and s_y cannot have the same attribute, because their join would be empty. Otherwise, query M (using the ID of the last selector of s_y).
+                if (P[index_y] is not None) and (attribute_ids[ids_of_the_last_selectors[index_y]] != s_x_last_attribute_id) and (_query_triangular_matrix(M, number_of_selectors, s_x_last_selector_id, ids_of_the_last_selectors[index_y]) >= self._current_oe_minimum_threshold):
+                    nodes_to_join.append(P[index_y])
+                    positions_of_the_nodes_to_join.append(index_y)
             # List in which the children will be stored.
             V = []
-            # Join between s_x and each node to its right.
-            for index_y in range(index_x, len(P)): # In this case, it is not index_x+1 because the index was already increased.
-                s_y = P[index_y]
-                # Get the last selector of s_y.
-                s_y_last_selector = s_y.list_of_selectors[-1]
-                # Query M.
-                vertical_list_in_M = _query_triangular_matrix(M, s_x_last_selector, s_y_last_selector)
-                if (vertical_list_in_M is not None) and (vertical_list_in_M.quality_value >= self.oe_minimum_threshold):
-                    s_xy_dict_of_parameters = {QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                    s_xy_dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                    s_xy = s_x.join(s_y, self._optimistic_estimate, s_xy_dict_of_parameters, return_None_if_n_is_0 = True)
-                    if (s_xy is not None) and (s_xy.quality_value >= self.oe_minimum_threshold):
+            # In the closed mode, list with the last selectors of the nodes whose join with s_x has the same cover as s_x (i.e., the selectors which are added to the description of s_x).
+            selectors_of_the_closure = []
+            # Join between s_x and each one of those nodes (all at once, if the implementation of the Vertical Lists allows it).
+            if nodes_to_join:
+                for index_y, s_xy in zip(positions_of_the_nodes_to_join, s_x.join_with_many(nodes_to_join, self._optimistic_estimate, s_xy_dict_of_parameters, return_None_if_n_is_0 = True, minimum_quality_value = self._current_oe_minimum_threshold)):
+                    if (s_xy is not None):
+                        # In the closed mode, if s_xy has the same cover as s_x (i.e., the same tp and fp, because it is a subset), its selector is added to the closure of s_x instead of generating a new node.
+                        if self._closed_only and (s_xy.tp == s_x.tp) and (s_xy.fp == s_x.fp):
+                            selectors_of_the_closure.append(s_xy.list_of_selectors[-1])
+                            # If s_y also has the same cover, all its refinements have the same cover as when adding the selector of s_x, so they are not closed and s_y is removed from the frame.
+                            if (s_xy.tp == P[index_y].tp) and (s_xy.fp == P[index_y].fp):
+                                P[index_y] = None
+                            continue
                         # Add s_xy to V list.
                         V.append(s_xy)
-                        # Handle this result.
-                        self._handle_individual_result( (s_xy, target, TP, FP) )
+                        # This result is handled before continuing (in the closed mode, when it is extended).
+                        if not self._closed_only:
+                            yield s_xy
+            if self._closed_only:
+                # The selectors of the closure are added to the description of s_x and of all its refinements (before their last selector, which is used to query M). IMPORTANT: the lists of selectors of the Vertical Lists generated by a join are not shared.
+                if selectors_of_the_closure:
+                    s_x.list_of_selectors.extend(selectors_of_the_closure)
+                    for s_xy in V:
+                        s_xy.list_of_selectors[-1:-1] = selectors_of_the_closure
+                # s_x is handled only if it is not a subset of a closed subgroup with the same cover which was already handled.
+                if self._add_to_closed_subgroups(s_x):
+                    yield s_x
             # Check whether V is not empty.
             if V:
                 # Sort by quality value (optimistic_estimate_value) according to 'sort_criterion_in_other_sizes'.
@@ -325,10 +772,127 @@ class VLSD(Algorithm):
                     V.sort(reverse=False, key=lambda x : x.quality_value)
                 elif (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_DESCENDING):
                     V.sort(reverse=True, key=lambda x : x.quality_value)
-                self._search(V, M, target, TP, FP)
+                # The children are processed before the rest of the current frame (i.e., depth-first order).
+                stack.append( [V, [selector_ids[s.list_of_selectors[-1]] for s in V], 0] )
+                # If the memory limit is exceeded, some frames are spilled to the scratch file. IMPORTANT: the new frame is never spilled, so the frames are not spilled if the rest of them do not exceed half of the limit (otherwise, a frame which alone exceeds the limit would cause a spill after each push).
+                if (memory_of_the_frames is not None):
+                    ids_of_the_counted_prefixes_of_the_frames.append(set())
+                    memory_of_the_frames.append( sum(s.memory_usage(ids_of_the_counted_prefixes_of_the_frames[-1]) for s in V) )
+                    total_memory = sum(memory_of_the_frames)
+                    if (total_memory > self._memory_limit) and ((total_memory - memory_of_the_frames[-1]) > (self._memory_limit // 2)):
+                        # IMPORTANT: these variables must not keep alive the Vertical Lists of the spilled frames, because they would not be released (and they would be duplicated when loaded again).
+                        nodes_to_join = None
+                        s_xy = None
+                        scratch_file = self._spill_frames(stack, memory_of_the_frames, number_of_instance_ids, scratch_file)
+        # The scratch file is removed when it is closed.
+        if scratch_file is not None:
+            scratch_file.close()
     
-    def fit(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
-        """Main method to run the VLSD algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+    @staticmethod
+    def _memory_of_the_frame(frame : list, ids_of_the_counted_prefixes : set[int]) -> int:
+        """Private method to compute the memory used by the sequences of the pending Vertical Lists of a frame of the stack of the search (see the method '_search'). The Vertical Lists of size 1 (i.e., the first frame in the closed mode) are not counted, because they are kept alive by S1.
+        
+        :param frame: the frame.
+        :param ids_of_the_counted_prefixes: python set in which the IDs of the prefixes counted in the frame are stored (see the 'memory_usage' method of the Vertical Lists). IMPORTANT: it is modified.
+        :return: the number of bytes.
+        """
+        return sum(s.memory_usage(ids_of_the_counted_prefixes) for s in frame[0][frame[2]:] if (s is not None) and (len(s.list_of_selectors) > 1))
+    
+    def _spill_frames(self, stack : list[list], memory_of_the_frames : list[int], number_of_instance_ids : int, scratch_file : Union[BinaryIO, None]) -> BinaryIO:
+        """Private method to spill the pending Vertical Lists of the frames of the stack of the search to the scratch file, from the bottom of the stack (i.e., from the frames which will be processed later), until the memory is not greater than half of the memory limit (so that the frames are not spilled again after each push). The last frame (i.e., the next one to be processed) is never spilled. The pending Vertical Lists of a spilled frame are replaced by a tuple with their position in the scratch file, their number and the objects referenced by them (see the class '_SpillPickler'), and its IDs and its position are updated accordingly. IMPORTANT: the parameters 'stack' and 'memory_of_the_frames' are modified.
+        
+        :param stack: the stack of the search (see the method '_search').
+        :param memory_of_the_frames: the memory used by the pending Vertical Lists of each frame of the stack.
+        :param number_of_instance_ids: the integers lower than this number are stored as IDs of dataset instances (see the class '_SpillPickler').
+        :param scratch_file: the scratch file, or None if it has not been created yet.
+        :return: the scratch file.
+        """
+        if scratch_file is None:
+            scratch_file = TemporaryFile(buffering=0)
+        total_memory = sum(memory_of_the_frames)
+        low_water_mark = self._memory_limit // 2
+        for index in range(len(stack)-1):
+            if total_memory <= low_water_mark:
+                break
+            frame = stack[index]
+            # Frames already spilled or without pending Vertical Lists are skipped.
+            if (type(frame[0]) is tuple) or (memory_of_the_frames[index] == 0):
+                continue
+            # The Vertical Lists are written directly in the scratch file (i.e., without building their serialization in memory) and one by one, so the buffer of the pickler only has to hold one of them (not the whole frame).
+            pending_vertical_lists = frame[0][frame[2]:]
+            position_in_the_scratch_file = scratch_file.seek(0, SEEK_END)
+            pickler = _SpillPickler(scratch_file, pending_vertical_lists, number_of_instance_ids)
+            for vertical_list in pending_vertical_lists:
+                pickler.dump(vertical_list)
+            frame[0] = (position_in_the_scratch_file, len(pending_vertical_lists), pickler.referenced_objects)
+            # IMPORTANT: the local references are removed, so that the spilled Vertical Lists are released before spilling the next frame.
+            del pickler, pending_vertical_lists, vertical_list
+            frame[1] = frame[1][frame[2]:]
+            frame[2] = 0
+            total_memory = total_memory - memory_of_the_frames[index]
+            memory_of_the_frames[index] = 0
+        return scratch_file
+    
+    def _add_to_closed_subgroups(self, vertical_list : VerticalList) -> bool:
+        """Private method to add a subgroup to the closed subgroups already handled (closed mode), only if its description is not a subset of the description of one of them with the same tp and fp (i.e., with the same cover).
+        
+        :param vertical_list: the Vertical List of the subgroup.
+        :return: whether the subgroup has been added.
+        """
+        description = frozenset(vertical_list.list_of_selectors)
+        list_of_descriptions = self._descriptions_of_the_closed_subgroups.setdefault( (vertical_list.tp, vertical_list.fp), [] )
+        for other_description in list_of_descriptions:
+            if description <= other_description:
+                return False
+        list_of_descriptions.append(description)
+        return True
+    
+    def _search_branch(self, index : int, S1 : list[VerticalList], M : ndarray, selector_ids : dict[Selector, int], attribute_ids : list[int], target : tuple[str, str], TP : int, FP : int) -> Iterator[VerticalList]:
+        """Private method to search the branch which starts with the Vertical List S1[index] (i.e., all the Vertical Lists whose first selector is the selector of S1[index]). This method is a generator which yields each generated Vertical List, which must be handled (see the method '_handle_individual_result') before continuing the search.
+        
+        :param index: the index in S1 of the Vertical List from which the branch starts.
+        :param S1: the list of Vertical Lists of size 1.
+        :param M: the 2-dimensional triangular matrix M with the optimistic estimate values of the Vertical Lists of size 2 (in this case, it is a 1-dimensional numpy array, see the function '_query_triangular_matrix'). IMPORTANT: its rows and columns are the IDs of the selectors.
+        :param selector_ids: python dictionary which contains the ID of each selector of the Vertical Lists of size 1 (i.e., its position in S1).
+        :param attribute_ids: the ID of the attribute of each selector of the Vertical Lists of size 1 (see the method '_generate_attribute_ids'). IMPORTANT: its indexes are the IDs of the selectors.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
+        :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
+        :return: an iterator with the generated Vertical Lists.
+        """
+        # Only if the Vertical Lists of size 1 can be extended.
+        if (self._max_depth is not None) and (self._max_depth < 2):
+            return
+        s_x = S1[index]
+        # In the top-k mode, the threshold might have been raised after generating s_x, so none of its refinements could be good enough.
+        if s_x.quality_value < self._current_oe_minimum_threshold:
+            return
+        # The Vertical Lists of size 2 of this branch are not stored in M, so they are generated again (only the joins with a selector of another attribute whose optimistic estimate value in M is enough).
+        nodes_to_join = []
+        for index_y in range(index+1, len(S1)):
+            if (attribute_ids[index_y] != attribute_ids[index]) and (_query_triangular_matrix(M, len(S1), index, index_y) >= self._current_oe_minimum_threshold):
+                nodes_to_join.append(S1[index_y])
+        if nodes_to_join:
+            s_xy_dict_of_parameters = {QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+            s_xy_dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
+            P = [s_xy for s_xy in s_x.join_with_many(nodes_to_join, self._optimistic_estimate, s_xy_dict_of_parameters, return_None_if_n_is_0 = True, minimum_quality_value = self._current_oe_minimum_threshold) if s_xy is not None]
+            # Sort by quality value (optimistic_estimate_value) according to 'sort_criterion_in_other_sizes'.
+            if (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_ASCENDING):
+                P.sort(reverse=False, key=lambda x : x.quality_value)
+            elif (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_DESCENDING):
+                P.sort(reverse=True, key=lambda x : x.quality_value)
+            # Each individual result is handled before continuing.
+            for s in P:
+                yield s
+            # Only if the Vertical Lists of size 2 can be extended.
+            if (self._max_depth is None) or (self._max_depth > 2):
+                stack = [ [P, [selector_ids[s.list_of_selectors[-1]] for s in P], 0] ]
+                # IMPORTANT: the local reference to the Vertical Lists of size 2 is removed, so that they can be released if their frame is spilled (see the parameter 'memory_limit').
+                del P
+                yield from self._search(stack, M, selector_ids, attribute_ids, target, TP, FP)
+    
+    def _check_dataset_and_target(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
+        """Private method to check the dataset and the target passed to the methods which run the VLSD algorithm.
         
         :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
@@ -341,55 +905,305 @@ class VLSD(Algorithm):
         for column in pandas_dataframe.columns:
             if not is_string_dtype(pandas_dataframe[column]):
                 raise DatasetAttributeTypeError("Error in attribute '" + str(column) + "'. This algorithm only supports nominal attributes (i.e., type 'str').")
-        # Open the file if the path is not None.
-        if (self._file_path is not None):
-            self._file = open(self._file_path, "w")
-        # Obtain TP and FP of the dataset.
-        TP = sum(pandas_dataframe[target[0]] == target[1])
-        FP = len(pandas_dataframe.index) - TP
-        # Get the list of Vertical Lists of size 1 (i.e., only one selector in their lists of selectors).
-        S1 = self._generate_subgroups_s1(pandas_dataframe, target, TP, FP)
-        # Handle each individual result.
-        for s in S1:
-            self._handle_individual_result( (s, target, TP, FP) )
-        # Create 2-dimensional empty matrix M (in this case, it is a python dictionary).
-        M = dict()
+    
+    @staticmethod
+    def _generate_attribute_ids(S1 : list[VerticalList]) -> list[int]:
+        """Private method to generate the ID of the attribute of each selector of the Vertical Lists of size 1. Two selectors with the same attribute (i.e., with the same ID) never appear together in a subgroup, because the attributes only have one value per instance, so their joins are skipped without computing them.
+        
+        :param S1: the list of Vertical Lists of size 1.
+        :return: a list with the ID of the attribute of the selector of each Vertical List of size 1 (in the same order as S1).
+        """
+        ids_of_the_attributes = dict()
+        return [ids_of_the_attributes.setdefault(s.list_of_selectors[-1].attribute_name, len(ids_of_the_attributes)) for s in S1]
+    
+    def _generate_triangular_matrix_M(self, S1 : list[VerticalList], TP : int, FP : int) -> ndarray:
+        """Private method to generate the 2-dimensional triangular matrix M with the optimistic estimate values of the Vertical Lists of size 2.
+        
+        :param S1: the list of Vertical Lists of size 1.
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        :return: the triangular matrix M (in this case, it is a 1-dimensional numpy array with the elements above the main diagonal, see the function '_query_triangular_matrix'). IMPORTANT: its rows and columns are the positions in S1.
+        """
+        # M only stores the optimistic estimate value of each Vertical List of size 2 (or -inf if n is 0, if it was pruned or if both selectors have the same attribute), not the Vertical List, in order to save memory.
+        M = full( (len(S1) * (len(S1)-1)) // 2, -inf )
+        # M is not needed if the Vertical Lists of size 1 cannot be extended.
+        if (self._max_depth is not None) and (self._max_depth < 2):
+            return M
         # Double iteration through S1.
+        s_xy_dict_of_parameters = {QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+        s_xy_dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
+        attribute_ids = VLSD._generate_attribute_ids(S1)
+        # Position in M of the first element of the current row.
+        position_in_M = 0
         for index_x in range(len(S1)): # From 0 to len(S1)-1.
             s_x = S1[index_x]
-            # Get the last selector of s_x. In this point, there is only one.
-            s_x_last_selector = s_x.list_of_selectors[-1]
-            for index_y in range(index_x+1, len(S1)): # IMPORTANT: x < y ==> From x+1 to len(S1)-1.
-                s_y = S1[index_y]
-                # Get the last selector of s_y. In this point, there is only one.
-                s_y_last_selector = s_y.list_of_selectors[-1]
-                # Get the quality value of the join of s_x and s_y.
-                s_xy_dict_of_parameters = {QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                s_xy_dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                s_xy = s_x.join(s_y, self._optimistic_estimate, s_xy_dict_of_parameters, return_None_if_n_is_0 = True)
-                # Check whether n (i.e., tp+fp) is 0 or greater than 0 (in this case, 's_xy' will be None) and whether 's_xy' has quality enough.
-                if (s_xy is not None) and (s_xy.quality_value >= self._oe_minimum_threshold):
-                    # Add to the dictionary.
-                    if s_x_last_selector not in M:
-                        M[s_x_last_selector] = dict()
-                    # ---> IMPORTANT: M[s_x_last_selector][s_y_last_selector] is equal to M[s_y_last_selector][s_x_last_selector], but only one entry is added (to save memory). This will have to be kept in mind later.
-                    M[s_x_last_selector][s_y_last_selector] = s_xy
-        # Iterate through the Vertical Lists of size 2 and call to search method.
-        for index in range(len(S1)-1): # From 0 to len(S1)-2.
-            selector_i = S1[index].list_of_selectors[-1]
-            if (selector_i in M):
-                # Get all the values (in this case, Vertical Lists) from the corresponding dictionary.
-                P = list(M[selector_i].values())
-                # Sort by quality value (optimistic_estimate_value) according to 'sort_criterion_in_other_sizes'.
-                if (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_ASCENDING):
-                    P.sort(reverse=False, key=lambda x : x.quality_value)
-                elif (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_DESCENDING):
-                    P.sort(reverse=True, key=lambda x : x.quality_value)
-                # Handle each individual result.
-                for s in P:
-                    self._handle_individual_result( (s, target, TP, FP) )
-                self._search(P, M, target, TP, FP)
+            # Join s_x with all the Vertical Lists to its right (IMPORTANT: x < y ==> From x+1 to len(S1)-1) whose selector has another attribute (the rest are always empty).
+            # - If n (i.e., tp+fp) is 0 or if the quality value is not enough, the corresponding element will be None.
+            # ---> IMPORTANT: M[x][y] is equal to M[y][x], but only one entry is stored (to save memory). This will have to be kept in mind later.
+            positions_of_the_nodes_to_join = [index_y for index_y in range(index_x+1, len(S1)) if attribute_ids[index_y] != attribute_ids[index_x]]
+            if positions_of_the_nodes_to_join:
+                for index_y, s_xy in zip(positions_of_the_nodes_to_join, s_x.join_with_many([S1[index_y] for index_y in positions_of_the_nodes_to_join], self._optimistic_estimate, s_xy_dict_of_parameters, return_None_if_n_is_0 = True, minimum_quality_value = self._current_oe_minimum_threshold)):
+                    if (s_xy is not None):
+                        M[position_in_M + index_y - index_x - 1] = s_xy.quality_value
+            position_in_M = position_in_M + len(S1) - index_x - 1
+        return M
+    
+    def fit(self, pandas_dataframe : DataFrame, target : tuple[str, Union[str, list[str]]], resume_from : Union[str, None] = None) -> None:
+        """Main method to run the VLSD algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        
+        :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        :param target: a tuple with 2 elements: the target attribute name and the target value. The target value can also be a list of target values of the same target attribute (multi-target mode). In that case, the covers of the selectors are generated only once (i.e., the dataset is scanned only once) and shared by all the target values, and the search is run for each target value, one after another, in the order of the list (i.e., the results of each target value are written in the file after the results of the previous one).
+        :param resume_from: if it is not None, path of a checkpoint file (see the 'checkpoint_path' parameter) from which the search is resumed. In that case, the dataset, the target and the configuration of the algorithm must be the same as those of the interrupted execution, and the file of results of that execution is truncated and continued. The final results are the same as those of an uninterrupted execution (in the top-k mode and in the closed mode with the Vertical Lists implemented with python sets or diffsets, the elements of the sequences of instances of the subgroups restored from the checkpoint might be written in a different order, because those sets are rebuilt). IMPORTANT: this is only supported in the sequential execution (i.e., 'n_jobs' must be 1) and not in the multi-target mode. By default, None.
+        """
+        self._check_dataset_and_target(pandas_dataframe, target)
+        if ((type(resume_from) is not str) and (resume_from is not None)):
+            raise TypeError("The type of the parameter 'resume_from' must be 'str' or 'NoneType'.")
+        if (resume_from is not None) and (self._n_jobs != 1):
+            raise ValueError("Resuming from a checkpoint is only supported in the sequential execution, so if the parameter 'resume_from' is not None, the parameter 'n_jobs' must be 1.")
+        # Multi-target mode.
+        if type(target[1]) is list:
+            if not target[1]:
+                raise ValueError("The list of target values must not be empty.")
+            if any(type(target_value) is not str for target_value in target[1]):
+                raise TypeError("The type of all the elements of the list of target values must be 'str'.")
+            if (resume_from is not None) or (self._checkpoint_path is not None):
+                raise ValueError("Checkpoints are not supported in the multi-target mode.")
+            list_of_targets = [(target[0], target_value) for target_value in target[1]]
+        else:
+            list_of_targets = [target]
+        # Get the cover of each selector (it does not depend on the target value, so it is shared by all of them).
+        covers_of_the_selectors = self._generate_covers_of_the_selectors(pandas_dataframe, target[0])
+        if (resume_from is None):
+            # Open the file if the path is not None.
+            if (self._file_path is not None):
+                self._file = open(self._file_path, "w")
+            # The best k subgroups and the threshold for the optimistic estimate of a previous execution are discarded.
+            self._k_subgroups = []
+            self._number_of_subgroups_added_to_k_subgroups = 0
+            self._current_oe_minimum_threshold = self._oe_minimum_threshold
+        self._k_subgroups_of_the_previous_targets = []
+        for current_target in list_of_targets:
+            # In the multi-target mode, the best k subgroups and the threshold for the optimistic estimate are independent for each target value.
+            if (current_target is not list_of_targets[0]):
+                self._k_subgroups_of_the_previous_targets.extend( [(element[2], element[0]) for element in sorted(self._k_subgroups, reverse=True)] )
+                self._k_subgroups = []
+                self._number_of_subgroups_added_to_k_subgroups = 0
+                self._current_oe_minimum_threshold = self._oe_minimum_threshold
+            self._fit_target(pandas_dataframe, current_target, covers_of_the_selectors, resume_from)
         # Close the file if it was opened before.
         if (self._file_path is not None):
             self._file.close()
             self._file = None
+        # The search has finished, so the checkpoint is not needed anymore.
+        if (self._checkpoint_path is not None):
+            try:
+                remove(self._checkpoint_path)
+            except FileNotFoundError:
+                pass
+    
+    def _fit_target(self, pandas_dataframe : DataFrame, target : tuple[str, str], covers_of_the_selectors : list[tuple[str, str, ndarray]], resume_from : Union[str, None]) -> None:
+        """Private method to run the VLSD algorithm for one target value. IMPORTANT: the file of results (if any) must be already opened, and the best k subgroups and the threshold for the optimistic estimate must be already initialized.
+        
+        :param pandas_dataframe: the DataFrame which is scanned.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param covers_of_the_selectors: the cover of each selector (see the method '_generate_covers_of_the_selectors').
+        :param resume_from: if it is not None, path of a checkpoint file from which the search is resumed.
+        """
+        # Get the target column as a mask: True if the value is equal to the target value and False otherwise.
+        target_attribute_as_a_mask = (pandas_dataframe[target[0]] == target[1]).to_numpy()
+        # Obtain TP and FP of the dataset.
+        TP = int(target_attribute_as_a_mask.sum())
+        FP = len(pandas_dataframe.index) - TP
+        # Get the list of Vertical Lists of size 1 (i.e., only one selector in their lists of selectors).
+        S1 = self._generate_subgroups_s1(covers_of_the_selectors, target_attribute_as_a_mask, TP, FP)
+        self._descriptions_of_the_closed_subgroups = dict()
+        if (resume_from is None):
+            # Handle each individual result (in the closed mode, they are handled during the search).
+            if not self._closed_only:
+                for s in S1:
+                    self._handle_individual_result( (s, target, TP, FP) )
+            M = None
+            first_branch = 0
+            stack = None
+        else:
+            # The Vertical Lists of size 1 were already handled in the interrupted execution.
+            state = self._load_checkpoint(resume_from, S1, TP, FP)
+            M = state["M"]
+            first_branch = state["branch_index"]
+            stack = state["stack"]
+            # The results written after the checkpoint are discarded, because they are generated again.
+            if (self._file_path is not None):
+                self._file = open(self._file_path, "r+")
+                self._file.seek(state["file_position"])
+                self._file.truncate()
+        # Iterate through the Vertical Lists of size 2 and call to search method.
+        if (self._n_jobs == 1) or (len(S1) < 3):
+            if (self._checkpoint_path is not None):
+                if M is None:
+                    M = self._generate_triangular_matrix_M(S1, TP, FP)
+                self._checkpoint_context = {"selectors" : [s.list_of_selectors[-1] for s in S1], "selector_ids" : {S1[index].list_of_selectors[-1] : index for index in range(len(S1))}, "M" : M, "TP" : TP, "FP" : FP, "branch_index" : first_branch}
+                self._time_of_the_last_checkpoint = monotonic()
+            try:
+                for vertical_list in self._search_branches(S1, target, TP, FP, M, first_branch, stack):
+                    self._handle_individual_result( (vertical_list, target, TP, FP) )
+            finally:
+                self._checkpoint_context = None
+        else:
+            # The ID of each selector is the position of its Vertical List in S1.
+            selector_ids = {S1[index].list_of_selectors[-1] : index for index in range(len(S1))}
+            attribute_ids = VLSD._generate_attribute_ids(S1)
+            # Create 2-dimensional triangular matrix M.
+            M = self._generate_triangular_matrix_M(S1, TP, FP)
+            # Each branch is searched in a worker process (S1 and M are only read there). The configuration is sent without the file, because the results are written by this process.
+            vlsd_for_workers = copy(self)
+            vlsd_for_workers._file = None
+            with ProcessPoolExecutor(max_workers=self._n_jobs, initializer=_initialize_worker, initargs=(vlsd_for_workers, S1, M, selector_ids, attribute_ids, target, TP, FP)) as executor:
+                # IMPORTANT: the 'map' method returns the results in the same order as the branches, so the final results are merged deterministically.
+                for written_results, selected_subgroups, unselected_subgroups, k_subgroups in executor.map(_search_branch_in_worker, range(len(S1)-1)):
+                    if (self._file_path is not None):
+                        self._file.write(written_results)
+                    self._selected_subgroups = self._selected_subgroups + selected_subgroups
+                    self._unselected_subgroups = self._unselected_subgroups + unselected_subgroups
+                    # In the top-k mode, the best k subgroups of the branch are merged with the current ones (in the order in which they were added in the worker process).
+                    for element in sorted(k_subgroups, key=lambda x : x[1]):
+                        self._add_to_k_subgroups(element)
+        # In the top-k mode, write the best k subgroups (sorted descending by quality value).
+        if (self._num_subgroups > 0) and (self._file_path is not None):
+            for element in sorted(self._k_subgroups, reverse=True):
+                self._write_individual_result(element[3], element[2], element[0], TP, FP)
+    
+    def _search_branches(self, S1 : list[VerticalList], target : tuple[str, str], TP : int, FP : int, M : Union[ndarray, None] = None, first_branch : int = 0, stack : Union[list[list], None] = None) -> Iterator[VerticalList]:
+        """Private method to search sequentially all the branches of the search space (i.e., one per Vertical List of size 1). This method is a generator which yields each generated Vertical List, which must be handled (see the method '_handle_individual_result') before continuing the search. IMPORTANT: the Vertical Lists of size 1 must have been handled before starting this generator.
+        
+        :param S1: the list of Vertical Lists of size 1.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        :param M: the 2-dimensional triangular matrix M (see the method '_generate_triangular_matrix_M'). If None, it is generated when the generator is started. By default, None.
+        :param first_branch: the index in S1 of the Vertical List from which the first branch searched starts. By default, 0.
+        :param stack: if it is not None and it is not empty, the stack of the search in the middle of the first branch (see the method '_search'), which is continued instead of starting that branch. By default, None.
+        :return: an iterator with the generated Vertical Lists.
+        """
+        # The ID of each selector is the position of its Vertical List in S1.
+        selector_ids = {S1[index].list_of_selectors[-1] : index for index in range(len(S1))}
+        attribute_ids = VLSD._generate_attribute_ids(S1)
+        # Create 2-dimensional triangular matrix M.
+        if M is None:
+            M = self._generate_triangular_matrix_M(S1, TP, FP)
+        if (self._checkpoint_context is not None):
+            self._checkpoint_context["branch_index"] = first_branch
+        # In the closed mode, the Vertical Lists of size 1 are handled and extended in the same way as the rest, so the search starts with them in the stack (not with a branch per each one).
+        if self._closed_only:
+            if stack is None:
+                stack = [ [S1.copy(), list(range(len(S1))), 0] ]
+            yield from self._search(stack, M, selector_ids, attribute_ids, target, TP, FP)
+            return
+        # Continue the first branch from its stack.
+        if stack:
+            yield from self._search(stack, M, selector_ids, attribute_ids, target, TP, FP)
+            first_branch = first_branch + 1
+        for index in range(first_branch, len(S1)-1): # From first_branch to len(S1)-2.
+            # At this point, all the generated Vertical Lists have been handled, so the state of the search can be saved (this branch has not been started yet).
+            if (self._checkpoint_context is not None):
+                self._checkpoint_context["branch_index"] = index
+                self._save_checkpoint_if_needed([])
+            yield from self._search_branch(index, S1, M, selector_ids, attribute_ids, target, TP, FP)
+    
+    def _configuration_for_checkpoints(self) -> tuple:
+        """Private method to obtain the configuration of the VLSD algorithm which must be the same in order to resume the search from a checkpoint.
+        
+        :return: a tuple with the configuration.
+        """
+        return (self._quality_measure.get_name(), self._q_minimum_threshold, self._optimistic_estimate.get_name(), self._oe_minimum_threshold, self._additional_parameters_for_the_quality_measure, self._additional_parameters_for_the_optimistic_estimate, self._sort_criterion_in_s1, self._sort_criterion_in_other_sizes, self._vertical_lists_implementation, self._file_path is not None, self._num_subgroups, self._max_depth, self._closed_only)
+    
+    def _save_checkpoint_if_needed(self, stack : list[list]) -> None:
+        """Private method to save the state of the search in the checkpoint file if at least 'checkpoint_interval' seconds have passed since the last checkpoint. IMPORTANT: all the generated Vertical Lists must have been handled.
+        
+        :param stack: the stack of the search in the current branch (see the method '_search'). If it is empty, the current branch has not been started yet.
+        """
+        if (monotonic() - self._time_of_the_last_checkpoint) < self._checkpoint_interval:
+            return
+        context = self._checkpoint_context
+        # Position in the file of results (everything after it is discarded when the search is resumed).
+        file_position = None
+        if self._file is not None:
+            self._file.flush()
+            file_position = self._file.tell()
+        header = {"version" : _CHECKPOINT_FORMAT_VERSION, "configuration" : self._configuration_for_checkpoints(), "selectors" : context["selectors"], "TP" : context["TP"], "FP" : context["FP"]}
+        state = {"branch_index" : context["branch_index"], "stack" : stack, "M" : context["M"], "selected_subgroups" : self._selected_subgroups, "unselected_subgroups" : self._unselected_subgroups, "k_subgroups" : self._k_subgroups, "number_of_subgroups_added_to_k_subgroups" : self._number_of_subgroups_added_to_k_subgroups, "current_oe_minimum_threshold" : self._current_oe_minimum_threshold, "descriptions_of_the_closed_subgroups" : self._descriptions_of_the_closed_subgroups, "file_position" : file_position}
+        # The checkpoint is written in a temporary file which replaces the previous one, so a valid checkpoint always exists even if the process is stopped while writing.
+        temporary_path = self._checkpoint_path + ".tmp"
+        with open(temporary_path, "wb") as checkpoint_file:
+            dump(header, checkpoint_file, protocol=HIGHEST_PROTOCOL)
+            _CheckpointPickler(checkpoint_file, context["selector_ids"]).dump(state)
+        replace(temporary_path, self._checkpoint_path)
+        self._time_of_the_last_checkpoint = monotonic()
+    
+    def _load_checkpoint(self, checkpoint_path : str, S1 : list[VerticalList], TP : int, FP : int) -> dict:
+        """Private method to load the state of the search from a checkpoint file. The counters, the best k subgroups and the threshold for the optimistic estimate are restored in this object.
+        
+        :param checkpoint_path: the path of the checkpoint file.
+        :param S1: the list of Vertical Lists of size 1 (generated again from the dataset).
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        :return: python dictionary with the rest of the state: the matrix M ('M'), the current branch ('branch_index'), its stack ('stack') and the position in the file of results ('file_position').
+        """
+        selectors = [s.list_of_selectors[-1] for s in S1]
+        with open(checkpoint_path, "rb") as checkpoint_file:
+            header = load(checkpoint_file)
+            if (header["version"] != _CHECKPOINT_FORMAT_VERSION) or (header["configuration"] != self._configuration_for_checkpoints()):
+                raise ValueError("The checkpoint was not created by a VLSD algorithm with the same configuration.")
+            if (header["selectors"] != selectors) or (header["TP"] != TP) or (header["FP"] != FP):
+                raise ValueError("The checkpoint was not created with the same dataset and target.")
+            state = _CheckpointUnpickler(checkpoint_file, selectors).load()
+        self._selected_subgroups = state["selected_subgroups"]
+        self._unselected_subgroups = state["unselected_subgroups"]
+        self._k_subgroups = state["k_subgroups"]
+        self._number_of_subgroups_added_to_k_subgroups = state["number_of_subgroups_added_to_k_subgroups"]
+        self._current_oe_minimum_threshold = state["current_oe_minimum_threshold"]
+        self._descriptions_of_the_closed_subgroups = state["descriptions_of_the_closed_subgroups"]
+        return state
+    
+    def iter_subgroups(self, pandas_dataframe : DataFrame, target : tuple[str, str], include_sequences_of_instances : bool = False) -> Iterator[VLSDResult]:
+        """Method to run the VLSD algorithm lazily: it returns a generator which yields each selected subgroup (i.e., whose quality measure value is greater or equal than 'q_minimum_threshold') as soon as it is found, in the same order in which the 'fit' method handles them, so the search only advances when the next subgroup is requested. In this way, the results can be consumed without writing them in a file and without keeping them in memory. IMPORTANT: the results are never written in the file (even if 'write_results_in_file' is True) and the search is always sequential (i.e., the parameter 'n_jobs' is not used). In the top-k mode, each subgroup is yielded when it is added to the best k subgroups found so far, so it might not be in the final 'k_subgroups' attribute. The attributes 'selected_subgroups', 'unselected_subgroups' and 'visited_nodes' are updated during the search. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        
+        :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param include_sequences_of_instances: whether the sequences of IDs of the dataset instances covered by each subgroup are included in the yielded results (with the representation of the implementation of the Vertical Lists). By default, False.
+        :return: an iterator with the selected subgroups.
+        """
+        # The parameters are checked now, not when the first subgroup is requested.
+        self._check_dataset_and_target(pandas_dataframe, target)
+        if (type(include_sequences_of_instances) is not bool):
+            raise TypeError("The type of the parameter 'include_sequences_of_instances' must be 'bool'.")
+        return self._iter_subgroups(pandas_dataframe, target, include_sequences_of_instances)
+    
+    def _iter_subgroups(self, pandas_dataframe : DataFrame, target : tuple[str, str], include_sequences_of_instances : bool) -> Iterator[VLSDResult]:
+        """Private generator of the 'iter_subgroups' method.
+        
+        :param pandas_dataframe: the DataFrame which is scanned.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param include_sequences_of_instances: whether the sequences of IDs of the dataset instances covered by each subgroup are included in the yielded results.
+        :return: an iterator with the selected subgroups.
+        """
+        # The best k subgroups and the threshold for the optimistic estimate of a previous execution are discarded.
+        self._k_subgroups = []
+        self._number_of_subgroups_added_to_k_subgroups = 0
+        self._current_oe_minimum_threshold = self._oe_minimum_threshold
+        self._k_subgroups_of_the_previous_targets = []
+        # Get the target column as a mask: True if the value is equal to the target value and False otherwise.
+        target_attribute_as_a_mask = (pandas_dataframe[target[0]] == target[1]).to_numpy()
+        # Obtain TP and FP of the dataset.
+        TP = int(target_attribute_as_a_mask.sum())
+        FP = len(pandas_dataframe.index) - TP
+        # Get the list of Vertical Lists of size 1 (i.e., only one selector in their lists of selectors).
+        S1 = self._generate_subgroups_s1(self._generate_covers_of_the_selectors(pandas_dataframe, target[0]), target_attribute_as_a_mask, TP, FP)
+        self._descriptions_of_the_closed_subgroups = dict()
+        # Handle each individual result (first, the Vertical Lists of size 1 and, after that, the branches) and yield it if it is selected. In the closed mode, the Vertical Lists of size 1 are handled during the search.
+        for vertical_list in chain([] if self._closed_only else S1, self._search_branches(S1, target, TP, FP)):
+            quality_measure_value = self._handle_individual_result( (vertical_list, target, TP, FP) )
+            if quality_measure_value is not None:
+                if include_sequences_of_instances:
+                    yield VLSDResult(vertical_list.list_of_selectors, vertical_list.tp, vertical_list.fp, quality_measure_value, vertical_list.quality_value, vertical_list.sequence_of_instances_tp, vertical_list.sequence_of_instances_fp)
+                else:
+                    yield VLSDResult(vertical_list.list_of_selectors, vertical_list.tp, vertical_list.fp, quality_measure_value, vertical_list.quality_value)
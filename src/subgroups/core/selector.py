@@ -189,3 +189,7 @@ class Selector(object):
     
     def __hash__(self) -> int:
         return hash(str(self))
+    
+    def __reduce__(self) -> tuple[type, tuple[str, Operator, Union[str, int, float]]]:
+        # IMPORTANT: a Selector is created by means of the '__new__' method (selector pool), so we have to pass its attributes in order to be able to serialize it (e.g., when sending it to another process).
+        return (Selector, (self._attribute_name, self._operator, self._value))
@@ -1,9 +1,17 @@
 from subgroups.data_structures.fp_tree_node import FPTreeNode
 from subgroups.data_structures.fp_tree_for_sdmap import FPTreeForSDMap
 from subgroups.data_structures.fp_tree_for_sdmapstar import FPTreeForSDMapStar
+from subgroups.data_structures.fp_tree_with_arrays_for_sdmap import FPTreeWithArraysForSDMap
+from subgroups.data_structures.fp_tree_with_arrays_for_sdmapstar import FPTreeWithArraysForSDMapStar
 from subgroups.data_structures.bitset_bsd import BitsetBSD
 from subgroups.data_structures.bitset_qfinder import Bitset_QFinder
 from subgroups.data_structures.vertical_list import VerticalList
 from subgroups.data_structures.vertical_list_with_bitsets import VerticalListWithBitsets
 from subgroups.data_structures.vertical_list_with_sets import VerticalListWithSets
+from subgroups.data_structures.vertical_list_with_word_arrays import VerticalListWithWordArrays
+from subgroups.data_structures.vertical_list_with_diffsets import VerticalListWithDiffsets
+from subgroups.data_structures.compressed_bitmap import CompressedBitmap
+from subgroups.data_structures.vertical_list_with_compressed_bitmaps import VerticalListWithCompressedBitmaps
+from subgroups.data_structures.vertical_list_with_sorted_arrays import VerticalListWithSortedArrays
+from subgroups.data_structures.vertical_list_with_hybrid_sequences import VerticalListWithHybridSequences
 from subgroups.data_structures.subgroup_list import SubgroupList
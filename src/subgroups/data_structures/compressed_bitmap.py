@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a compressed bitmap (similar to a Roaring bitmap), which is used by some Vertical Lists in order to store sequences of IDs of dataset instances.
+"""
+
+from collections.abc import Collection, Iterator
+from sys import getsizeof
+from numpy import ndarray, asarray, unique, zeros, flatnonzero, diff, packbits, unpackbits, intersect1d, uint8, uint16, uint64, int64
+from subgroups.data_structures.vertical_list_with_word_arrays import bitwise_count
+
+class CompressedBitmap(Collection):
+    """This class represents a compressed bitmap (similar to a Roaring bitmap), which is an IMMUTABLE sorted set of non-negative integers. The integers are partitioned in chunks of 65536 values according to their 16 most significant bits (the key of the chunk), and the 16 least significant bits of the integers of each chunk are stored in a container. If the chunk has 4096 integers or less, the container is a sorted numpy array of type uint16 (array container). In other case, the container is a numpy array of 1024 words of type uint64 (bitmap container). In this way, the memory footprint depends on the number of integers and not on the largest one.
+
+    :param sequence_of_integers: the sequence of non-negative integers which is stored (duplicates are removed).
+    """
+
+    __slots__ = ("_containers", "_cardinality")
+
+    # Maximum number of integers of an array container.
+    MAXIMUM_CARDINALITY_OF_AN_ARRAY_CONTAINER = 4096
+
+    def __init__(self, sequence_of_integers : Collection[int] = ()) -> None:
+        if not isinstance(sequence_of_integers, Collection):
+            raise TypeError("The parameter 'sequence_of_integers' must be an instance of a subclass of the 'Collection' class.")
+        # Dictionary in which the keys are the 16 most significant bits and the values are the containers. IMPORTANT: the keys are inserted in ascending order and empty containers are not stored.
+        self._containers = dict()
+        self._cardinality = 0
+        if not isinstance(sequence_of_integers, ndarray):
+            sequence_of_integers = list(sequence_of_integers)
+        integers = unique(asarray(sequence_of_integers, dtype=int64)) # Sorted and without duplicates.
+        if len(integers) == 0:
+            return
+        if integers[0] < 0:
+            raise ValueError("The parameter 'sequence_of_integers' must only contain non-negative integers.")
+        keys = integers >> 16
+        # Positions in which a new chunk starts.
+        starts = [0] + (flatnonzero(diff(keys)) + 1).tolist() + [len(integers)]
+        for index in range(len(starts)-1):
+            low_bits = (integers[starts[index]:starts[index+1]] & 0xFFFF).astype(uint16)
+            if len(low_bits) <= CompressedBitmap.MAXIMUM_CARDINALITY_OF_AN_ARRAY_CONTAINER:
+                self._containers[int(keys[starts[index]])] = low_bits
+            else:
+                self._containers[int(keys[starts[index]])] = _generate_bitmap_container(low_bits)
+        self._cardinality = len(integers)
+
+    @classmethod
+    def _create_from_containers(cls, containers : dict[int, ndarray], cardinality : int) -> 'CompressedBitmap':
+        """Private method to create a compressed bitmap from its containers. IMPORTANT: the parameters are not checked and the containers are not copied.
+
+        :param containers: dictionary in which the keys are the 16 most significant bits and the values are the (non-empty) containers.
+        :param cardinality: the total number of integers in the containers.
+        :return: the created compressed bitmap.
+        """
+        result = cls.__new__(cls)
+        result._containers = containers
+        result._cardinality = cardinality
+        return result
+
+    def intersection(self, other : 'CompressedBitmap') -> 'CompressedBitmap':
+        """Method to obtain the intersection of this compressed bitmap and another one.
+
+        :param other: the other compressed bitmap.
+        :return: a new compressed bitmap with the integers which are in both compressed bitmaps.
+        """
+        if type(other) is not CompressedBitmap:
+            raise TypeError("The type of the parameter 'other' must be 'CompressedBitmap'.")
+        new_containers = dict()
+        new_cardinality = 0
+        # Only the keys which are in both compressed bitmaps (iterating through the smaller dictionary).
+        if len(self._containers) <= len(other._containers):
+            smaller, larger = self._containers, other._containers
+        else:
+            smaller, larger = other._containers, self._containers
+        for key in smaller:
+            if key in larger:
+                new_container, new_container_cardinality = _intersect_containers(smaller[key], larger[key])
+                if new_container_cardinality > 0:
+                    new_containers[key] = new_container
+                    new_cardinality = new_cardinality + new_container_cardinality
+        # IMPORTANT: the keys of the new dictionary might not be in ascending order if the smaller dictionary was not this one, so we sort them.
+        if smaller is not self._containers:
+            new_containers = dict(sorted(new_containers.items()))
+        return CompressedBitmap._create_from_containers(new_containers, new_cardinality)
+
+    def intersection_cardinality(self, other : 'CompressedBitmap') -> int:
+        """Method to obtain the number of integers which are in both compressed bitmaps, without creating their intersection.
+
+        :param other: the other compressed bitmap.
+        :return: the cardinality of the intersection of this compressed bitmap and the other one.
+        """
+        if type(other) is not CompressedBitmap:
+            raise TypeError("The type of the parameter 'other' must be 'CompressedBitmap'.")
+        if len(self._containers) <= len(other._containers):
+            smaller, larger = self._containers, other._containers
+        else:
+            smaller, larger = other._containers, self._containers
+        result = 0
+        for key in smaller:
+            if key in larger:
+                result = result + _intersect_containers_cardinality(smaller[key], larger[key])
+        return result
+
+    def __len__(self) -> int:
+        return self._cardinality
+
+    def __iter__(self) -> Iterator[int]:
+        for key, container in self._containers.items():
+            high_bits = key << 16
+            for low_bits in _container_to_array(container).tolist():
+                yield high_bits + low_bits
+
+    def __contains__(self, value : object) -> bool:
+        if (type(value) is not int) or (value < 0):
+            return False
+        try:
+            container = self._containers[value >> 16]
+        except KeyError:
+            return False
+        low_bits = value & 0xFFFF
+        if container.dtype == uint16:
+            position = container.searchsorted(low_bits)
+            return bool((position < len(container)) and (container[position] == low_bits))
+        return bool((int(container[low_bits >> 6]) >> (low_bits & 63)) & 1)
+
+    def __eq__(self, other : object) -> bool:
+        if not isinstance(other, CompressedBitmap):
+            return NotImplemented
+        return (self._cardinality == other._cardinality) and (list(self) == list(other))
+
+    def __repr__(self) -> str:
+        return "CompressedBitmap(" + str(list(self)) + ")"
+
+    def __sizeof__(self) -> int:
+        # The size of the object, of its dictionary and of the data of its containers.
+        return object.__sizeof__(self) + getsizeof(self._containers) + sum(container.nbytes for container in self._containers.values())
+
+def _generate_bitmap_container(low_bits : ndarray) -> ndarray:
+    """Private method to generate a bitmap container.
+
+    :param low_bits: sorted numpy array of type uint16.
+    :return: numpy array of 1024 words of type uint64 in which the bits of the integers in 'low_bits' are set to 1.
+    """
+    mask = zeros(65536, dtype=bool)
+    mask[low_bits] = True
+    return packbits(mask, bitorder="little").view(uint64)
+
+def _container_to_array(container : ndarray) -> ndarray:
+    """Private method to obtain the integers (16 least significant bits) stored in a container.
+
+    :param container: the container (array or bitmap container).
+    :return: sorted numpy array with the integers stored in the container.
+    """
+    if container.dtype == uint16:
+        return container
+    return flatnonzero(unpackbits(container.view(uint8), bitorder="little")).astype(uint16)
+
+def _bits_of_array_container_in_bitmap_container(array_container : ndarray, bitmap_container : ndarray) -> ndarray:
+    """Private method to check which integers of an array container are in a bitmap container.
+
+    :param array_container: the array container.
+    :param bitmap_container: the bitmap container.
+    :return: numpy array of type bool with the same length as the array container.
+    """
+    return ((bitmap_container[array_container >> 6] >> (array_container & 63).astype(uint64)) & uint64(1)).astype(bool)
+
+def _intersect_containers(container_a : ndarray, container_b : ndarray) -> tuple[ndarray, int]:
+    """Private method to intersect two containers.
+
+    :param container_a: the first container (array or bitmap container).
+    :param container_b: the second container (array or bitmap container).
+    :return: a tuple with the new container and its cardinality.
+    """
+    a_is_array = (container_a.dtype == uint16)
+    b_is_array = (container_b.dtype == uint16)
+    if a_is_array and b_is_array:
+        new_container = intersect1d(container_a, container_b, assume_unique=True)
+        return new_container, len(new_container)
+    elif a_is_array:
+        new_container = container_a[_bits_of_array_container_in_bitmap_container(container_a, container_b)]
+        return new_container, len(new_container)
+    elif b_is_array:
+        new_container = container_b[_bits_of_array_container_in_bitmap_container(container_b, container_a)]
+        return new_container, len(new_container)
+    else:
+        new_container = container_a & container_b
+        new_container_cardinality = int(bitwise_count(new_container).sum())
+        # If the result is small, it is converted to an array container.
+        if new_container_cardinality <= CompressedBitmap.MAXIMUM_CARDINALITY_OF_AN_ARRAY_CONTAINER:
+            new_container = _container_to_array(new_container)
+        return new_container, new_container_cardinality
+
+def _intersect_containers_cardinality(container_a : ndarray, container_b : ndarray) -> int:
+    """Private method to obtain the cardinality of the intersection of two containers, without creating it.
+
+    :param container_a: the first container (array or bitmap container).
+    :param container_b: the second container (array or bitmap container).
+    :return: the cardinality of the intersection.
+    """
+    a_is_array = (container_a.dtype == uint16)
+    b_is_array = (container_b.dtype == uint16)
+    if a_is_array and b_is_array:
+        # Both arrays are sorted, so we search the elements of the smaller one in the larger one.
+        if len(container_a) > len(container_b):
+            container_a, container_b = container_b, container_a
+        positions = container_b.searchsorted(container_a)
+        positions[positions == len(container_b)] = 0 # IMPORTANT: containers are never empty.
+        return int((container_b[positions] == container_a).sum())
+    elif a_is_array:
+        return int(_bits_of_array_container_in_bitmap_container(container_a, container_b).sum())
+    elif b_is_array:
+        return int(_bits_of_array_container_in_bitmap_container(container_b, container_a).sum())
+    else:
+        return int(bitwise_count(container_a & container_b).sum())
@@ -9,11 +9,59 @@
 from subgroups.data_structures.fp_tree_node import FPTreeNode
 from subgroups.core.selector import Selector
 from subgroups.core.operator import Operator
-from pandas import DataFrame
+from pandas import DataFrame, factorize
+from numpy import array, empty, int64, unique, bincount, argsort
 from subgroups.exceptions import InconsistentMethodParametersError
 
 # Python annotations.
-from typing import Union
+from typing import Union, Iterable, Callable
+
+def _generate_transactions(pandas_dataframe : DataFrame, set_of_frequent_selectors : dict[str, tuple[Selector, list[int], int]], target : tuple[str, Union[int, float, str]]) -> tuple[list[Selector], list[tuple[list[int], int, int]]]:
+    """Private function to encode a pandas DataFrame as a list of unique transactions of item codes, in which the item code of a frequent selector is its position in the list of frequent selectors sorted according to the value of 'n' (tp+fp) in descending order. This list of transactions is used in order to build the FPTrees from the DataFrame.
+    
+    :param pandas_dataframe: the DataFrame which is scanned. IMPORTANT: missing values are not supported yet.
+    :param set_of_frequent_selectors: the set of frequent selectors generated by the method 'generate_set_of_frequent_selectors'.
+    :param target: a tuple with 2 elements: the target attribute name and the target value.
+    :return: a tuple with 2 elements: (1) the list of frequent selectors sorted according to the value of 'n' (tp+fp) in descending order (i.e., the selector of each item code) and (2) a list with the unique transactions in the order of their first appearance in the DataFrame, each one of them as a tuple with 3 elements: the sorted item codes of the frequent selectors in the transaction, the true positives tp of the transaction and the false positives fp of the transaction.
+    """
+    # List with the selectors of 'set_of_frequent_selectors' sorted according to the value of 'n' (tp+fp) in descending order (CRITERION EXTRACTED FROM VIKAMINE).
+    # - In case of tie, we NEED TO MAINTAIN the order of the selectors according to the order in the set of frequent selectors (i.e., the insertion order).
+    # - The position of a selector in this list is its rank (i.e., its item code), so sorting the item codes of a row is equivalent to sorting its selectors.
+    # IMPORTANT: the python 'sort' method is stable.
+    sorted_frequent_selectors = sorted(set_of_frequent_selectors.values(), key = lambda x : x[2]) # key -> [2] : the insertion order in the dictionary.
+    sorted_frequent_selectors.sort(key = lambda x : (x[1][0]+x[1][1]), reverse=True) # key -> 'n' : sum of tp and fp.
+    number_of_items = len(sorted_frequent_selectors)
+    # Rank of each selector, by attribute and by value.
+    ranks_by_attribute = dict()
+    for rank in range(number_of_items):
+        selector = sorted_frequent_selectors[rank][0]
+        ranks_by_attribute.setdefault(selector.attribute_name, dict())[selector.value] = rank
+    # Encode the DataFrame as a matrix of item codes (one row per instance and one column per attribute, except the target), in which the code of a non-frequent selector is 'number_of_items'.
+    # IMPORTANT: each column is factorized only once, so the values are not accessed one by one.
+    columns = [column for column in pandas_dataframe.columns.drop(target[0]) if column in ranks_by_attribute]
+    matrix_of_item_codes = empty((len(pandas_dataframe.index), len(columns)), dtype=int64)
+    for index, column in enumerate(columns):
+        codes, uniques = factorize(pandas_dataframe[column])
+        ranks_of_the_column = ranks_by_attribute[column]
+        # IMPORTANT: the code of a missing value is -1, so it is mapped to the last element (i.e., a non-frequent selector).
+        ranks_of_the_uniques = array([ranks_of_the_column.get(value, number_of_items) for value in uniques] + [number_of_items], dtype=int64)
+        matrix_of_item_codes[:, index] = ranks_of_the_uniques[codes]
+    # We sort the item codes of each row (i.e., the selectors of each transaction). The non-frequent selectors are at the end.
+    matrix_of_item_codes.sort(axis=1)
+    # Get the target column as a mask: True if the value is equal to the target value and False otherwise.
+    target_attribute_as_a_mask = (pandas_dataframe[target[0]] == target[1]).to_numpy(dtype=bool)
+    # Collapse the identical transactions, counting the true positives tp and the false positives fp of each one of them.
+    # IMPORTANT: the unique transactions are inserted in the order of their first appearance in the DataFrame, so the tree (including the order of the children, of the horizontal lists and of the header table) is the same as if the rows were inserted one by one.
+    transactions = []
+    if len(columns) > 0 and len(pandas_dataframe.index) > 0:
+        unique_transactions, first_appearances, inverse = unique(matrix_of_item_codes, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        tp_of_each_transaction = bincount(inverse[target_attribute_as_a_mask], minlength=len(unique_transactions)).tolist()
+        fp_of_each_transaction = bincount(inverse[~target_attribute_as_a_mask], minlength=len(unique_transactions)).tolist()
+        for transaction_index in argsort(first_appearances, kind="stable").tolist():
+            # The non-frequent selectors are discarded.
+            transactions.append( ([rank for rank in unique_transactions[transaction_index].tolist() if rank < number_of_items], tp_of_each_transaction[transaction_index], fp_of_each_transaction[transaction_index]) )
+    return [elem[0] for elem in sorted_frequent_selectors], transactions
 
 class FPTreeForSDMap(object):
     """This class represents the FPTree data structure used in the SDMap algorithm.
@@ -70,6 +118,14 @@ class FPTreeForSDMap(object):
         # - If the number of children is greater than 1, there is not a single path.
         return (current_node.number_of_children == 0)
     
+    def get_selectors(self, list_of_items : list[Selector]) -> list[Selector]:
+        """Method to get the selectors of a list of items of the FPTree (e.g., the items of the header table). In this FPTree, the items are the selectors themselves, so the same list is returned.
+        
+        :param list_of_items: the list of items.
+        :return: the selectors of the items.
+        """
+        return list_of_items
+    
     def tree_as_str(self) -> str:
         """Method to print as str the complete FPTree from the root node.
         
@@ -238,27 +294,13 @@ class FPTreeForSDMap(object):
             raise TypeError("The type of the parameter 'set_of_frequent_selectors' must be 'dict'.")
         if type(target) is not tuple:
             raise TypeError("The type of the parameter 'target' must be 'tuple'.")
-        # Iterate through the rows by index.
-        for row in pandas_dataframe.index:
-            target_value_in_the_current_row = pandas_dataframe.loc[row, target[0]]
-            selectors_in_the_current_row = []
-            # Iterate through the columns (except the target).
-            for column in pandas_dataframe.columns.drop(target[0]):
-                current_element = pandas_dataframe.loc[row, column]
-                # Add the corresponding selector from 'set_of_frequent_selectors' to 'selectors_in_the_current_row'.
-                # ===> IMPORTANT: the selector might not exist because it was pruned. In this case, a KeyError exception is raised.
-                try:
-                    # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
-                    selectors_in_the_current_row.append( set_of_frequent_selectors[column+repr(current_element)][0] )
-                except KeyError:
-                    pass # If the exception is raised, we do nothing.
-            # We sort 'selectors_in_the_current_row' according to the value of 'n' (tp+fp) in the set of frequent selectors (CRITERION EXTRACTED FROM VIKAMINE).
-            # - In case of tie, we NEED TO MAINTAIN the order of the selectors according to the order in the set of frequent selectors. For this reason, it is necessary to sort twice.
-            # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
-            selectors_in_the_current_row = sorted(selectors_in_the_current_row, key = lambda x : set_of_frequent_selectors[x.attribute_name+repr(x.value)][2], reverse=False) # key -> [2] : the insertion order in the dictionary.
-            selectors_in_the_current_row = sorted(selectors_in_the_current_row, key = lambda x : (set_of_frequent_selectors[x.attribute_name+repr(x.value)][1][0]+set_of_frequent_selectors[x.attribute_name+repr(x.value)][1][1]), reverse=True) # key -> 'n' : sum of tp and fp.
+        # Encode the DataFrame as a list of unique transactions of item codes.
+        sorted_frequent_selectors, transactions = _generate_transactions(pandas_dataframe, set_of_frequent_selectors, target)
+        for transaction, tp, fp in transactions:
+            # Selectors of the transaction.
+            selectors_in_the_current_transaction = [sorted_frequent_selectors[rank] for rank in transaction]
             # Insert.
-            self._insert_tree(selectors_in_the_current_row, self._root_node, (target_value_in_the_current_row == target[1]))
+            self._insert_in_conditional_fp_tree(selectors_in_the_current_transaction, self._root_node, tp, fp)
         # Finally, we create the sorted header table.
         self._sorted_header_table = []
         for key in self._header_table:
@@ -296,87 +338,119 @@ class FPTreeForSDMap(object):
         first_selector = list_of_selectors[0]
         # We initialize the final result.
         final_conditional_fp_tree = FPTreeForSDMap()
-        ### 1. Generate the conditional pattern base and a dict of frequent selectors with their selectors. ###
-        conditional_pattern_base = [] # list[list[ element 1 -> list[Selector], element 2 -> int, element 3 -> int ]]
         # If the first selector is not in the header table, return the current conditional FPTree.
         if first_selector not in self._header_table:
             return final_conditional_fp_tree
-        # Dictionary with all the frequent selectors (before pruning).
-        dict_of_all_frequent_selectors = dict() # dict[str, tuple[Selector, list[int], int]]
-        # Get the first node in the corresponding horizontal list.
-        current_node_in_the_horizontal_list = self._header_table[first_selector][1]
-        # Iterate through the horizontal list.
+        self._fill_conditional_fp_tree(final_conditional_fp_tree, self.horizontal_list(first_selector), use_tp_and_fp, minimum_tp, minimum_fp, minimum_n)
+        # Return the final conditional FPTree.
+        return final_conditional_fp_tree
+    
+    def horizontal_list(self, selector : Selector) -> Iterable[FPTreeNode]:
+        """Method to iterate through the horizontal list of a selector (i.e., through all the FPTreeNodes with that selector, in the order of their creation).
+        
+        :param selector: the selector. IMPORTANT: we assume that the selector is in the header table.
+        :return: an iterator over the FPTreeNodes.
+        """
+        current_node = self._header_table[selector][1]
+        while (current_node is not None):
+            yield current_node
+            current_node = current_node._node_link
+    
+    def _fill_conditional_fp_tree(self, conditional_fp_tree : 'FPTreeForSDMap', nodes : Iterable[FPTreeNode], use_tp_and_fp : bool, minimum_tp : Union[int, None], minimum_fp : Union[int, None], minimum_n : Union[int, None], is_promising : Union[Callable[[int, int], bool], None] = None) -> int:
+        """Private method to fill an empty conditional FPTree from some nodes of a horizontal list of this FPTree.
+        
+        :param conditional_fp_tree: the empty conditional FPTree which is filled.
+        :param nodes: the FPTreeNodes of the horizontal list whose paths are used.
+        :param use_tp_and_fp: whether the true positives tp and the false positives fp thresholds are used (or the subgroup description size n threshold).
+        :param minimum_tp: the minimum true positives (tp) threshold.
+        :param minimum_fp: the minimum false positives (fp) threshold.
+        :param minimum_n: the minimum subgroup description size (n) threshold.
+        :param is_promising: a function which receives the true positives tp and the false positives fp of a frequent item and returns whether it is kept in the conditional FPTree (or None, in order to keep all the frequent items). By default, None.
+        :return: the number of frequent items which are removed by the function 'is_promising'.
+        """
+        root_node = self._root_node
+        # In the projection, each different selector is represented with an integer item (in the order in which they are found).
+        # - The item of each selector object (the key is the id of the object, so the selectors are not hashed in each node). IMPORTANT: two equal selectors could be different objects, so the item of a new object is searched by its attribute name and its value.
+        item_of_each_selector_object = dict() # dict[int, int]
+        item_of_each_selector = dict() # dict[str, int]
+        # - The selector of each item and its true positives tp, its false positives fp and its insertion order (before pruning).
+        selector_of_each_item = [] # list[Selector]
+        counters_of_each_item = [] # list[list[int]]
+        ### 1. Generate the conditional pattern base and the counters of all the items. ###
+        conditional_pattern_base = [] # list[tuple[ element 1 -> list[int], element 2 -> int, element 3 -> int ]]
         insertion_order = 0 # The insertion order is necessary later in order to sort the elements which have the same 'n' in a same path.
-        while(current_node_in_the_horizontal_list is not None):
-            # Path from the root node to to the current node in the corresponding horizontal list.
+        for node in nodes:
+            # IMPORTANT: the true positives tp and the false positives fp of all the nodes in the path are those of the current node in the horizontal list.
+            tp = node._counters[0]
+            fp = node._counters[1]
+            # Path from the current node in the corresponding horizontal list to the root node (from the bottom to the top). It is reversed later, only if it is needed.
             current_path = []
-            # Go up in the tree until the root node.
-            current_node_in_the_path = current_node_in_the_horizontal_list._parent # We start from the parent.
-            while (current_node_in_the_path != self._root_node):
+            current_node_in_the_path = node._parent # We start from the parent.
+            while (current_node_in_the_path is not root_node):
                 current_selector = current_node_in_the_path._selector
-                # Add the selector to 'dict_of_all_frequent_selectors'.
-                # IMPORTANT: the true positives tp and the false positives fp of all the nodes in the path are those of the current node in the horizontal list.
-                try:
-                    dict_of_all_frequent_selectors[current_selector.attribute_name+repr(current_selector.value)][1][0] = \
-                        dict_of_all_frequent_selectors[current_selector.attribute_name+repr(current_selector.value)][1][0] + current_node_in_the_horizontal_list._counters[0]
-                    dict_of_all_frequent_selectors[current_selector.attribute_name+repr(current_selector.value)][1][1] = \
-                        dict_of_all_frequent_selectors[current_selector.attribute_name+repr(current_selector.value)][1][1] + current_node_in_the_horizontal_list._counters[1]
-                except KeyError: # Try to access to the entry and if it does not exist, create a new one.
-                    dict_of_all_frequent_selectors[current_selector.attribute_name+repr(current_selector.value)] = \
-                        (current_selector, [current_node_in_the_horizontal_list._counters[0], current_node_in_the_horizontal_list._counters[1]], insertion_order)
-                    insertion_order = insertion_order - 1 # IMPORTANT: in this case, the insertion order decreases (we use negative numbers) because, when we create the conditional pattern base, we iterate from the bottom to the top in the FPTree.
-                # Insert the selector at the beginning of the current path.
-                current_path.insert(0, current_selector)
-                # Go up.
+                item = item_of_each_selector_object.get(id(current_selector))
+                if (item is None):
+                    # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
+                    key = current_selector.attribute_name + repr(current_selector.value)
+                    item = item_of_each_selector.get(key)
+                    if (item is None):
+                        item = len(selector_of_each_item)
+                        item_of_each_selector[key] = item
+                        selector_of_each_item.append(current_selector)
+                        counters_of_each_item.append([0, 0, insertion_order])
+                        insertion_order = insertion_order - 1 # IMPORTANT: in this case, the insertion order decreases (we use negative numbers) because we iterate from the bottom to the top in the FPTree.
+                    item_of_each_selector_object[id(current_selector)] = item
+                counters = counters_of_each_item[item]
+                counters[0] = counters[0] + tp
+                counters[1] = counters[1] + fp
+                current_path.append(item)
                 current_node_in_the_path = current_node_in_the_path._parent
             # If the path is not empty.
             if current_path:
-                # Append to 'conditional_pattern_base'.
-                conditional_pattern_base.append( [ current_path, current_node_in_the_horizontal_list._counters[0], current_node_in_the_horizontal_list._counters[1] ] )
-            # Finally, go the the next node in the horizontal list.
-            current_node_in_the_horizontal_list = current_node_in_the_horizontal_list._node_link
-        ### 2. Prune the dict of frequent selectors (depending on the values of the parameters 'minimum_tp', 'minimum_fp' and 'minimum_n'). ###
-        dict_of_frequent_selectors = dict() # dict[str, tuple[Selector, list[int], int]]
+                conditional_pattern_base.append( (current_path, tp, fp) )
+        ### 2. Prune the items (depending on the values of the parameters 'minimum_tp', 'minimum_fp' and 'minimum_n'). ###
         if use_tp_and_fp:
-            for key in dict_of_all_frequent_selectors:
-                if (dict_of_all_frequent_selectors[key][1][0] >= minimum_tp) and (dict_of_all_frequent_selectors[key][1][1] >= minimum_fp):
-                    dict_of_frequent_selectors[key] = (dict_of_all_frequent_selectors[key][0], [dict_of_all_frequent_selectors[key][1][0], dict_of_all_frequent_selectors[key][1][1]], dict_of_all_frequent_selectors[key][2])
+            frequent_items = [item for item in range(len(counters_of_each_item)) if (counters_of_each_item[item][0] >= minimum_tp) and (counters_of_each_item[item][1] >= minimum_fp)]
         else:
-            for key in dict_of_all_frequent_selectors:
-                if ( (dict_of_all_frequent_selectors[key][1][0]+dict_of_all_frequent_selectors[key][1][1]) >= minimum_n):
-                    dict_of_frequent_selectors[key] = (dict_of_all_frequent_selectors[key][0], [dict_of_all_frequent_selectors[key][1][0], dict_of_all_frequent_selectors[key][1][1]], dict_of_all_frequent_selectors[key][2]) 
+            frequent_items = [item for item in range(len(counters_of_each_item)) if (counters_of_each_item[item][0] + counters_of_each_item[item][1]) >= minimum_n]
+        # The frequent items which are not promising are also removed.
+        number_of_removed_items = 0
+        if (is_promising is not None):
+            number_of_frequent_items = len(frequent_items)
+            frequent_items = [item for item in frequent_items if is_promising(counters_of_each_item[item][0], counters_of_each_item[item][1])]
+            number_of_removed_items = number_of_frequent_items - len(frequent_items)
+        # We sort the frequent items according to the value of 'n' (tp+fp) in descending order (CRITERION EXTRACTED FROM VIKAMINE).
+        # - In case of tie, we NEED TO MAINTAIN the order of the items according to the insertion order.
+        frequent_items.sort(key = lambda x : (-(counters_of_each_item[x][0] + counters_of_each_item[x][1]), counters_of_each_item[x][2]))
+        # The rank of each item (-1 if it was pruned), so sorting the items of a path is sorting their ranks.
+        rank_of_each_item = [-1] * len(counters_of_each_item)
+        for rank, item in enumerate(frequent_items):
+            rank_of_each_item[item] = rank
         ### 3. Insert all the paths of the conditional pattern base in the tree. ###
-        for elem in conditional_pattern_base:
-            path = elem[0]
-            tp = elem[1]
-            fp = elem[2]
-            valid_selectors_in_this_path = [] # Only the valid selectors after pruning.
-            # Iterate through the selectors in the path.
-            for selector in path:
-                # Add the selector to 'valid_selectors_in_this_path'.
-                # ===> IMPORTANT: the selector might not exist because it was pruned. In this case, a KeyError exception is raised.
-                try:
-                    # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
-                    valid_selectors_in_this_path.append( dict_of_frequent_selectors[selector.attribute_name+repr(selector.value)][0] )
-                except KeyError:
-                    pass # If the exception is raised, we do nothing.
-            # We sort 'valid_selectors_in_this_path' according to the value of 'n' (tp+fp) in the set of frequent selectors (CRITERION EXTRACTED FROM VIKAMINE).
-            # - In case of tie, we NEED TO MAINTAIN the order of the selectors according to the order in the set of frequent selectors. For this reason, it is necessary to sort twice.
-            # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
-            valid_selectors_in_this_path = sorted(valid_selectors_in_this_path, key = lambda x : dict_of_frequent_selectors[x.attribute_name+repr(x.value)][2], reverse=False) # key -> [2] : the insertion order in the dictionary.
-            valid_selectors_in_this_path = sorted(valid_selectors_in_this_path, key = lambda x : (dict_of_frequent_selectors[x.attribute_name+repr(x.value)][1][0]+dict_of_frequent_selectors[x.attribute_name+repr(x.value)][1][1]), reverse=True) # key -> 'n' : sum of tp and fp.
-            # Insert.
-            final_conditional_fp_tree._insert_in_conditional_fp_tree(valid_selectors_in_this_path, final_conditional_fp_tree._root_node, tp, fp)
+        # IMPORTANT: the identical paths (after pruning) are merged, in the order of their first appearance, so the tree is the same as if they were inserted one by one.
+        merged_paths = dict() # dict[tuple[int], list[int]]
+        for path, tp, fp in conditional_pattern_base:
+            valid_ranks_in_this_path = [rank_of_each_item[item] for item in path if rank_of_each_item[item] >= 0]
+            if valid_ranks_in_this_path:
+                valid_ranks_in_this_path.sort()
+                key = tuple(valid_ranks_in_this_path)
+                counters = merged_paths.get(key)
+                if (counters is None):
+                    merged_paths[key] = [tp, fp]
+                else:
+                    counters[0] = counters[0] + tp
+                    counters[1] = counters[1] + fp
+        for key, counters in merged_paths.items():
+            conditional_fp_tree._insert_in_conditional_fp_tree([selector_of_each_item[frequent_items[rank]] for rank in key], conditional_fp_tree._root_node, counters[0], counters[1])
         # Finally, we create the sorted header table.
-        final_conditional_fp_tree._sorted_header_table = []
-        for key in final_conditional_fp_tree._header_table:
-            final_conditional_fp_tree._sorted_header_table.append( key )
+        conditional_fp_tree._sorted_header_table = []
+        for key in conditional_fp_tree._header_table:
+            conditional_fp_tree._sorted_header_table.append( key )
         # IMPORTANT: THIS CRITERION HAS BEEN EXTRACTED FROM THE ORIGINAL IMPLEMENTATION OF THE SDMAP ALGORITHM (IN VIKAMINE).
         # We have to sort the selectors according to the summation of 'n' (i.e., summation of tp + summation of fp).
         # - In case of tie, we maintain the insertion order in the dictionary 'header_table'.
-        final_conditional_fp_tree._sorted_header_table.sort(reverse=False, key=lambda x : (final_conditional_fp_tree._header_table[x][0][0] + final_conditional_fp_tree._header_table[x][0][1])) # Ascending order.
-        # Return the final conditional FPTree.
-        return final_conditional_fp_tree
+        conditional_fp_tree._sorted_header_table.sort(reverse=False, key=lambda x : (conditional_fp_tree._header_table[x][0][0] + conditional_fp_tree._header_table[x][0][1])) # Ascending order.
+        return number_of_removed_items
     
     def _insert_in_conditional_fp_tree(self, list_of_selectors : list[Selector], parent_node : FPTreeNode, fixed_tp : int, fixed_fp : int) -> None:
         """Private method to insert a list of selectors from a parent node.
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the FPTree data structure used in the SDMap algorithm in which the nodes are stored in parallel arrays and the selectors are represented with integer item ids.
+"""
+
+from subgroups.data_structures.fp_tree_for_sdmap import FPTreeForSDMap, _generate_transactions
+from subgroups.core.selector import Selector
+from subgroups.exceptions import InconsistentMethodParametersError
+from pandas import DataFrame
+from array import array
+
+# Python annotations.
+from typing import Union, Iterable, Callable
+
+class FPTreeWithArraysForSDMap(object):
+    """This class represents the FPTree data structure used in the SDMap algorithm in which the nodes are stored in parallel arrays (one array per field of the node) and the selectors are represented with integer item ids. A node is an index in these arrays and the root node is always the node 0. This FPTree has the same header table (in which the keys are the item ids and the nodes are indexes) and the same sorted header table (with item ids) as the FPTreeForSDMap, but it needs a few dozen bytes per node instead of a python object with a dictionary of children.
+    """
+
+    __slots__ = ("_selectors", "_items", "_parents", "_tps", "_fps", "_node_links", "_header_table", "_sorted_header_table")
+
+    def __init__(self) -> None:
+        # The selector of each item id (i.e., the item id of a selector is its position in this list). IMPORTANT: this list is shared by the FPTree and all its conditional FPTrees.
+        self._selectors = []
+        # The nodes of the tree. For each node (index), we store the item id of its selector, the index of its parent node, the true positives tp, the false positives fp and the index of the next node in the horizontal list (-1 if it does not exist).
+        # - The root node is the node 0 (it has no selector, no parent and the counters are -1).
+        self._items = array("i", [-1])
+        self._parents = array("i", [-1])
+        self._tps = array("q", [-1])
+        self._fps = array("q", [-1])
+        self._node_links = array("i", [-1])
+        # The header table is represented with a python dictionary, in which the key is an item id and the value is a list with 3 elements:
+        # - The first element is a list with 2 elements:
+        #   * The summation of the true positives tp of all the nodes with that item.
+        #   * The summation of the false positives fp of all the nodes with that item.
+        # - The second element is the index of the FIRST node of the horizontal list (the list with all the nodes with the same item).
+        # - The third element is the index of the LAST node of the horizontal list (the list with all the nodes with the same item).
+        self._header_table = dict()
+        # IMPORTANT: THIS CRITERION HAS BEEN EXTRACTED FROM THE ORIGINAL IMPLEMENTATION OF THE SDMAP ALGORITHM (IN VIKAMINE).
+        # We have to sort the items of the header table according to the summation of 'n' (i.e., summation of tp + summation of fp).
+        # - We store them in a list.
+        self._sorted_header_table = []
+
+    def _get_selectors(self) -> list[Selector]:
+        return self._selectors
+
+    def _get_number_of_nodes(self) -> int:
+        return len(self._items)
+
+    def _get_items(self) -> array:
+        return self._items
+
+    def _get_parents(self) -> array:
+        return self._parents
+
+    def _get_tps(self) -> array:
+        return self._tps
+
+    def _get_fps(self) -> array:
+        return self._fps
+
+    def _get_node_links(self) -> array:
+        return self._node_links
+
+    def _get_header_table(self) -> dict[int, list[object]]:
+        return self._header_table
+
+    def _get_sorted_header_table(self) -> list[int]:
+        return self._sorted_header_table
+
+    selectors = property(_get_selectors, None, None, "The selector of each item id.")
+    number_of_nodes = property(_get_number_of_nodes, None, None, "The number of nodes of the tree (including the root node).")
+    items = property(_get_items, None, None, "The item id of each node.")
+    parents = property(_get_parents, None, None, "The index of the parent node of each node.")
+    tps = property(_get_tps, None, None, "The true positives tp of each node.")
+    fps = property(_get_fps, None, None, "The false positives fp of each node.")
+    node_links = property(_get_node_links, None, None, "The index of the next node in the horizontal list of each node (-1 if it does not exist).")
+    header_table = property(_get_header_table, None, None, "The header table.")
+    sorted_header_table = property(_get_sorted_header_table, None, None, "A list with the item ids of the header table sorted according to the summation of the 'n' (summation of the true positives tp + summation of the false positives fp).")
+
+    def is_empty(self) -> bool:
+        """Method to check whether the FPTree only has the root node.
+
+        :return: whether the FPTree only has the root node.
+        """
+        return (len(self._items) == 1)
+
+    def there_is_a_single_path(self) -> bool:
+        """Method to check whether all internal nodes only have 1 child.
+
+        :return: whether all internal nodes only have 1 child.
+        """
+        # IMPORTANT: a node is always created after its parent, so the tree is a single path if and only if the parent of each node is the previous one.
+        return (self._parents[1:] == array("i", range(len(self._parents) - 1)))
+
+    def get_selectors(self, list_of_items : list[int]) -> list[Selector]:
+        """Method to get the selectors of a list of items of the FPTree (e.g., the items of the header table).
+
+        :param list_of_items: the list of item ids.
+        :return: the selectors of the items.
+        """
+        selectors = self._selectors
+        return [selectors[item] for item in list_of_items]
+
+    def horizontal_list(self, item : int) -> Iterable[int]:
+        """Method to iterate through the horizontal list of an item (i.e., through all the nodes with that item, in the order of their creation).
+
+        :param item: the item id. IMPORTANT: we assume that the item is in the header table.
+        :return: an iterator over the indexes of the nodes.
+        """
+        node_links = self._node_links
+        current_node = self._header_table[item][1]
+        while (current_node != -1):
+            yield current_node
+            current_node = node_links[current_node]
+
+    def tree_as_str(self) -> str:
+        """Method to print as str the complete FPTree from the root node.
+
+        :return: the printed FPTree.
+        """
+        # The children of each node, in the order of their creation.
+        children = [[] for _ in range(len(self._items))]
+        for node in range(1, len(self._items)):
+            children[self._parents[node]].append(node)
+        result = ""
+        stack = [(0, 0)]
+        while stack:
+            node, current_depth = stack.pop()
+            if current_depth > 0:
+                result = result + ("    "*(current_depth-1)) + ("|--- ")
+            if node == 0:
+                result = result + "{node: 0, selector: None, counters: [-1, -1], node_link: -1}\n"
+            else:
+                result = result + "{node: " + str(node) + ", selector: " + str(self._selectors[self._items[node]]) + ", counters: [" + str(self._tps[node]) + ", " + str(self._fps[node]) + "], node_link: " + str(self._node_links[node]) + "}\n"
+            for child in reversed(children[node]):
+                stack.append((child, current_depth+1))
+        return result
+
+    def header_table_as_str(self, follow_node_links : bool = True) -> str:
+        """Method to print all the entries of the FPTree header table.
+
+        :param follow_node_links: whether print all the node indexes in the horizontal list or only the first one. By default, True.
+        :return: the printed header table.
+        """
+        if type(follow_node_links) is not bool:
+            raise TypeError("The type of the parameter 'follow_node_links' must be 'bool'.")
+        result = ""
+        for key in self._header_table:
+            current_entry = self._header_table[key]
+            result = result + "{selector: " + str(self._selectors[key]) + ", "
+            result = result + "summations: " + str(current_entry[0]) + "} -> "
+            if follow_node_links:
+                result = result + " -> ".join(str(node) for node in self.horizontal_list(key)) + " -> -1"
+            else:
+                result = result + str(current_entry[1])
+            result = result + "\n"
+        return result
+
+    # The set of frequent selectors is generated in the same way as in the FPTreeForSDMap.
+    generate_set_of_frequent_selectors = FPTreeForSDMap.generate_set_of_frequent_selectors
+
+    def _insert_transactions(self, transactions : list[tuple[list[int], int, int]]) -> None:
+        """Private method to insert a list of transactions from the root node. IMPORTANT: the transactions are inserted in order, so the order of the nodes, of the horizontal lists and of the header table is the same as in the FPTreeForSDMap.
+
+        :param transactions: a list of tuples with 3 elements: the list of item ids which is inserted (already sorted), the fixed number of true positives tp and the fixed number of false positives fp which are used in the insertions and in the increments.
+        """
+        number_of_items = len(self._selectors)
+        items = self._items
+        parents = self._parents
+        tps = self._tps
+        fps = self._fps
+        node_links = self._node_links
+        header_table = self._header_table
+        # The child of each node with each item (the key is 'parent_node * number_of_items + item'). IMPORTANT: it is only needed during the insertions, so it is not stored in the tree.
+        children = dict()
+        for list_of_items, fixed_tp, fixed_fp in transactions:
+            current_parent_node = 0
+            for item in list_of_items:
+                key = current_parent_node * number_of_items + item
+                child_node_with_this_item = children.get(key)
+                if (child_node_with_this_item is not None):
+                    # Increase the true positives tp and the false positives fp in the node and in the header table.
+                    tps[child_node_with_this_item] = tps[child_node_with_this_item] + fixed_tp
+                    fps[child_node_with_this_item] = fps[child_node_with_this_item] + fixed_fp
+                    summations = header_table[item][0]
+                    summations[0] = summations[0] + fixed_tp
+                    summations[1] = summations[1] + fixed_fp
+                else:
+                    # Create a new node as a child of the current parent node.
+                    child_node_with_this_item = len(items)
+                    items.append(item)
+                    parents.append(current_parent_node)
+                    tps.append(fixed_tp)
+                    fps.append(fixed_fp)
+                    node_links.append(-1)
+                    children[key] = child_node_with_this_item
+                    # Check if the current item is in the header table.
+                    entry = header_table.get(item)
+                    if (entry is not None):
+                        # If it is in the header table, add the new node at the end of the horizontal list and increase the summation of tp and fp in the header table.
+                        node_links[entry[2]] = child_node_with_this_item
+                        entry[2] = child_node_with_this_item
+                        entry[0][0] = entry[0][0] + fixed_tp
+                        entry[0][1] = entry[0][1] + fixed_fp
+                    else: # If not, create the entry and add it.
+                        header_table[item] = [ [fixed_tp, fixed_fp], child_node_with_this_item, child_node_with_this_item ]
+                # Go down in the tree (the current node will be the current parent node in the next iteration).
+                current_parent_node = child_node_with_this_item
+
+    def _create_sorted_header_table(self) -> None:
+        """Private method to create the sorted header table from the header table.
+        """
+        # IMPORTANT: THIS CRITERION HAS BEEN EXTRACTED FROM THE ORIGINAL IMPLEMENTATION OF THE SDMAP ALGORITHM (IN VIKAMINE).
+        # We have to sort the items according to the summation of 'n' (i.e., summation of tp + summation of fp).
+        # - In case of tie, we maintain the insertion order in the dictionary 'header_table'.
+        header_table = self._header_table
+        self._sorted_header_table = sorted(header_table, key=lambda x : (header_table[x][0][0] + header_table[x][0][1])) # Ascending order.
+
+    def build_tree(self, pandas_dataframe : DataFrame, set_of_frequent_selectors : dict[str, tuple[Selector, list[int], int]], target : tuple[str, Union[int, float, str]]) -> None:
+        """Method to build the complete FPTree from a pandas DataFrame and using the set of frequent selectors. The item id of each selector is its position in the list of frequent selectors sorted according to the value of 'n' (tp+fp) in descending order. IMPORTANT: missing values are not supported yet.
+
+        :param pandas_dataframe: the DataFrame which is scanned. IMPORTANT: missing values are not supported yet.
+        :param set_of_frequent_selectors: the set of frequent selectors generated by the method 'generate_set_of_frequent_selectors'.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        """
+        if type(pandas_dataframe) is not DataFrame:
+            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
+        if type(set_of_frequent_selectors) is not dict:
+            raise TypeError("The type of the parameter 'set_of_frequent_selectors' must be 'dict'.")
+        if type(target) is not tuple:
+            raise TypeError("The type of the parameter 'target' must be 'tuple'.")
+        self._selectors, transactions = _generate_transactions(pandas_dataframe, set_of_frequent_selectors, target)
+        self._insert_transactions(transactions)
+        self._create_sorted_header_table()
+
+    def _fill_conditional_fp_tree(self, conditional_fp_tree : 'FPTreeWithArraysForSDMap', nodes : Iterable[int], use_tp_and_fp : bool, minimum_tp : Union[int, None], minimum_fp : Union[int, None], minimum_n : Union[int, None], is_promising : Union[Callable[[int, int], bool], None] = None) -> int:
+        """Private method to fill an empty conditional FPTree from some nodes of a horizontal list of this FPTree.
+
+        :param conditional_fp_tree: the empty conditional FPTree which is filled.
+        :param nodes: the indexes of the nodes of the horizontal list whose paths are used.
+        :param use_tp_and_fp: whether the true positives tp and the false positives fp thresholds are used (or the subgroup description size n threshold).
+        :param minimum_tp: the minimum true positives (tp) threshold.
+        :param minimum_fp: the minimum false positives (fp) threshold.
+        :param minimum_n: the minimum subgroup description size (n) threshold.
+        :param is_promising: a function which receives the true positives tp and the false positives fp of a frequent item and returns whether it is kept in the conditional FPTree (or None, in order to keep all the frequent items). By default, None.
+        :return: the number of frequent items which are removed by the function 'is_promising'.
+        """
+        items = self._items
+        parents = self._parents
+        tps = self._tps
+        fps = self._fps
+        ### 1. Generate the conditional pattern base and a dict of frequent items with their counters. ###
+        conditional_pattern_base = [] # list[tuple[ element 1 -> list[int], element 2 -> int, element 3 -> int ]]
+        # Dictionary with all the frequent items (before pruning). The value is a list with 3 elements: the true positives tp, the false positives fp and the insertion order.
+        dict_of_all_frequent_items = dict() # dict[int, list[int]]
+        insertion_order = 0 # The insertion order is necessary later in order to sort the elements which have the same 'n' in a same path.
+        for node in nodes:
+            # IMPORTANT: the true positives tp and the false positives fp of all the nodes in the path are those of the current node in the horizontal list.
+            tp = tps[node]
+            fp = fps[node]
+            # Path from the current node in the corresponding horizontal list to the root node (from the bottom to the top).
+            current_path = []
+            current_node_in_the_path = parents[node] # We start from the parent.
+            while (current_node_in_the_path != 0):
+                item = items[current_node_in_the_path]
+                entry = dict_of_all_frequent_items.get(item)
+                if (entry is None):
+                    dict_of_all_frequent_items[item] = [tp, fp, insertion_order]
+                    insertion_order = insertion_order - 1 # IMPORTANT: in this case, the insertion order decreases (we use negative numbers) because we iterate from the bottom to the top in the FPTree.
+                else:
+                    entry[0] = entry[0] + tp
+                    entry[1] = entry[1] + fp
+                current_path.append(item)
+                current_node_in_the_path = parents[current_node_in_the_path]
+            # If the path is not empty.
+            if current_path:
+                conditional_pattern_base.append( (current_path, tp, fp) )
+        ### 2. Prune the dict of frequent items (depending on the values of the parameters 'minimum_tp', 'minimum_fp' and 'minimum_n'). ###
+        if use_tp_and_fp:
+            frequent_items = [item for item, entry in dict_of_all_frequent_items.items() if (entry[0] >= minimum_tp) and (entry[1] >= minimum_fp)]
+        else:
+            frequent_items = [item for item, entry in dict_of_all_frequent_items.items() if (entry[0] + entry[1]) >= minimum_n]
+        # The frequent items which are not promising are also removed.
+        number_of_removed_items = 0
+        if (is_promising is not None):
+            number_of_frequent_items = len(frequent_items)
+            frequent_items = [item for item in frequent_items if is_promising(dict_of_all_frequent_items[item][0], dict_of_all_frequent_items[item][1])]
+            number_of_removed_items = number_of_frequent_items - len(frequent_items)
+        # We sort the frequent items according to the value of 'n' (tp+fp) in descending order (CRITERION EXTRACTED FROM VIKAMINE).
+        # - In case of tie, we NEED TO MAINTAIN the order of the items according to the insertion order.
+        frequent_items.sort(key = lambda x : (-(dict_of_all_frequent_items[x][0] + dict_of_all_frequent_items[x][1]), dict_of_all_frequent_items[x][2]))
+        # The rank of each frequent item, so sorting the items of a path is sorting their ranks.
+        rank_of_each_item = {item : rank for rank, item in enumerate(frequent_items)}
+        ### 3. Insert all the paths of the conditional pattern base in the tree. ###
+        # IMPORTANT: the identical paths (after pruning) are merged, in the order of their first appearance, so the tree is the same as if they were inserted one by one.
+        merged_paths = dict() # dict[tuple[int], list[int]]
+        for path, tp, fp in conditional_pattern_base:
+            valid_ranks_in_this_path = [rank_of_each_item[item] for item in path if item in rank_of_each_item]
+            if valid_ranks_in_this_path:
+                valid_ranks_in_this_path.sort()
+                key = tuple(valid_ranks_in_this_path)
+                counters = merged_paths.get(key)
+                if (counters is None):
+                    merged_paths[key] = [tp, fp]
+                else:
+                    counters[0] = counters[0] + tp
+                    counters[1] = counters[1] + fp
+        conditional_fp_tree._selectors = self._selectors
+        conditional_fp_tree._insert_transactions([([frequent_items[rank] for rank in key], counters[0], counters[1]) for key, counters in merged_paths.items()])
+        conditional_fp_tree._create_sorted_header_table()
+        return number_of_removed_items
+
+    def generate_conditional_fp_tree(self, list_of_items : list[int], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None) -> 'FPTreeWithArraysForSDMap':
+        """Method to get the conditional FPTree with a list of items. Two threshold types could be used: (1) the true positives tp and the false positives fp separately or (2) the subgroup description size n (n = tp + fp). This means that: (1) if 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and (2) if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.
+
+        :param list_of_items: the list of item ids which is used. IMPORTANT: we assume that the list only contains item ids of this FPTree.
+        :param minimum_tp: the minimum true positives (tp) threshold.
+        :param minimum_fp: the minimum false positives (fp) threshold.
+        :param minimum_n: the minimum subgroup description size (n) threshold.
+        :return: the generated conditional FPTree.
+        """
+        if type(list_of_items) is not list:
+            raise TypeError("The type of the parameter 'list_of_items' must be 'list'.")
+        if (type(minimum_tp) is not int) and (minimum_tp is not None):
+            raise TypeError("The type of the parameter 'minimum_tp' must be 'int' or 'NoneType'.")
+        if (type(minimum_fp) is not int) and (minimum_fp is not None):
+            raise TypeError("The type of the parameter 'minimum_fp' must be 'int' or 'NoneType'.")
+        if (type(minimum_n) is not int) and (minimum_n is not None):
+            raise TypeError("The type of the parameter 'minimum_n' must be 'int' or 'NoneType'.")
+        # Depending on the values of the parameters 'minimum_tp', 'minimum_fp' and 'minimum_n' ...
+        if (minimum_tp is not None) and (minimum_fp is not None) and (minimum_n is None):
+            use_tp_and_fp = True
+        elif (minimum_tp is None) and (minimum_fp is None) and (minimum_n is not None):
+            use_tp_and_fp = False
+        else:
+            raise InconsistentMethodParametersError("If 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.")
+        # We only use the first item in the list in the creation process (the item at the left side).
+        first_item = list_of_items[0]
+        # We initialize the final result.
+        final_conditional_fp_tree = FPTreeWithArraysForSDMap()
+        # If the first item is not in the header table, return the current conditional FPTree.
+        if first_item not in self._header_table:
+            return final_conditional_fp_tree
+        self._fill_conditional_fp_tree(final_conditional_fp_tree, self.horizontal_list(first_item), use_tp_and_fp, minimum_tp, minimum_fp, minimum_n)
+        return final_conditional_fp_tree
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the FPTree data structure used in the SDMapStar algorithm in which the nodes are stored in parallel arrays and the selectors are represented with integer item ids.
+"""
+
+from subgroups.exceptions import InconsistentMethodParametersError
+from subgroups.data_structures.fp_tree_with_arrays_for_sdmap import FPTreeWithArraysForSDMap
+from subgroups.quality_measures.quality_measure import QualityMeasure
+
+# Python annotations.
+from typing import Union
+
+class FPTreeWithArraysForSDMapStar(FPTreeWithArraysForSDMap):
+    """This class represents the FPTree data structure used in the SDMapStar algorithm in which the nodes are stored in parallel arrays and the selectors are represented with integer item ids.
+    """
+
+    __slots__ = ("_TP", "_FP")
+
+    def __init__(self, TP : int, FP : int) -> None:
+        """Method to initialize the FPTreeWithArraysForSDMapStar.
+
+        :param TP: The number of true positives in the dataset.
+        :param FP: The number of false positives in the dataset.
+        """
+        super().__init__()
+        if (type(TP) is not int):
+            raise TypeError("The TP parameter must be an integer.")
+        if (type(FP) is not int):
+            raise TypeError("The FP parameter must be an integer.")
+        self._TP = TP
+        self._FP = FP
+
+    def generate_conditional_fp_tree(self, list_of_items : list[int], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None) -> 'FPTreeWithArraysForSDMapStar':
+        """Method to get the conditional FPTree with a list of items (without the SDMapStar pruning). Two threshold types could be used: (1) the true positives tp and the false positives fp separately or (2) the subgroup description size n (n = tp + fp). This means that: (1) if 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and (2) if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.
+
+        :param list_of_items: the list of item ids which is used. IMPORTANT: we assume that the list only contains item ids of this FPTree.
+        :param minimum_tp: the minimum true positives (tp) threshold.
+        :param minimum_fp: the minimum false positives (fp) threshold.
+        :param minimum_n: the minimum subgroup description size (n) threshold.
+        :return: the generated conditional FPTree.
+        """
+        # IMPORTANT: the conditional FPTree is equivalent to the one generated with the SDMapStar pruning and a minimum optimistic estimate of minus infinity.
+        return self.generate_conditional_fp_tree_star(list_of_items, float("-inf"), None, minimum_tp=minimum_tp, minimum_fp=minimum_fp, minimum_n=minimum_n)[0]
+
+    def generate_conditional_fp_tree_star(self, list_of_items : list[int], min_optimistic_estimate : Union[int, float], optimistic_estimate : Union[QualityMeasure, None], additional_parameters : dict = dict(), minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None) -> tuple['FPTreeWithArraysForSDMapStar', int]:
+        """Method to get the conditional FPTree with a list of items. Two threshold types could be used: (1) the true positives tp and the false positives fp separately or (2) the subgroup description size n (n = tp + fp). This means that: (1) if 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and (2) if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.
+
+        :param list_of_items: the list of item ids which is used. IMPORTANT: we assume that the list only contains item ids of this FPTree.
+        :param min_optimistic_estimate: the minimum optimistic estimate threshold.
+        :param optimistic_estimate: the optimistic estimate quality measure (or None, in order not to use the SDMapStar pruning).
+        :param additional_parameters: the additional parameters for the optimistic estimate quality measure.
+        :param minimum_tp: the minimum true positives (tp) threshold.
+        :param minimum_fp: the minimum false positives (fp) threshold.
+        :param minimum_n: the minimum subgroup description size (n) threshold.
+        :return: the generated conditional FPTree and the number of pruned conditional items (i.e., the items removed because of the optimistic estimate).
+        """
+        if type(list_of_items) is not list:
+            raise TypeError("The type of the parameter 'list_of_items' must be 'list'.")
+        if (type(minimum_tp) is not int) and (minimum_tp is not None):
+            raise TypeError("The type of the parameter 'minimum_tp' must be 'int' or 'NoneType'.")
+        if (type(minimum_fp) is not int) and (minimum_fp is not None):
+            raise TypeError("The type of the parameter 'minimum_fp' must be 'int' or 'NoneType'.")
+        if (type(minimum_n) is not int) and (minimum_n is not None):
+            raise TypeError("The type of the parameter 'minimum_n' must be 'int' or 'NoneType'.")
+        # Depending on the values of the parameters 'minimum_tp', 'minimum_fp' and 'minimum_n' ...
+        if (minimum_tp is not None) and (minimum_fp is not None) and (minimum_n is None):
+            use_tp_and_fp = True
+        elif (minimum_tp is None) and (minimum_fp is None) and (minimum_n is not None):
+            use_tp_and_fp = False
+        else:
+            raise InconsistentMethodParametersError("If 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.")
+        # We only use the first item in the list in the creation process (the item at the left side).
+        first_item = list_of_items[0]
+        # We initialize the final result.
+        final_conditional_fp_tree = FPTreeWithArraysForSDMapStar(self._TP, self._FP)
+        # If the first item is not in the header table, return the current conditional FPTree.
+        if first_item not in self._header_table:
+            return final_conditional_fp_tree, 0
+        # SDMapStar pruning. We only keep the items of the conditional FPTree which have an optimistic estimate greater than or equal to the minimum optimistic estimate threshold (the other ones are removed as the infrequent items, and each one of them is a pruned branch).
+        # IMPORTANT: the optimistic estimate is computed with the counters of the items in the conditional FPTree (and not with those of the nodes of the horizontal list), because removing a node of the horizontal list would decrease the counters of the remaining items.
+        if optimistic_estimate is None:
+            is_promising = None
+        else:
+            def is_promising(tp : int, fp : int) -> bool:
+                dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : self._TP, QualityMeasure.FALSE_POPULATION : self._FP}
+                dict_of_parameters.update(additional_parameters)
+                return optimistic_estimate.compute(dict_of_parameters) >= min_optimistic_estimate
+        pruned_branches = self._fill_conditional_fp_tree(final_conditional_fp_tree, self.horizontal_list(first_item), use_tp_and_fp, minimum_tp, minimum_fp, minimum_n, is_promising)
+        return final_conditional_fp_tree, pruned_branches
@@ -10,6 +10,7 @@ from abc import ABC, abstractmethod
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.core.selector import Selector
 from collections.abc import Collection
+from sys import getsizeof
 
 # Python annotations.
 from typing import Union
@@ -97,13 +98,39 @@ class VerticalList(ABC):
         raise NotImplementedError("The 'compute_quality_value' method from the 'VerticalList' abstract class is an abstract method.")
 
     @abstractmethod
-    def join(self, other_vertical_list : 'VerticalList', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalList', None]:
+    def join(self, other_vertical_list : 'VerticalList', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False, minimum_quality_value : Union[int, float, None] = None) -> Union['VerticalList', None]:
         """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones.
         
         :param other_vertical_list: the Vertical List with which to make the join.
         :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
         :param dict_of_parameters: python dictionary which contains all the needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
         :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
+        :param minimum_quality_value: if it is not None and the quality value of the resulting Vertical List (i.e., the join) is lower than this value, None will be returned instead of a Vertical List object. In this case, the sequences of the resulting Vertical List are not created. By default, None.
         :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
         """
         raise NotImplementedError("The 'join' method from the 'VerticalList' abstract class is an abstract method.")
+    
+    def join_with_many(self, other_vertical_lists : list['VerticalList'], quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False, minimum_quality_value : Union[int, float, None] = None) -> list[Union['VerticalList', None]]:
+        """Method to join this Vertical List with each one of the Vertical Lists of a list (see the 'join' method). By default, the 'join' method is called once per Vertical List, but a subclass can override this method in order to make all the joins at once.
+        
+        :param other_vertical_lists: the list of Vertical Lists with which to make the joins.
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical Lists.
+        :param dict_of_parameters: python dictionary which contains all the needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical Lists, not of the dictionary of parameters passed by parameter.
+        :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of a resulting Vertical List is 0 and this parameter is True, None will be returned instead of that Vertical List. By default, this parameter is False.
+        :param minimum_quality_value: if it is not None, None will be returned instead of each resulting Vertical List whose quality value is lower than this value. By default, None.
+        :return: a list with the same length as 'other_vertical_lists', in which the element i is the join of this Vertical List (self) and other_vertical_lists[i] (or None, according to the parameters 'return_None_if_n_is_0' and 'minimum_quality_value').
+        """
+        if type(other_vertical_lists) is not list:
+            raise TypeError("The type of the parameter 'other_vertical_lists' must be 'list'.")
+        result = []
+        for other_vertical_list in other_vertical_lists:
+            result.append(self.join(other_vertical_list, quality_measure, dict_of_parameters, return_None_if_n_is_0 = return_None_if_n_is_0, minimum_quality_value = minimum_quality_value))
+        return result
+    
+    def memory_usage(self, ids_of_the_counted_prefixes : Union[set[int], None] = None) -> int:
+        """Method to obtain the approximate number of bytes of memory used by the sequences of instances of the Vertical List. By default, it is the size of both sequences according to the 'sys.getsizeof' function, but a subclass can override this method if that size is not representative.
+        
+        :param ids_of_the_counted_prefixes: python set with the IDs (according to the 'id' function) of the prefixes whose memory has already been counted. It is only used (and updated) by the implementations in which a Vertical List keeps alive the Vertical List from which it was created (see 'VerticalListWithDiffsets'). By default, None.
+        :return: the number of bytes.
+        """
+        return getsizeof(self._sequence_of_instances_tp) + getsizeof(self._sequence_of_instances_fp)
@@ -8,6 +8,8 @@
 
 from collections.abc import Collection
 from bitarray import bitarray
+from bitarray.util import count_and
+from numpy import ndarray, zeros, packbits, count_nonzero, bool_
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.core.selector import Selector
 from subgroups.data_structures.vertical_list import VerticalList
@@ -16,12 +18,48 @@ from subgroups.exceptions import VerticalListSizeError
 # Python annotations.
 from typing import Union
 
+def _sequence_of_instances_to_bitset(sequence_of_instances : Collection[int], number_of_dataset_instances : int) -> bitarray:
+    """Private function to create a bitset (big endian) with 'number_of_dataset_instances' bits in which only the bits of the instances of a sequence are set. If the sequence is a numpy array (either with the IDs of the instances or with a boolean mask with one element per instance of the dataset), the bitset is created at once from its bytes instead of bit by bit.
+    
+    :param sequence_of_instances: the sequence of IDs of the dataset instances or, if it is a numpy array with boolean type, the mask of the dataset instances.
+    :param number_of_dataset_instances: number of instances of the dataset.
+    :return: the bitset.
+    """
+    if isinstance(sequence_of_instances, ndarray):
+        if (sequence_of_instances.dtype == bool_):
+            if (len(sequence_of_instances) != number_of_dataset_instances):
+                raise ValueError("The length of a boolean mask must be equal to the number of instances of the dataset.")
+            mask = sequence_of_instances
+        else:
+            mask = zeros(number_of_dataset_instances, dtype = bool_)
+            mask[sequence_of_instances] = True
+        result = bitarray(endian = "big")
+        result.frombytes(packbits(mask, bitorder = "big").tobytes())
+        # Remove the padding bits of the last byte.
+        del result[number_of_dataset_instances:]
+        return result
+    result = bitarray(number_of_dataset_instances, endian = "big")
+    result.setall(0)
+    for elem in sequence_of_instances:
+        result[elem] = 1
+    return result
+
+def _number_of_instances_in_sequence(sequence_of_instances : Collection[int]) -> int:
+    """Private function to obtain the number of dataset instances of a sequence (see the function '_sequence_of_instances_to_bitset').
+    
+    :param sequence_of_instances: the sequence of IDs of the dataset instances or, if it is a numpy array with boolean type, the mask of the dataset instances.
+    :return: the number of dataset instances.
+    """
+    if isinstance(sequence_of_instances, ndarray) and (sequence_of_instances.dtype == bool_):
+        return int(count_nonzero(sequence_of_instances))
+    return len(sequence_of_instances)
+
 class VerticalListWithBitsets(VerticalList):
     """This class represents a Vertical List data structure whose sequences are implemented using bitsets.
     
     :param list_of_selectors: the list of selectors represented by the Vertical List.
-    :param sequence_of_instances_tp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target. The number of elements in this sequence would be the true positives tp of the equivalent subgroup with the same list of selectors and with the same target.
-    :param sequence_of_instances_fp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target. The number of elements in this sequence would be the false positives fp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param sequence_of_instances_tp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target. The number of elements in this sequence would be the true positives tp of the equivalent subgroup with the same list of selectors and with the same target. If it is a numpy array, the bitset is created at once (instead of bit by bit), and it can also be a boolean mask with one element per instance of the dataset.
+    :param sequence_of_instances_fp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target. The number of elements in this sequence would be the false positives fp of the equivalent subgroup with the same list of selectors and with the same target. If it is a numpy array, the bitset is created at once (instead of bit by bit), and it can also be a boolean mask with one element per instance of the dataset.
     :param number_of_dataset_instances: number of instances of the dataset.
     :param quality_value: the Vertical List quality value.
     """
@@ -32,17 +70,11 @@ class VerticalListWithBitsets(VerticalList):
         # Call to __init__ method of the parent class.
         super().__init__(list_of_selectors, sequence_of_instances_tp, sequence_of_instances_fp, number_of_dataset_instances, quality_value)
         # sequence of instances tp.
-        self._sequence_of_instances_tp = bitarray(number_of_dataset_instances, endian = "big")
-        self._sequence_of_instances_tp.setall(0)
-        for elem in sequence_of_instances_tp:
-            self._sequence_of_instances_tp[elem] = 1
-        self._tp = len(sequence_of_instances_tp) # The length of the parameter, not of the attribute.
+        self._sequence_of_instances_tp = _sequence_of_instances_to_bitset(sequence_of_instances_tp, number_of_dataset_instances)
+        self._tp = _number_of_instances_in_sequence(sequence_of_instances_tp) # The length of the parameter, not of the attribute.
         # sequence of instances fp.
-        self._sequence_of_instances_fp = bitarray(number_of_dataset_instances, endian = "big")
-        self._sequence_of_instances_fp.setall(0)
-        for elem in sequence_of_instances_fp:
-            self._sequence_of_instances_fp[elem] = 1
-        self._fp = len(sequence_of_instances_fp) # The length of the parameter, not of the attribute.
+        self._sequence_of_instances_fp = _sequence_of_instances_to_bitset(sequence_of_instances_fp, number_of_dataset_instances)
+        self._fp = _number_of_instances_in_sequence(sequence_of_instances_fp) # The length of the parameter, not of the attribute.
     
     @property
     def sequence_of_instances_tp(self) -> bitarray:
@@ -90,13 +122,14 @@ class VerticalListWithBitsets(VerticalList):
         new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = self.fp
         return quality_measure.compute(new_dict_of_parameters)
     
-    def join(self, other_vertical_list : 'VerticalListWithBitsets', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalListWithBitsets', None]:
+    def join(self, other_vertical_list : 'VerticalListWithBitsets', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False, minimum_quality_value : Union[int, float, None] = None) -> Union['VerticalListWithBitsets', None]:
         """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones.
         
         :param other_vertical_list: the Vertical List with which to make the join.
         :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
         :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
         :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
+        :param minimum_quality_value: if it is not None and the quality value of the resulting Vertical List (i.e., the join) is lower than this value, None will be returned instead of a Vertical List object. In this case, the sequences of the resulting Vertical List are not created. By default, None.
         :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
         """
         if type(other_vertical_list) is not VerticalListWithBitsets:
@@ -107,32 +140,34 @@ class VerticalListWithBitsets(VerticalList):
             raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
         if type(return_None_if_n_is_0) is not bool:
             raise TypeError("The type of the parameter 'return_None_if_n_is_0' must be 'bool'.")
+        if (type(minimum_quality_value) is not int) and (type(minimum_quality_value) is not float) and (minimum_quality_value is not None):
+            raise TypeError("The type of the parameter 'minimum_quality_value' must be 'int', 'float' or 'NoneType'.")
         if (self._number_of_dataset_instances != other_vertical_list._number_of_dataset_instances):
             raise VerticalListSizeError("Vertical Lists with different 'number_of_dataset_instances' value cannot be joined.")
         # Initially, the result is None.
         result = None
-        # First, make the intersection of both sequences (using the AND operator, because both sequences are bitarrays).
-        new_sequence_of_instances_tp = self._sequence_of_instances_tp & other_vertical_list._sequence_of_instances_tp
-        new_sequence_of_instances_fp = self._sequence_of_instances_fp & other_vertical_list._sequence_of_instances_fp
-        new_tp = new_sequence_of_instances_tp.count(1)
-        new_fp = new_sequence_of_instances_fp.count(1)
+        # First, count the instances of the intersection of both sequences without creating it (most of the joins are discarded later).
+        new_tp = count_and(self._sequence_of_instances_tp, other_vertical_list._sequence_of_instances_tp)
+        new_fp = count_and(self._sequence_of_instances_fp, other_vertical_list._sequence_of_instances_fp)
         # Continue if the parameter 'return_None_if_n_is_0' is False OR n is greater than 0. In other case, return None.
         if (not return_None_if_n_is_0) or ((new_tp + new_fp) > 0):
-            # Second, add the last element of 'other_vertical_list'.
-            new_list_of_selectors = self._list_of_selectors.copy()
-            new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
-            # Third, obtain the quality value.
+            # Second, obtain the quality value.
             new_dict_of_parameters = dict_of_parameters.copy()
             new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = new_tp 
             new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = new_fp
             new_quality_value = quality_measure.compute(new_dict_of_parameters)
-            # Finally, create the object.
-            result = VerticalListWithBitsets(new_list_of_selectors, [], [], 0, new_quality_value)
-            result._sequence_of_instances_tp = new_sequence_of_instances_tp
-            result._sequence_of_instances_fp = new_sequence_of_instances_fp
-            result._tp = new_tp
-            result._fp = new_fp
-            result._number_of_dataset_instances = self._number_of_dataset_instances
+            # Continue if the parameter 'minimum_quality_value' is None OR the quality value is not lower than it. In other case, return None.
+            if (minimum_quality_value is None) or (new_quality_value >= minimum_quality_value):
+                # Third, make the intersection of both sequences (using the AND operator, because both sequences are bitarrays) and add the last element of 'other_vertical_list'.
+                new_list_of_selectors = self._list_of_selectors.copy()
+                new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
+                # Finally, create the object.
+                result = VerticalListWithBitsets(new_list_of_selectors, [], [], 0, new_quality_value)
+                result._sequence_of_instances_tp = self._sequence_of_instances_tp & other_vertical_list._sequence_of_instances_tp
+                result._sequence_of_instances_fp = self._sequence_of_instances_fp & other_vertical_list._sequence_of_instances_fp
+                result._tp = new_tp
+                result._fp = new_fp
+                result._number_of_dataset_instances = self._number_of_dataset_instances
         # Return the result.
         return result
     
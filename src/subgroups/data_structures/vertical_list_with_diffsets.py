@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a Vertical List data structure whose sequences are implemented using diffsets (i.e., python sets with the difference with respect to the prefix of the Vertical List, as in the dEclat algorithm).
+"""
+
+from collections.abc import Collection
+from sys import getsizeof
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.core.selector import Selector
+from subgroups.data_structures.vertical_list import VerticalList
+from subgroups.exceptions import VerticalListSizeError
+
+# Python annotations.
+from typing import Union
+
+class VerticalListWithDiffsets(VerticalList):
+    """This class represents a Vertical List data structure whose sequences are implemented using diffsets. A Vertical List created by means of the constructor stores its sequences completely (i.e., tidsets), but a Vertical List created by means of the 'join' method only stores the IDs of the dataset instances which are covered by its prefix (i.e., by the Vertical List from which it was created), but not by itself (i.e., diffsets). In this way, tp and fp are obtained by subtraction and the stored sequences become smaller as the lists of selectors become larger, especially in dense datasets. IMPORTANT: a Vertical List created by means of the 'join' method keeps a reference to its prefix, which is needed to obtain its complete sequences.
+
+    :param list_of_selectors: the list of selectors represented by the Vertical List.
+    :param sequence_of_instances_tp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target. The number of elements in this sequence would be the true positives tp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param sequence_of_instances_fp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target. The number of elements in this sequence would be the false positives fp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param number_of_dataset_instances: number of instances of the dataset.
+    :param quality_value: the Vertical List quality value.
+    """
+
+    __slots__ = ("_prefix",)
+
+    def __init__(self, list_of_selectors : list[Selector], sequence_of_instances_tp : Collection[int], sequence_of_instances_fp : Collection[int], number_of_dataset_instances : int, quality_value : Union[int, float]) -> None:
+        # Call to __init__ method of the parent class.
+        super().__init__(list_of_selectors, sequence_of_instances_tp, sequence_of_instances_fp, number_of_dataset_instances, quality_value)
+        # This Vertical List has no prefix, so its sequences are stored completely (i.e., tidsets).
+        self._prefix = None
+        # sequence of instances tp.
+        self._sequence_of_instances_tp = set(sequence_of_instances_tp)
+        self._tp = len(sequence_of_instances_tp)
+        # sequence of instances fp.
+        self._sequence_of_instances_fp = set(sequence_of_instances_fp)
+        self._fp = len(sequence_of_instances_fp)
+
+    def _get_prefix(self) -> Union['VerticalListWithDiffsets', None]:
+        return self._prefix
+
+    def _get_diffset_tp(self) -> set[int]:
+        return self._sequence_of_instances_tp
+
+    def _get_diffset_fp(self) -> set[int]:
+        return self._sequence_of_instances_fp
+
+    prefix = property(_get_prefix, None, None, "The Vertical List from which this Vertical List was created by means of the 'join' method (or None if it was created by means of the constructor).")
+    diffset_tp = property(_get_diffset_tp, None, None, "The stored sequence of instances tp: the IDs of the dataset instances which are covered by the prefix and also by the target, but not by this Vertical List (or the complete sequence of instances tp if the prefix is None).")
+    diffset_fp = property(_get_diffset_fp, None, None, "The stored sequence of instances fp: the IDs of the dataset instances which are covered by the prefix, but neither by the target nor by this Vertical List (or the complete sequence of instances fp if the prefix is None).")
+
+    @property
+    def sequence_of_instances_tp(self) -> set[int]:
+        """The sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target. IMPORTANT: if the Vertical List has a prefix, this sequence is not stored, but it is computed (from the prefixes) each time this property is accessed.
+        """
+        if self._prefix is None:
+            return self._sequence_of_instances_tp
+        return self._prefix.sequence_of_instances_tp - self._sequence_of_instances_tp
+
+    @property
+    def sequence_of_instances_fp(self) -> set[int]:
+        """The sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target. IMPORTANT: if the Vertical List has a prefix, this sequence is not stored, but it is computed (from the prefixes) each time this property is accessed.
+        """
+        if self._prefix is None:
+            return self._sequence_of_instances_fp
+        return self._prefix.sequence_of_instances_fp - self._sequence_of_instances_fp
+
+    def memory_usage(self, ids_of_the_counted_prefixes : Union[set[int], None] = None) -> int:
+        """Method to obtain the approximate number of bytes of memory used by the sequences of instances of the Vertical List. IMPORTANT: a Vertical List with a prefix keeps it alive, so the bytes of the sequences stored by its prefix are also counted, but only if the ID of the prefix (according to the 'id' function) is not in 'ids_of_the_counted_prefixes' (in that case, it is added to this set). In this way, a prefix shared by several Vertical Lists (e.g., by siblings in the search space) is counted only once. The rest of the chain of prefixes is not counted here, because it is kept alive by the prefix itself (i.e., it is counted along with the Vertical Lists which share the prefix of the prefix).
+
+        :param ids_of_the_counted_prefixes: python set with the IDs of the prefixes whose memory has already been counted (or None, in order to always count the prefix). IMPORTANT: it is modified. By default, None.
+        :return: the number of bytes.
+        """
+        memory = getsizeof(self._sequence_of_instances_tp) + getsizeof(self._sequence_of_instances_fp)
+        if (self._prefix is not None) and ((ids_of_the_counted_prefixes is None) or (id(self._prefix) not in ids_of_the_counted_prefixes)):
+            if (ids_of_the_counted_prefixes is not None):
+                ids_of_the_counted_prefixes.add(id(self._prefix))
+            memory = memory + getsizeof(self._prefix._sequence_of_instances_tp) + getsizeof(self._prefix._sequence_of_instances_fp)
+        return memory
+
+    @property
+    def tp(self) -> int:
+        return self._tp
+
+    @property
+    def fp(self) -> int:
+        return self._fp
+
+    @property
+    def n(self) -> int:
+        return self._tp + self._fp
+
+    def compute_quality_value(self, quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Method to compute the Vertical List quality value using the dictionary of parameters passed by parameter. This method uses the parameters 'tp' and 'fp' of the Vertical List, not of the dictionary of parameters passed by parameter. IMPORTANT: this method does not modify the Vertical List.
+
+        :param quality_measure: the quality measure which is used.
+        :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the Vertical List, not of the dictionary of parameters passed by parameter.
+        :return: the computed value for the Vertical List quality value.
+        """
+        if not isinstance(quality_measure, QualityMeasure):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        new_dict_of_parameters = dict_of_parameters.copy()
+        new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = self.tp
+        new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = self.fp
+        return quality_measure.compute(new_dict_of_parameters)
+
+    def join(self, other_vertical_list : 'VerticalListWithDiffsets', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False, minimum_quality_value : Union[int, float, None] = None) -> Union['VerticalListWithDiffsets', None]:
+        """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones. IMPORTANT: the new Vertical List only stores the difference between the sequences of this Vertical List (self) and its own sequences, so this Vertical List (self) is its prefix. If both Vertical Lists have the same prefix, the new diffsets are obtained directly from their diffsets (i.e., d(PXY) = d(PY) - d(PX)). In other case, they are obtained from their complete sequences (i.e., d(PXY) = t(PX) - t(PY)).
+
+        :param other_vertical_list: the Vertical List with which to make the join.
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
+        :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
+        :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
+        :param minimum_quality_value: if it is not None and the quality value of the resulting Vertical List (i.e., the join) is lower than this value, None will be returned instead of a Vertical List object. In this case, the sequences of the resulting Vertical List are not created. By default, None.
+        :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
+        """
+        if type(other_vertical_list) is not VerticalListWithDiffsets:
+            raise TypeError("The type of the parameter 'other_vertical_list' must be 'VerticalListWithDiffsets'.")
+        if not isinstance(quality_measure, QualityMeasure):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        if type(return_None_if_n_is_0) is not bool:
+            raise TypeError("The type of the parameter 'return_None_if_n_is_0' must be 'bool'.")
+        if (type(minimum_quality_value) is not int) and (type(minimum_quality_value) is not float) and (minimum_quality_value is not None):
+            raise TypeError("The type of the parameter 'minimum_quality_value' must be 'int', 'float' or 'NoneType'.")
+        if (self._number_of_dataset_instances != other_vertical_list._number_of_dataset_instances):
+            raise VerticalListSizeError("Vertical Lists with different 'number_of_dataset_instances' value cannot be joined.")
+        # Initially, the result is None.
+        result = None
+        # First, obtain the new diffsets (i.e., the instances of this Vertical List which are not in the other one).
+        if (self._prefix is not None) and (self._prefix is other_vertical_list._prefix):
+            # Both Vertical Lists have the same prefix (e.g., siblings in the search space).
+            new_diffset_tp = other_vertical_list._sequence_of_instances_tp - self._sequence_of_instances_tp
+            new_diffset_fp = other_vertical_list._sequence_of_instances_fp - self._sequence_of_instances_fp
+        else:
+            new_diffset_tp = self.sequence_of_instances_tp - other_vertical_list.sequence_of_instances_tp
+            new_diffset_fp = self.sequence_of_instances_fp - other_vertical_list.sequence_of_instances_fp
+        new_tp = self._tp - len(new_diffset_tp)
+        new_fp = self._fp - len(new_diffset_fp)
+        # Continue if the parameter 'return_None_if_n_is_0' is False OR n is greater than 0. In other case, return None.
+        if (not return_None_if_n_is_0) or ((new_tp + new_fp) > 0):
+            # Second, obtain the quality value.
+            new_dict_of_parameters = dict_of_parameters.copy()
+            new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = new_tp
+            new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = new_fp
+            new_quality_value = quality_measure.compute(new_dict_of_parameters)
+            # Continue if the parameter 'minimum_quality_value' is None OR the quality value is not lower than it. In other case, return None.
+            if (minimum_quality_value is None) or (new_quality_value >= minimum_quality_value):
+                # Third, add the last element of 'other_vertical_list'.
+                new_list_of_selectors = self._list_of_selectors.copy()
+                new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
+                # Finally, create the object.
+                result = VerticalListWithDiffsets(new_list_of_selectors, [], [], 0, new_quality_value)
+                result._prefix = self
+                result._sequence_of_instances_tp = new_diffset_tp
+                result._sequence_of_instances_fp = new_diffset_fp
+                result._tp = new_tp
+                result._fp = new_fp
+                result._number_of_dataset_instances = self._number_of_dataset_instances
+        # Return the result.
+        return result
+
+    def __str__(self) -> str:
+        # List of selectors.
+        list_of_selectors_as_str = "["
+        for e in self._list_of_selectors:
+            list_of_selectors_as_str = list_of_selectors_as_str + str(e) + ", "
+        if len(self._list_of_selectors) == 0:
+            list_of_selectors_as_str = list_of_selectors_as_str + "]"
+        else:
+            list_of_selectors_as_str = list_of_selectors_as_str[:-2]
+            list_of_selectors_as_str = list_of_selectors_as_str + "]"
+        # Sequence of instances tp.
+        sequence_of_instances_tp_as_list = list(self.sequence_of_instances_tp)
+        sequence_of_instances_tp_as_list.sort()
+        sequence_of_instances_tp_as_str = "[" + ", ".join([str(x) for x in sequence_of_instances_tp_as_list]) + "]"
+        # Sequence of instances fp.
+        sequence_of_instances_fp_as_list = list(self.sequence_of_instances_fp)
+        sequence_of_instances_fp_as_list.sort()
+        sequence_of_instances_fp_as_str = "[" + ", ".join([str(x) for x in sequence_of_instances_fp_as_list]) + "]"
+        # Return.
+        return "List of selectors: " + list_of_selectors_as_str + \
+            ", Sequence of instances (tp): " + sequence_of_instances_tp_as_str + \
+            ", Sequence of instances (fp): " + sequence_of_instances_fp_as_str + \
+            ", Quality value: " + str(self._quality_value)
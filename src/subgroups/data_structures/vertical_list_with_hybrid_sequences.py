@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a Vertical List data structure whose sequences are implemented using bitsets or sorted numpy arrays of integers, depending on their density.
+"""
+
+from collections.abc import Collection
+from bitarray import bitarray
+from bitarray.util import count_and
+from numpy import ndarray, frombuffer, zeros, packbits, unpackbits, flatnonzero, uint8
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.core.selector import Selector
+from subgroups.data_structures.vertical_list import VerticalList
+from subgroups.data_structures.vertical_list_with_sorted_arrays import _generate_sorted_array, _intersection, _intersection_size
+from subgroups.exceptions import VerticalListSizeError
+
+# Python annotations.
+from typing import Union
+
+def _sorted_array_to_bitset(sorted_array : ndarray, number_of_dataset_instances : int) -> bitarray:
+    """Private method to generate the bitset (with little endian) which stores the same IDs of dataset instances as a sorted numpy array.
+
+    :param sorted_array: the sorted numpy array.
+    :param number_of_dataset_instances: number of instances of the dataset (i.e., the length of the bitset).
+    :return: the bitset.
+    """
+    mask = zeros(number_of_dataset_instances, dtype=bool)
+    mask[sorted_array] = True
+    result = bitarray(endian = "little")
+    result.frombytes(packbits(mask, bitorder="little").tobytes())
+    del result[number_of_dataset_instances:]
+    return result
+
+def _bitset_to_sorted_array(bitset : bitarray) -> ndarray:
+    """Private method to generate the sorted numpy array which stores the same IDs of dataset instances as a bitset (with little endian).
+
+    :param bitset: the bitset.
+    :return: the sorted numpy array.
+    """
+    return flatnonzero(unpackbits(frombuffer(bitset, dtype=uint8), count=len(bitset), bitorder="little"))
+
+def _elements_of_sorted_array_in_bitset(sorted_array : ndarray, bitset : bitarray) -> ndarray:
+    """Private method to check which elements of a sorted numpy array are set to 1 in a bitset (with little endian), without converting any of them.
+
+    :param sorted_array: the sorted numpy array.
+    :param bitset: the bitset.
+    :return: numpy array of type bool with the same length as the sorted numpy array.
+    """
+    words = frombuffer(bitset, dtype=uint8)
+    return ((words[sorted_array >> 3] >> (sorted_array & 7).astype(uint8)) & 1).astype(bool)
+
+class VerticalListWithHybridSequences(VerticalList):
+    """This class represents a Vertical List data structure whose sequences are implemented, independently of each other, using bitsets (dense sequences) or sorted numpy arrays of integers (sparse sequences). A sequence is stored in a sorted numpy array if its density (i.e., the number of IDs divided by the number of instances of the dataset) is lower than 'MAXIMUM_DENSITY_OF_A_SORTED_ARRAY', and in a bitset in other case. The representation is chosen again for each sequence created in a join, so that the sequences of the Vertical Lists with few selectors (which cover a large number of instances) are usually bitsets and the sequences of the Vertical Lists with many selectors (which cover a small number of instances) are usually sorted numpy arrays. The join works directly with any combination of representations: the intersection of two bitsets is made by means of a bitwise AND, the intersection of two sorted numpy arrays is made as in the class 'VerticalListWithSortedArrays', and the intersection of a sorted numpy array and a bitset is made by checking the bits of the elements of the sorted numpy array (i.e., its cost depends on the size of the sorted numpy array). IMPORTANT: if a sequence passed by parameter is a numpy array of integers, it is not copied when it is stored in a sorted numpy array, so it must be sorted, must not contain duplicates and must not be modified later.
+
+    :param list_of_selectors: the list of selectors represented by the Vertical List.
+    :param sequence_of_instances_tp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target. The number of elements in this sequence would be the true positives tp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param sequence_of_instances_fp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target. The number of elements in this sequence would be the false positives fp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param number_of_dataset_instances: number of instances of the dataset.
+    :param quality_value: the Vertical List quality value.
+    """
+
+    __slots__ = ()
+
+    # Maximum density of a sequence stored in a sorted numpy array. With this value, a sorted numpy array of type int32 never uses more memory than the equivalent bitset.
+    MAXIMUM_DENSITY_OF_A_SORTED_ARRAY = 1/32
+
+    def __init__(self, list_of_selectors : list[Selector], sequence_of_instances_tp : Collection[int], sequence_of_instances_fp : Collection[int], number_of_dataset_instances : int, quality_value : Union[int, float]) -> None:
+        # Call to __init__ method of the parent class.
+        super().__init__(list_of_selectors, sequence_of_instances_tp, sequence_of_instances_fp, number_of_dataset_instances, quality_value)
+        # sequence of instances tp.
+        sorted_array_tp = _generate_sorted_array(sequence_of_instances_tp)
+        self._sequence_of_instances_tp = self._generate_sequence(sorted_array_tp)
+        self._tp = len(sorted_array_tp)
+        # sequence of instances fp.
+        sorted_array_fp = _generate_sorted_array(sequence_of_instances_fp)
+        self._sequence_of_instances_fp = self._generate_sequence(sorted_array_fp)
+        self._fp = len(sorted_array_fp)
+
+    def _generate_sequence(self, sorted_array : ndarray) -> Union[bitarray, ndarray]:
+        """Private method to choose the representation of a sequence of IDs of dataset instances according to its density.
+
+        :param sorted_array: the sequence of IDs of the dataset instances as a sorted numpy array.
+        :return: the same numpy array if the sequence is sparse or a new bitset in other case.
+        """
+        if len(sorted_array) < (self._number_of_dataset_instances * VerticalListWithHybridSequences.MAXIMUM_DENSITY_OF_A_SORTED_ARRAY):
+            return sorted_array
+        return _sorted_array_to_bitset(sorted_array, self._number_of_dataset_instances)
+
+    @property
+    def sequence_of_instances_tp(self) -> Union[bitarray, ndarray]:
+        """The sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target. It is a bitset (with little endian) if the sequence is dense and a sorted numpy array if it is sparse.
+        """
+        return self._sequence_of_instances_tp
+
+    @property
+    def sequence_of_instances_fp(self) -> Union[bitarray, ndarray]:
+        """The sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target. It is a bitset (with little endian) if the sequence is dense and a sorted numpy array if it is sparse.
+        """
+        return self._sequence_of_instances_fp
+
+    @property
+    def tp(self) -> int:
+        return self._tp
+
+    @property
+    def fp(self) -> int:
+        return self._fp
+
+    @property
+    def n(self) -> int:
+        return self._tp + self._fp
+
+    def compute_quality_value(self, quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Method to compute the Vertical List quality value using the dictionary of parameters passed by parameter. This method uses the parameters 'tp' and 'fp' of the Vertical List, not of the dictionary of parameters passed by parameter. IMPORTANT: this method does not modify the Vertical List.
+
+        :param quality_measure: the quality measure which is used.
+        :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the Vertical List, not of the dictionary of parameters passed by parameter.
+        :return: the computed value for the Vertical List quality value.
+        """
+        if not isinstance(quality_measure, QualityMeasure):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        new_dict_of_parameters = dict_of_parameters.copy()
+        new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = self.tp
+        new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = self.fp
+        return quality_measure.compute(new_dict_of_parameters)
+
+    @staticmethod
+    def _intersection_size(sequence_a : Union[bitarray, ndarray], sequence_b : Union[bitarray, ndarray]) -> int:
+        """Private method to obtain the number of IDs which are in two sequences (with any representation), without creating their intersection.
+
+        :param sequence_a: the first sequence.
+        :param sequence_b: the second sequence.
+        :return: the size of the intersection of both sequences.
+        """
+        a_is_bitset = (type(sequence_a) is bitarray)
+        b_is_bitset = (type(sequence_b) is bitarray)
+        if a_is_bitset and b_is_bitset:
+            return count_and(sequence_a, sequence_b)
+        elif a_is_bitset:
+            return int(_elements_of_sorted_array_in_bitset(sequence_b, sequence_a).sum())
+        elif b_is_bitset:
+            return int(_elements_of_sorted_array_in_bitset(sequence_a, sequence_b).sum())
+        else:
+            return _intersection_size(sequence_a, sequence_b)
+
+    def _intersection(self, sequence_a : Union[bitarray, ndarray], sequence_b : Union[bitarray, ndarray], size : int) -> Union[bitarray, ndarray]:
+        """Private method to obtain the intersection of two sequences (with any representation). The representation of the result is chosen according to its density.
+
+        :param sequence_a: the first sequence.
+        :param sequence_b: the second sequence.
+        :param size: the size of the intersection of both sequences (previously computed).
+        :return: the intersection of both sequences.
+        """
+        a_is_bitset = (type(sequence_a) is bitarray)
+        b_is_bitset = (type(sequence_b) is bitarray)
+        if a_is_bitset and b_is_bitset:
+            result = sequence_a & sequence_b
+            # The intersection of two dense sequences might be sparse.
+            if size < (self._number_of_dataset_instances * VerticalListWithHybridSequences.MAXIMUM_DENSITY_OF_A_SORTED_ARRAY):
+                result = _bitset_to_sorted_array(result)
+            return result
+        # If one of the sequences is a sorted numpy array, the intersection is always sparse (it is a subset of it).
+        elif a_is_bitset:
+            return sequence_b[_elements_of_sorted_array_in_bitset(sequence_b, sequence_a)]
+        elif b_is_bitset:
+            return sequence_a[_elements_of_sorted_array_in_bitset(sequence_a, sequence_b)]
+        else:
+            return _intersection(sequence_a, sequence_b)
+
+    def join(self, other_vertical_list : 'VerticalListWithHybridSequences', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False, minimum_quality_value : Union[int, float, None] = None) -> Union['VerticalListWithHybridSequences', None]:
+        """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones.
+
+        :param other_vertical_list: the Vertical List with which to make the join.
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
+        :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
+        :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
+        :param minimum_quality_value: if it is not None and the quality value of the resulting Vertical List (i.e., the join) is lower than this value, None will be returned instead of a Vertical List object. In this case, the sequences of the resulting Vertical List are not created. By default, None.
+        :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
+        """
+        if type(other_vertical_list) is not VerticalListWithHybridSequences:
+            raise TypeError("The type of the parameter 'other_vertical_list' must be 'VerticalListWithHybridSequences'.")
+        if not isinstance(quality_measure, QualityMeasure):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        if type(return_None_if_n_is_0) is not bool:
+            raise TypeError("The type of the parameter 'return_None_if_n_is_0' must be 'bool'.")
+        if (type(minimum_quality_value) is not int) and (type(minimum_quality_value) is not float) and (minimum_quality_value is not None):
+            raise TypeError("The type of the parameter 'minimum_quality_value' must be 'int', 'float' or 'NoneType'.")
+        if (self._number_of_dataset_instances != other_vertical_list._number_of_dataset_instances):
+            raise VerticalListSizeError("Vertical Lists with different 'number_of_dataset_instances' value cannot be joined.")
+        # Initially, the result is None.
+        result = None
+        # First, count the instances of the intersection of both sequences without creating it (most of the joins are discarded later).
+        new_tp = VerticalListWithHybridSequences._intersection_size(self._sequence_of_instances_tp, other_vertical_list._sequence_of_instances_tp)
+        new_fp = VerticalListWithHybridSequences._intersection_size(self._sequence_of_instances_fp, other_vertical_list._sequence_of_instances_fp)
+        # Continue if the parameter 'return_None_if_n_is_0' is False OR n is greater than 0. In other case, return None.
+        if (not return_None_if_n_is_0) or ((new_tp + new_fp) > 0):
+            # Second, obtain the quality value.
+            new_dict_of_parameters = dict_of_parameters.copy()
+            new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = new_tp
+            new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = new_fp
+            new_quality_value = quality_measure.compute(new_dict_of_parameters)
+            # Continue if the parameter 'minimum_quality_value' is None OR the quality value is not lower than it. In other case, return None.
+            if (minimum_quality_value is None) or (new_quality_value >= minimum_quality_value):
+                # Third, make the intersection of both sequences (without converting them) and add the last element of 'other_vertical_list'.
+                new_list_of_selectors = self._list_of_selectors.copy()
+                new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
+                # Finally, create the object.
+                result = VerticalListWithHybridSequences(new_list_of_selectors, [], [], self._number_of_dataset_instances, new_quality_value)
+                result._sequence_of_instances_tp = result._intersection(self._sequence_of_instances_tp, other_vertical_list._sequence_of_instances_tp, new_tp)
+                result._sequence_of_instances_fp = result._intersection(self._sequence_of_instances_fp, other_vertical_list._sequence_of_instances_fp, new_fp)
+                result._tp = new_tp
+                result._fp = new_fp
+        # Return the result.
+        return result
+
+    def __str__(self) -> str:
+        # List of selectors.
+        list_of_selectors_as_str = "["
+        for e in self._list_of_selectors:
+            list_of_selectors_as_str = list_of_selectors_as_str + str(e) + ", "
+        if len(self._list_of_selectors) == 0:
+            list_of_selectors_as_str = list_of_selectors_as_str + "]"
+        else:
+            list_of_selectors_as_str = list_of_selectors_as_str[:-2]
+            list_of_selectors_as_str = list_of_selectors_as_str + "]"
+        # Sequence of instances tp (always shown as a list of IDs, independently of its representation).
+        if type(self._sequence_of_instances_tp) is bitarray:
+            sequence_of_instances_tp_as_list = _bitset_to_sorted_array(self._sequence_of_instances_tp).tolist()
+        else:
+            sequence_of_instances_tp_as_list = self._sequence_of_instances_tp.tolist()
+        sequence_of_instances_tp_as_str = "["
+        for x in sequence_of_instances_tp_as_list:
+            sequence_of_instances_tp_as_str = sequence_of_instances_tp_as_str + str(x) + ", "
+        if (sequence_of_instances_tp_as_str[-1] == " ") and (sequence_of_instances_tp_as_str[-2] == ","):
+            sequence_of_instances_tp_as_str = sequence_of_instances_tp_as_str[:-2]
+            sequence_of_instances_tp_as_str = sequence_of_instances_tp_as_str + "]"
+        else:
+            sequence_of_instances_tp_as_str = sequence_of_instances_tp_as_str + "]"
+        # Sequence of instances fp (always shown as a list of IDs, independently of its representation).
+        if type(self._sequence_of_instances_fp) is bitarray:
+            sequence_of_instances_fp_as_list = _bitset_to_sorted_array(self._sequence_of_instances_fp).tolist()
+        else:
+            sequence_of_instances_fp_as_list = self._sequence_of_instances_fp.tolist()
+        sequence_of_instances_fp_as_str = "["
+        for x in sequence_of_instances_fp_as_list:
+            sequence_of_instances_fp_as_str = sequence_of_instances_fp_as_str + str(x) + ", "
+        if (sequence_of_instances_fp_as_str[-1] == " ") and (sequence_of_instances_fp_as_str[-2] == ","):
+            sequence_of_instances_fp_as_str = sequence_of_instances_fp_as_str[:-2]
+            sequence_of_instances_fp_as_str = sequence_of_instances_fp_as_str + "]"
+        else:
+            sequence_of_instances_fp_as_str = sequence_of_instances_fp_as_str + "]"
+        # Return.
+        return "List of selectors: " + list_of_selectors_as_str + \
+            ", Sequence of instances (tp): " + sequence_of_instances_tp_as_str + \
+            ", Sequence of instances (fp): " + sequence_of_instances_fp_as_str + \
+            ", Quality value: " + str(self._quality_value)
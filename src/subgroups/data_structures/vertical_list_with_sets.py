@@ -73,13 +73,14 @@ class VerticalListWithSets(VerticalList):
         new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = self.fp
         return quality_measure.compute(new_dict_of_parameters)
     
-    def join(self, other_vertical_list : 'VerticalListWithSets', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalListWithSets', None]:
+    def join(self, other_vertical_list : 'VerticalListWithSets', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False, minimum_quality_value : Union[int, float, None] = None) -> Union['VerticalListWithSets', None]:
         """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones.
         
         :param other_vertical_list: the Vertical List with which to make the join.
         :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
         :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
         :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
+        :param minimum_quality_value: if it is not None and the quality value of the resulting Vertical List (i.e., the join) is lower than this value, None will be returned instead of a Vertical List object. In this case, the sequences of the resulting Vertical List are not created. By default, None.
         :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
         """
         if type(other_vertical_list) is not VerticalListWithSets:
@@ -90,6 +91,8 @@ class VerticalListWithSets(VerticalList):
             raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
         if type(return_None_if_n_is_0) is not bool:
             raise TypeError("The type of the parameter 'return_None_if_n_is_0' must be 'bool'.")
+        if (type(minimum_quality_value) is not int) and (type(minimum_quality_value) is not float) and (minimum_quality_value is not None):
+            raise TypeError("The type of the parameter 'minimum_quality_value' must be 'int', 'float' or 'NoneType'.")
         if (self._number_of_dataset_instances != other_vertical_list._number_of_dataset_instances):
             raise VerticalListSizeError("Vertical Lists with different 'number_of_dataset_instances' value cannot be joined.")
         # Initially, the result is None.
@@ -101,21 +104,23 @@ class VerticalListWithSets(VerticalList):
         new_fp = len(new_sequence_of_instances_fp)
         # Continue if the parameter 'return_None_if_n_is_0' is False OR n is greater than 0. In other case, return None.
         if (not return_None_if_n_is_0) or ((new_tp + new_fp) > 0):
-            # Second, add the last element of 'other_vertical_list'.
-            new_list_of_selectors = self._list_of_selectors.copy()
-            new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
-            # Third, obtain the quality value.
+            # Second, obtain the quality value.
             new_dict_of_parameters = dict_of_parameters.copy()
             new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = new_tp 
             new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = new_fp
             new_quality_value = quality_measure.compute(new_dict_of_parameters)
-            # Finally, create the object.
-            result = VerticalListWithSets(new_list_of_selectors, [], [], 0, new_quality_value)
-            result._sequence_of_instances_tp = new_sequence_of_instances_tp
-            result._sequence_of_instances_fp = new_sequence_of_instances_fp
-            result._tp = new_tp
-            result._fp = new_fp
-            result._number_of_dataset_instances = self._number_of_dataset_instances
+            # Continue if the parameter 'minimum_quality_value' is None OR the quality value is not lower than it. In other case, return None.
+            if (minimum_quality_value is None) or (new_quality_value >= minimum_quality_value):
+                # Third, add the last element of 'other_vertical_list'.
+                new_list_of_selectors = self._list_of_selectors.copy()
+                new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
+                # Finally, create the object.
+                result = VerticalListWithSets(new_list_of_selectors, [], [], 0, new_quality_value)
+                result._sequence_of_instances_tp = new_sequence_of_instances_tp
+                result._sequence_of_instances_fp = new_sequence_of_instances_fp
+                result._tp = new_tp
+                result._fp = new_fp
+                result._number_of_dataset_instances = self._number_of_dataset_instances
         # Return the result.
         return result
     
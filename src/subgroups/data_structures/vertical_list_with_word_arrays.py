@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a Vertical List data structure whose sequences are implemented using numpy arrays of 64-bit words. The sequences of several Vertical Lists can be rows of the same 2-dimensional array (i.e., a word matrix), so that a Vertical List can be joined with all of them at once.
+"""
+
+from collections.abc import Collection
+from bitarray import bitarray
+from numpy import ndarray, dtype, zeros, asarray, packbits, unpackbits, flatnonzero, stack, uint8, intp
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.core.selector import Selector
+from subgroups.data_structures.vertical_list import VerticalList
+from subgroups.exceptions import VerticalListSizeError
+
+# Python annotations.
+from typing import Union
+
+try:
+    from numpy import bitwise_count
+except ImportError: # numpy < 2.0 does not have the 'bitwise_count' function, so we count the bits of each byte using a table.
+    from numpy import array
+    _NUMBER_OF_BITS_IN_EACH_BYTE = array([bin(byte).count("1") for byte in range(256)], dtype=uint8)
+    def bitwise_count(words : ndarray) -> ndarray:
+        return _NUMBER_OF_BITS_IN_EACH_BYTE[words.view(uint8)]
+
+# IMPORTANT: the instance i is the bit (i % 64) of the word (i // 64), and the words are little-endian. In this way, the bytes of a word array are exactly the bytes of a bitarray with endian = "little".
+_WORD_DTYPE = dtype("<u8")
+
+def _generate_word_array(sequence_of_instances : Collection[int], number_of_dataset_instances : int) -> ndarray:
+    """Private method to generate an array of 64-bit words in which the bits of the instances in the sequence are set to 1.
+
+    :param sequence_of_instances: the sequence of IDs of the dataset instances.
+    :param number_of_dataset_instances: number of instances of the dataset.
+    :return: the generated array of 64-bit words.
+    """
+    number_of_words = (number_of_dataset_instances + 63) // 64
+    mask = zeros(number_of_words * 64, dtype=bool)
+    if not isinstance(sequence_of_instances, ndarray):
+        sequence_of_instances = list(sequence_of_instances)
+    mask[asarray(sequence_of_instances, dtype=intp)] = True
+    return packbits(mask, bitorder="little").view(_WORD_DTYPE)
+
+class VerticalListWithWordArrays(VerticalList):
+    """This class represents a Vertical List data structure whose sequences are implemented using numpy arrays of 64-bit words. Each sequence is a row of a word matrix, which can be shared with other Vertical Lists (e.g., with its siblings in the search space).
+
+    :param list_of_selectors: the list of selectors represented by the Vertical List.
+    :param sequence_of_instances_tp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target. The number of elements in this sequence would be the true positives tp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param sequence_of_instances_fp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target. The number of elements in this sequence would be the false positives fp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param number_of_dataset_instances: number of instances of the dataset.
+    :param quality_value: the Vertical List quality value.
+    """
+
+    __slots__ = ("_matrix_tp", "_matrix_fp", "_row")
+
+    def __init__(self, list_of_selectors : list[Selector], sequence_of_instances_tp : Collection[int], sequence_of_instances_fp : Collection[int], number_of_dataset_instances : int, quality_value : Union[int, float]) -> None:
+        # Call to __init__ method of the parent class.
+        super().__init__(list_of_selectors, sequence_of_instances_tp, sequence_of_instances_fp, number_of_dataset_instances, quality_value)
+        # Initially, each sequence is the only row of its own word matrix.
+        self._row = 0
+        # sequence of instances tp.
+        self._matrix_tp = _generate_word_array(sequence_of_instances_tp, number_of_dataset_instances).reshape(1, -1)
+        self._sequence_of_instances_tp = self._matrix_tp[0]
+        self._tp = len(sequence_of_instances_tp) # The length of the parameter, not of the attribute.
+        # sequence of instances fp.
+        self._matrix_fp = _generate_word_array(sequence_of_instances_fp, number_of_dataset_instances).reshape(1, -1)
+        self._sequence_of_instances_fp = self._matrix_fp[0]
+        self._fp = len(sequence_of_instances_fp) # The length of the parameter, not of the attribute.
+
+    @classmethod
+    def _create_from_word_matrices(cls, list_of_selectors : list[Selector], matrix_tp : ndarray, matrix_fp : ndarray, row : int, tp : int, fp : int, number_of_dataset_instances : int, quality_value : Union[int, float]) -> 'VerticalListWithWordArrays':
+        """Private method to create a Vertical List whose sequences are rows of existing word matrices. IMPORTANT: the parameters are not checked and the word matrices are not copied.
+
+        :param list_of_selectors: the list of selectors represented by the Vertical List.
+        :param matrix_tp: the word matrix which contains the sequence of instances tp.
+        :param matrix_fp: the word matrix which contains the sequence of instances fp.
+        :param row: the row of the word matrices which contains the sequences of the Vertical List.
+        :param tp: the true positives tp (i.e., the number of bits set to 1 in the sequence of instances tp).
+        :param fp: the false positives fp (i.e., the number of bits set to 1 in the sequence of instances fp).
+        :param number_of_dataset_instances: number of instances of the dataset.
+        :param quality_value: the Vertical List quality value.
+        :return: the created Vertical List.
+        """
+        result = cls.__new__(cls)
+        result._list_of_selectors = list_of_selectors
+        result._number_of_dataset_instances = number_of_dataset_instances
+        result._quality_value = quality_value
+        result._matrix_tp = matrix_tp
+        result._matrix_fp = matrix_fp
+        result._row = row
+        result._sequence_of_instances_tp = matrix_tp[row]
+        result._sequence_of_instances_fp = matrix_fp[row]
+        result._tp = tp
+        result._fp = fp
+        return result
+
+    def memory_usage(self, ids_of_the_counted_prefixes : Union[set[int], None] = None) -> int:
+        """Method to obtain the approximate number of bytes of memory used by the sequences of instances of the Vertical List. IMPORTANT: the sequences are rows of word matrices which might be shared with other Vertical Lists, so only the bytes of those rows are counted.
+        
+        :param ids_of_the_counted_prefixes: not used by this implementation (see the 'memory_usage' method of the class 'VerticalList'). By default, None.
+        :return: the number of bytes.
+        """
+        return self._sequence_of_instances_tp.nbytes + self._sequence_of_instances_fp.nbytes
+
+    @staticmethod
+    def share_word_matrices(vertical_lists : list['VerticalListWithWordArrays']) -> None:
+        """Method to copy the sequences of a list of Vertical Lists into the rows of two common word matrices (one for the sequences of instances tp and other for the sequences of instances fp), so that the joins with all of them can be made at once (see the 'join_with_many' method). IMPORTANT: this method modifies the Vertical Lists passed by parameter.
+
+        :param vertical_lists: the list of Vertical Lists whose sequences are copied. All of them must have the same 'number_of_dataset_instances' value.
+        """
+        if type(vertical_lists) is not list:
+            raise TypeError("The type of the parameter 'vertical_lists' must be 'list'.")
+        if not vertical_lists:
+            return
+        for vertical_list in vertical_lists:
+            if type(vertical_list) is not VerticalListWithWordArrays:
+                raise TypeError("The type of all the elements of the parameter 'vertical_lists' must be 'VerticalListWithWordArrays'.")
+            if (vertical_list._number_of_dataset_instances != vertical_lists[0]._number_of_dataset_instances):
+                raise VerticalListSizeError("Vertical Lists with different 'number_of_dataset_instances' value cannot share the same word matrices.")
+        matrix_tp = stack([vertical_list._sequence_of_instances_tp for vertical_list in vertical_lists])
+        matrix_fp = stack([vertical_list._sequence_of_instances_fp for vertical_list in vertical_lists])
+        for row, vertical_list in enumerate(vertical_lists):
+            vertical_list._matrix_tp = matrix_tp
+            vertical_list._matrix_fp = matrix_fp
+            vertical_list._row = row
+            vertical_list._sequence_of_instances_tp = matrix_tp[row]
+            vertical_list._sequence_of_instances_fp = matrix_fp[row]
+
+    @property
+    def sequence_of_instances_tp(self) -> bitarray:
+        """The sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target.
+        """
+        result = bitarray(endian = "little")
+        result.frombytes(self._sequence_of_instances_tp.tobytes())
+        return result[:self._number_of_dataset_instances]
+
+    @property
+    def sequence_of_instances_fp(self) -> bitarray:
+        """The sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target.
+        """
+        result = bitarray(endian = "little")
+        result.frombytes(self._sequence_of_instances_fp.tobytes())
+        return result[:self._number_of_dataset_instances]
+
+    @property
+    def tp(self) -> int:
+        """The number of dataset instances which are covered by the selectors ('list_of_selectors') and also by the target.
+        """
+        return self._tp
+
+    @property
+    def fp(self) -> int:
+        """The number of dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target.
+        """
+        return self._fp
+
+    @property
+    def n(self) -> int:
+        """The number of dataset instances which are covered by the selectors ('list_of_selectors'), no matter the target.
+        """
+        return self._tp + self._fp
+
+    def compute_quality_value(self, quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Method to compute the Vertical List quality value using the dictionary of parameters passed by parameter. This method uses the parameters 'tp' and 'fp' of the Vertical List, not of the dictionary of parameters passed by parameter. IMPORTANT: this method does not modify the Vertical List.
+
+        :param quality_measure: the quality measure which is used.
+        :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the Vertical List, not of the dictionary of parameters passed by parameter.
+        :return: the computed value for the Vertical List quality value.
+        """
+        if not isinstance(quality_measure, QualityMeasure):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        new_dict_of_parameters = dict_of_parameters.copy()
+        new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = self.tp
+        new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = self.fp
+        return quality_measure.compute(new_dict_of_parameters)
+
+    def join(self, other_vertical_list : 'VerticalListWithWordArrays', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False, minimum_quality_value : Union[int, float, None] = None) -> Union['VerticalListWithWordArrays', None]:
+        """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones.
+
+        :param other_vertical_list: the Vertical List with which to make the join.
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
+        :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
+        :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
+        :param minimum_quality_value: if it is not None and the quality value of the resulting Vertical List (i.e., the join) is lower than this value, None will be returned instead of a Vertical List object. In this case, the sequences of the resulting Vertical List are not created. By default, None.
+        :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
+        """
+        if type(other_vertical_list) is not VerticalListWithWordArrays:
+            raise TypeError("The type of the parameter 'other_vertical_list' must be 'VerticalListWithWordArrays'.")
+        return self.join_with_many([other_vertical_list], quality_measure, dict_of_parameters, return_None_if_n_is_0 = return_None_if_n_is_0, minimum_quality_value = minimum_quality_value)[0]
+
+    def join_with_many(self, other_vertical_lists : list['VerticalListWithWordArrays'], quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False, minimum_quality_value : Union[int, float, None] = None) -> list[Union['VerticalListWithWordArrays', None]]:
+        """Method to join this Vertical List with each one of the Vertical Lists of a list (see the 'join' method). All the joins are made at once: the sequences of the other Vertical Lists are gathered in a word matrix, which is intersected with the sequences of this Vertical List and whose bits are counted by rows. Only the resulting Vertical Lists which are not discarded (according to the parameters 'return_None_if_n_is_0' and 'minimum_quality_value') are created, and their sequences are rows of the same new word matrices.
+
+        :param other_vertical_lists: the list of Vertical Lists with which to make the joins.
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical Lists.
+        :param dict_of_parameters: python dictionary which contains all the needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical Lists, not of the dictionary of parameters passed by parameter.
+        :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of a resulting Vertical List is 0 and this parameter is True, None will be returned instead of that Vertical List. By default, this parameter is False.
+        :param minimum_quality_value: if it is not None, None will be returned instead of each resulting Vertical List whose quality value is lower than this value. By default, None.
+        :return: a list with the same length as 'other_vertical_lists', in which the element i is the join of this Vertical List (self) and other_vertical_lists[i] (or None, according to the parameters 'return_None_if_n_is_0' and 'minimum_quality_value').
+        """
+        if type(other_vertical_lists) is not list:
+            raise TypeError("The type of the parameter 'other_vertical_lists' must be 'list'.")
+        if not isinstance(quality_measure, QualityMeasure):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        if type(return_None_if_n_is_0) is not bool:
+            raise TypeError("The type of the parameter 'return_None_if_n_is_0' must be 'bool'.")
+        if (type(minimum_quality_value) is not int) and (type(minimum_quality_value) is not float) and (minimum_quality_value is not None):
+            raise TypeError("The type of the parameter 'minimum_quality_value' must be 'int', 'float' or 'NoneType'.")
+        for other_vertical_list in other_vertical_lists:
+            if type(other_vertical_list) is not VerticalListWithWordArrays:
+                raise TypeError("The type of all the elements of the parameter 'other_vertical_lists' must be 'VerticalListWithWordArrays'.")
+            if (self._number_of_dataset_instances != other_vertical_list._number_of_dataset_instances):
+                raise VerticalListSizeError("Vertical Lists with different 'number_of_dataset_instances' value cannot be joined.")
+        result = [None] * len(other_vertical_lists)
+        if not other_vertical_lists:
+            return result
+        # First, gather the sequences of the other Vertical Lists in two word matrices (a copy is always made, because the intersection is done in place).
+        first_matrix_tp = other_vertical_lists[0]._matrix_tp
+        if all(other_vertical_list._matrix_tp is first_matrix_tp for other_vertical_list in other_vertical_lists):
+            # All of them are rows of the same word matrices (e.g., siblings in the search space).
+            rows = [other_vertical_list._row for other_vertical_list in other_vertical_lists]
+            new_matrix_tp = first_matrix_tp[rows]
+            new_matrix_fp = other_vertical_lists[0]._matrix_fp[rows]
+        else:
+            new_matrix_tp = stack([other_vertical_list._sequence_of_instances_tp for other_vertical_list in other_vertical_lists])
+            new_matrix_fp = stack([other_vertical_list._sequence_of_instances_fp for other_vertical_list in other_vertical_lists])
+        # Second, make the intersections (using the AND operator on all the rows at once) and count the bits of each row.
+        new_matrix_tp &= self._sequence_of_instances_tp
+        new_matrix_fp &= self._sequence_of_instances_fp
+        new_tps = bitwise_count(new_matrix_tp).sum(axis=1).tolist()
+        new_fps = bitwise_count(new_matrix_fp).sum(axis=1).tolist()
+        # Third, obtain the quality values and select the resulting Vertical Lists which are not discarded.
+        new_dict_of_parameters = dict_of_parameters.copy()
+        indices_of_the_selected_vertical_lists = []
+        quality_values_of_the_selected_vertical_lists = []
+        for index in range(len(other_vertical_lists)):
+            new_tp = new_tps[index]
+            new_fp = new_fps[index]
+            if return_None_if_n_is_0 and ((new_tp + new_fp) == 0):
+                continue
+            new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = new_tp
+            new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = new_fp
+            new_quality_value = quality_measure.compute(new_dict_of_parameters)
+            if (minimum_quality_value is not None) and (new_quality_value < minimum_quality_value):
+                continue
+            indices_of_the_selected_vertical_lists.append(index)
+            quality_values_of_the_selected_vertical_lists.append(new_quality_value)
+        # Finally, create only the selected Vertical Lists. Their sequences are the rows of two new word matrices.
+        if indices_of_the_selected_vertical_lists:
+            if len(indices_of_the_selected_vertical_lists) < len(other_vertical_lists):
+                new_matrix_tp = new_matrix_tp[indices_of_the_selected_vertical_lists]
+                new_matrix_fp = new_matrix_fp[indices_of_the_selected_vertical_lists]
+            for row, index in enumerate(indices_of_the_selected_vertical_lists):
+                new_list_of_selectors = self._list_of_selectors.copy()
+                new_list_of_selectors.append(other_vertical_lists[index]._list_of_selectors[-1])
+                result[index] = VerticalListWithWordArrays._create_from_word_matrices(new_list_of_selectors, new_matrix_tp, new_matrix_fp, row, new_tps[index], new_fps[index], self._number_of_dataset_instances, quality_values_of_the_selected_vertical_lists[row])
+        return result
+
+    def __str__(self) -> str:
+        # List of selectors.
+        list_of_selectors_as_str = "["
+        for e in self._list_of_selectors:
+            list_of_selectors_as_str = list_of_selectors_as_str + str(e) + ", "
+        if len(self._list_of_selectors) == 0:
+            list_of_selectors_as_str = list_of_selectors_as_str + "]"
+        else:
+            list_of_selectors_as_str = list_of_selectors_as_str[:-2]
+            list_of_selectors_as_str = list_of_selectors_as_str + "]"
+        # Sequence of instances tp.
+        sequence_of_instances_tp_as_list = flatnonzero(unpackbits(self._sequence_of_instances_tp.view(uint8), bitorder="little")).tolist()
+        sequence_of_instances_tp_as_str = "[" + ", ".join([str(x) for x in sequence_of_instances_tp_as_list]) + "]"
+        # Sequence of instances fp.
+        sequence_of_instances_fp_as_list = flatnonzero(unpackbits(self._sequence_of_instances_fp.view(uint8), bitorder="little")).tolist()
+        sequence_of_instances_fp_as_str = "[" + ", ".join([str(x) for x in sequence_of_instances_fp_as_list]) + "]"
+        # Return.
+        return "List of selectors: " + list_of_selectors_as_str + \
+            ", Sequence of instances (tp): " + sequence_of_instances_tp_as_str + \
+            ", Sequence of instances (fp): " + sequence_of_instances_fp_as_str + \
+            ", Quality value: " + str(self._quality_value)
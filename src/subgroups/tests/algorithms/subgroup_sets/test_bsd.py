@@ -114,4 +114,38 @@ class TestBSD(unittest.TestCase):
         self.assertIn(Subgroup.generate_from_str("Description: [coke = 'yes'], Target: diaper = 'yes'"), list_of_subgroups)
         self.assertIn(Subgroup.generate_from_str("Description: [beer = 'yes'], Target: diaper = 'yes'"), list_of_subgroups)
         file_to_read.close()
-        remove("./results.txt")
\ No newline at end of file
+        remove("./results.txt")
+
+    def test_BSD_selectors_of_the_same_attribute(self) -> None:
+        class BSDCountingIntersections(BSD):
+            __slots__ = "_number_of_intersections"
+            def _logicalAnd(self, bitarr1, bitarr2):
+                self._number_of_intersections = self._number_of_intersections + 1
+                return super()._logicalAnd(bitarr1, bitarr2)
+        class BSDWithoutSkipping(BSDCountingIntersections):
+            def _remove_selectors_of_the_same_attribute(self, selector, selRel):
+                return selRel.copy()
+        # Dataset with a high-cardinality attribute.
+        df = DataFrame({"a1" : [str(i % 12) for i in range(48)], "a2" : [str(i % 3) for i in range(48)], "a3" : [str((i // 5) % 2) for i in range(48)], "class" : ["y" if (i % 4 == 0) or (i % 7 == 1) else "n" for i in range(48)]})
+        target = ("class", "y")
+        bsd = BSDCountingIntersections(0, WRAcc(), WRAccOptimisticEstimate1(), 10, 3, write_results_in_file=True, file_path="./results.txt")
+        bsd._number_of_intersections = 0
+        bsd.fit(df, target)
+        file_to_read = open("./results.txt", "r")
+        list_of_written_results = file_to_read.readlines()
+        file_to_read.close()
+        remove("./results.txt")
+        bsd_without_skipping = BSDWithoutSkipping(0, WRAcc(), WRAccOptimisticEstimate1(), 10, 3, write_results_in_file=True, file_path="./results.txt")
+        bsd_without_skipping._number_of_intersections = 0
+        bsd_without_skipping.fit(df, target)
+        file_to_read = open("./results.txt", "r")
+        all_the_results = file_to_read.readlines()
+        file_to_read.close()
+        remove("./results.txt")
+        # The results and the counters are the same, but fewer intersections are computed.
+        self.assertEqual(list_of_written_results, all_the_results)
+        self.assertEqual(bsd.selected_subgroups, bsd_without_skipping.selected_subgroups)
+        self.assertEqual(bsd.unselected_subgroups, bsd_without_skipping.unselected_subgroups)
+        self.assertEqual(bsd.visited_subgroups, bsd_without_skipping.visited_subgroups)
+        self.assertEqual(bsd.pruned_subgroups, bsd_without_skipping.pruned_subgroups)
+        self.assertLess(bsd._number_of_intersections, bsd_without_skipping._number_of_intersections)
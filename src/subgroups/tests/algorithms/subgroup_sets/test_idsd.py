@@ -225,6 +225,39 @@ class TestIDSD(unittest.TestCase):
         self.assertIn(Subgroup.generate_from_str("Description: [bread = 'yes', milk = 'no'], Target: diaper = 'yes'"), list_of_subgroups)
         file_to_parse.close()
         remove("./results.txt")
-
-
-    
\ No newline at end of file
+    
+    def test_IDSD_selectors_of_the_same_attribute(self):
+        class IDSDCountingIntersections(IDSD):
+            __slots__ = "_number_of_intersections"
+            def _grow_tree(self, df, tuple_target_attribute_value, selectors, complexity, pattern, pattern_appearance, last_attribute_name = None):
+                # Each call (except the one of the empty pattern) computes an intersection.
+                if len(pattern) > 0:
+                    self._number_of_intersections = self._number_of_intersections + 1
+                super()._grow_tree(df, tuple_target_attribute_value, selectors, complexity, pattern, pattern_appearance, last_attribute_name)
+        class IDSDWithoutSkipping(IDSDCountingIntersections):
+            def _grow_tree(self, df, tuple_target_attribute_value, selectors, complexity, pattern, pattern_appearance, last_attribute_name = None):
+                super()._grow_tree(df, tuple_target_attribute_value, selectors, complexity, pattern, pattern_appearance, None)
+        # Dataset with a high-cardinality attribute.
+        df = DataFrame({"a1" : [str(i % 12) for i in range(48)], "a2" : [str(i % 3) for i in range(48)], "a3" : [str((i // 5) % 2) for i in range(48)], "class" : ["y" if (i % 4 == 0) or (i % 7 == 1) else "n" for i in range(48)]})
+        target = ("class", "y")
+        model = IDSDCountingIntersections(num_subgroups=10, max_complexity=3, coverage_thld=0.01, write_results_in_file=True, file_path='results.txt')
+        model._number_of_intersections = 0
+        model.fit(df, target)
+        file_to_read = open("./results.txt", "r")
+        list_of_written_results = file_to_read.readlines()
+        file_to_read.close()
+        remove("./results.txt")
+        model_without_skipping = IDSDWithoutSkipping(num_subgroups=10, max_complexity=3, coverage_thld=0.01, write_results_in_file=True, file_path='results.txt')
+        model_without_skipping._number_of_intersections = 0
+        model_without_skipping.fit(df, target)
+        file_to_read = open("./results.txt", "r")
+        all_the_results = file_to_read.readlines()
+        file_to_read.close()
+        remove("./results.txt")
+        # The results and the counters are the same, but fewer intersections are computed.
+        self.assertEqual(list_of_written_results, all_the_results)
+        self.assertEqual(model.visited_subgroups, model_without_skipping.visited_subgroups)
+        self.assertEqual(model._non_unique_visited_subgroups, model_without_skipping._non_unique_visited_subgroups)
+        self.assertEqual(model.pruned_subgroups, model_without_skipping.pruned_subgroups)
+        self.assertEqual(model.selected_subgroups, model_without_skipping.selected_subgroups)
+        self.assertLess(model._number_of_intersections, model_without_skipping._number_of_intersections)
@@ -7,9 +7,11 @@
 """
 
 from pandas import DataFrame
-from subgroups.algorithms.subgroup_sets.sdmap import SDMap
+from subgroups.algorithms.subgroup_sets.sdmap import SDMap, _generate_combinations
 from subgroups.quality_measures.wracc import WRAcc
 from subgroups.quality_measures.qg import Qg
+from subgroups.quality_measures.piatetsky_shapiro import PiatetskyShapiro
+from subgroups.quality_measures.piatetsky_shapiro_optimistic_estimate_2 import PiatetskyShapiroOptimisticEstimate2
 from subgroups.exceptions import InconsistentMethodParametersError, DatasetAttributeTypeError, ParameterNotFoundError
 from subgroups.data_structures.fp_tree_for_sdmap import FPTreeForSDMap
 from subgroups.core.subgroup import Subgroup
@@ -453,3 +455,126 @@ class TestSDMap(unittest.TestCase):
         self.assertEqual(sdmap.selected_subgroups, 0)
         self.assertEqual(sdmap.unselected_subgroups, 25)
         self.assertEqual(sdmap.visited_nodes, 25)
+
+    def test_SDMap_fp_tree_implementation(self) -> None:
+        self.assertRaises(ValueError, SDMap, WRAcc(), -1, minimum_n=0, fp_tree_implementation="lists")
+        df = DataFrame({"a1" : ["a","b","c","c","a","b","a","c"], "a2" : ["q","q","s","q","s","s","q","q"], "a3" : ["f","g","f","g","f","g","h","f"], "class" : ["n","y","n","y","y","y","n","n"]})
+        target = ("class", "y")
+        # Both implementations of the FPTree must generate the same subgroups in the same order.
+        list_of_written_results = []
+        for fp_tree_implementation in SDMap.FP_TREE_IMPLEMENTATION:
+            for thresholds in ({"minimum_n" : 0}, {"minimum_tp" : 1, "minimum_fp" : 1}):
+                sdmap = SDMap(WRAcc(), -1, **thresholds, write_results_in_file=True, file_path="./results.txt", fp_tree_implementation=fp_tree_implementation)
+                self.assertEqual(sdmap.fp_tree_implementation, fp_tree_implementation)
+                sdmap.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results.append((sdmap.selected_subgroups, sdmap.unselected_subgroups, file_to_read.read()))
+                file_to_read.close()
+                remove("./results.txt")
+        self.assertEqual(list_of_written_results[:2], list_of_written_results[2:])
+        self.assertEqual(list_of_written_results[0][0], 32)
+
+    def test_SDMap_n_jobs(self) -> None:
+        self.assertRaises(TypeError, SDMap, WRAcc(), -1, minimum_n=0, n_jobs=2.0)
+        self.assertRaises(ValueError, SDMap, WRAcc(), -1, minimum_n=0, n_jobs=0)
+        self.assertGreaterEqual(SDMap(WRAcc(), -1, minimum_n=0, n_jobs=-1).n_jobs, 1)
+        df = DataFrame({"a1" : ["a","b","c","c","a","b","a","c"], "a2" : ["q","q","s","q","s","s","q","q"], "a3" : ["f","g","f","g","f","g","h","f"], "class" : ["n","y","n","y","y","y","n","n"]})
+        target = ("class", "y")
+        # The parallel execution must generate the same subgroups in the same order as the sequential one.
+        for fp_tree_implementation in SDMap.FP_TREE_IMPLEMENTATION:
+            list_of_written_results = []
+            for n_jobs in [1, 2]:
+                sdmap = SDMap(WRAcc(), 0, minimum_n=1, write_results_in_file=True, file_path="./results.txt", fp_tree_implementation=fp_tree_implementation, n_jobs=n_jobs)
+                self.assertEqual(sdmap.n_jobs, n_jobs)
+                sdmap.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results.append((sdmap.selected_subgroups, sdmap.unselected_subgroups, file_to_read.read()))
+                file_to_read.close()
+                remove("./results.txt")
+            self.assertEqual(list_of_written_results[0], list_of_written_results[1])
+
+    def test_SDMap_single_path(self) -> None:
+        # The combinations of a single path must be generated in the same order as the recursive enumeration of all the combinations of the list.
+        def all_combinations(list_of_selectors):
+            if list_of_selectors == []:
+                return [[]]
+            x = all_combinations(list_of_selectors[1:])
+            return x + [[list_of_selectors[0]] + y for y in x]
+        list_of_selectors = ["s1", "s2", "s3", "s4", "s5"]
+        generated_combinations = []
+        for index in range(len(list_of_selectors)-1, -1, -1):
+            generated_combinations.extend(_generate_combinations(list_of_selectors, index))
+        self.assertEqual([[]] + generated_combinations, all_combinations(list_of_selectors))
+        # A dataset whose FPTree is a single path with 8 selectors.
+        df = DataFrame({"a" + str(i) : ["x" if row < 20 - 2*i else "z" + str(row) for row in range(20)] for i in range(8)})
+        df["class"] = ["y" if (row < 12) and (row % 2 == 0) else "n" for row in range(20)]
+        for fp_tree_implementation in SDMap.FP_TREE_IMPLEMENTATION:
+            sdmap = SDMap(WRAcc(), -1, minimum_n=2, fp_tree_implementation=fp_tree_implementation)
+            sdmap.fit(df, ("class", "y"))
+            self.assertEqual(sdmap.selected_subgroups, 255)
+            self.assertEqual(sdmap.unselected_subgroups, 0)
+
+    def test_SDMap_max_depth(self) -> None:
+        self.assertRaises(TypeError, SDMap, WRAcc(), -1, minimum_n=0, max_depth=2.0)
+        self.assertRaises(ValueError, SDMap, WRAcc(), -1, minimum_n=0, max_depth=0)
+        self.assertIsNone(SDMap(WRAcc(), -1, minimum_n=0).max_depth)
+        df = DataFrame({"a1" : ["a","b","c","c","a","b","a","c"], "a2" : ["q","q","s","q","s","s","q","q"], "a3" : ["f","g","f","g","f","g","h","f"], "class" : ["n","y","n","y","y","y","n","n"]})
+        target = ("class", "y")
+        for fp_tree_implementation in SDMap.FP_TREE_IMPLEMENTATION:
+            # The subgroups generated with a maximum depth must be those generated without it whose description has at most that number of selectors (in the same order).
+            list_of_written_results = []
+            for max_depth in [None, 1, 2, 3]:
+                sdmap = SDMap(WRAcc(), -1, minimum_n=1, write_results_in_file=True, file_path="./results.txt", fp_tree_implementation=fp_tree_implementation, max_depth=max_depth)
+                sdmap.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results.append(file_to_read.read().splitlines())
+                file_to_read.close()
+                remove("./results.txt")
+            for max_depth in [1, 2, 3]:
+                self.assertEqual(list_of_written_results[max_depth], [line for line in list_of_written_results[0] if line.split("]")[0].count(" = ") <= max_depth])
+            self.assertEqual(len(list_of_written_results[1]), 8)
+            self.assertEqual(list_of_written_results[3], list_of_written_results[0])
+        # A dataset whose FPTree is a single path with 8 selectors: the combinations have at most 2 selectors (8 + 28).
+        df = DataFrame({"a" + str(i) : ["x" if row < 20 - 2*i else "z" + str(row) for row in range(20)] for i in range(8)})
+        df["class"] = ["y" if (row < 12) and (row % 2 == 0) else "n" for row in range(20)]
+        sdmap = SDMap(WRAcc(), -1, minimum_n=2, max_depth=2)
+        sdmap.fit(df, ("class", "y"))
+        self.assertEqual(sdmap.selected_subgroups, 36)
+
+    def test_SDMap_optimistic_estimate(self) -> None:
+        self.assertRaises(TypeError, SDMap, PiatetskyShapiro(), 1.0, minimum_n=0, optimistic_estimate="hello")
+        self.assertRaises(TypeError, SDMap, PiatetskyShapiro(), 1.0, minimum_n=0, optimistic_estimate=PiatetskyShapiroOptimisticEstimate2(), additional_parameters_for_the_optimistic_estimate=1)
+        self.assertRaises(ValueError, SDMap, WRAcc(), 1.0, minimum_n=0, optimistic_estimate=PiatetskyShapiroOptimisticEstimate2())
+        self.assertIsNone(SDMap(PiatetskyShapiro(), 1.0, minimum_n=0).optimistic_estimate)
+        df = DataFrame({"a1" : ["a","b","c","c","a","b","a","c"], "a2" : ["q","q","s","q","s","s","q","q"], "a3" : ["f","g","f","g","f","g","h","f"], "class" : ["n","y","n","y","y","y","n","n"]})
+        target = ("class", "y")
+        for fp_tree_implementation in SDMap.FP_TREE_IMPLEMENTATION:
+            # With the optimistic estimate, the selected subgroups must be the same (and in the same order), but less subgroups are visited.
+            list_of_written_results = []
+            for optimistic_estimate, unselected_subgroups, pruned_subgroups in [(None, 28, 0), (PiatetskyShapiroOptimisticEstimate2(), 13, 11)]:
+                sdmap = SDMap(PiatetskyShapiro(), 1.0, minimum_n=1, write_results_in_file=True, file_path="./results.txt", fp_tree_implementation=fp_tree_implementation, optimistic_estimate=optimistic_estimate)
+                sdmap.fit(df, target)
+                self.assertEqual(sdmap.selected_subgroups, 4)
+                self.assertEqual(sdmap.unselected_subgroups, unselected_subgroups)
+                self.assertEqual(sdmap.pruned_subgroups, pruned_subgroups)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results.append(file_to_read.read())
+                file_to_read.close()
+                remove("./results.txt")
+            self.assertEqual(list_of_written_results[0], list_of_written_results[1])
+        # Dataset whose FPTree is a single path (the other values of each attribute are not frequent). The combinations of the groups of the single path whose optimistic estimate is less than the threshold are pruned without generating them.
+        df = DataFrame({**{"a" + str(i) : ["x" if row < 20 - 3*i else str(row) for row in range(20)] for i in range(6)}, "class" : ["y" if (row < 12) and (row % 2 == 0) else "n" for row in range(20)]})
+        for fp_tree_implementation in SDMap.FP_TREE_IMPLEMENTATION:
+            for max_depth, selected_subgroups, unselected_subgroups_and_pruned_subgroups in [(None, 8, [(55, 0), (23, 32)]), (2, 4, [(17, 0), (11, 6)])]:
+                list_of_written_results = []
+                for optimistic_estimate, (unselected_subgroups, pruned_subgroups) in zip([None, PiatetskyShapiroOptimisticEstimate2()], unselected_subgroups_and_pruned_subgroups):
+                    sdmap = SDMap(PiatetskyShapiro(), 2.5, minimum_n=2, write_results_in_file=True, file_path="./results.txt", fp_tree_implementation=fp_tree_implementation, max_depth=max_depth, optimistic_estimate=optimistic_estimate)
+                    sdmap.fit(df, target)
+                    self.assertEqual(sdmap.selected_subgroups, selected_subgroups)
+                    self.assertEqual(sdmap.unselected_subgroups, unselected_subgroups)
+                    self.assertEqual(sdmap.pruned_subgroups, pruned_subgroups)
+                    file_to_read = open("./results.txt", "r")
+                    list_of_written_results.append(file_to_read.read())
+                    file_to_read.close()
+                    remove("./results.txt")
+                self.assertEqual(list_of_written_results[0], list_of_written_results[1])
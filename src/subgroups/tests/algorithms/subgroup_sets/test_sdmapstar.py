@@ -11,9 +11,15 @@ from subgroups.algorithms.subgroup_sets.sdmapstar import SDMapStar
 from subgroups.quality_measures.wracc import WRAcc
 from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
 from subgroups.quality_measures.qg import Qg
+from subgroups.quality_measures.binomial_test import BinomialTest
+from subgroups.quality_measures.binomial_test_optimistic_estimate_1 import BinomialTestOptimisticEstimate1
+from subgroups.quality_measures.piatetsky_shapiro import PiatetskyShapiro
+from subgroups.quality_measures.piatetsky_shapiro_optimistic_estimate_1 import PiatetskyShapiroOptimisticEstimate1
+from subgroups.quality_measures.piatetsky_shapiro_optimistic_estimate_2 import PiatetskyShapiroOptimisticEstimate2
 from subgroups.exceptions import InconsistentMethodParametersError, DatasetAttributeTypeError, ParameterNotFoundError
 from subgroups.data_structures.fp_tree_for_sdmap import FPTreeForSDMap
 from subgroups.core.subgroup import Subgroup
+from subgroups import datasets
 from os import remove
 import unittest
 
@@ -485,5 +491,115 @@ class TestSDMapStar(unittest.TestCase):
         self.assertEqual(sdmap.selected_subgroups, 13)
         self.assertEqual(sdmap.unselected_subgroups, 0)
         self.assertEqual(sdmap.visited_nodes, 13)
-        self.assertEqual(sdmap.conditional_pruned_branches, 1)
-       
\ No newline at end of file
+        self.assertEqual(sdmap.conditional_pruned_branches, 0)
+       
+    def test_SDMapStar_fp_tree_implementation(self) -> None:
+        self.assertRaises(ValueError, SDMapStar, WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, fp_tree_implementation="lists")
+        df = DataFrame({"a1" : ["a","b","c","c","a","b","a","c"], "a2" : ["q","q","s","q","s","s","q","q"], "a3" : ["f","g","f","g","f","g","h","f"], "class" : ["n","y","n","y","y","y","n","n"]})
+        target = ("class", "y")
+        # Both implementations of the FPTree must generate the same subgroups in the same order.
+        list_of_written_results = []
+        for fp_tree_implementation in SDMapStar.FP_TREE_IMPLEMENTATION:
+            for num_subgroups in (0, 3):
+                sdmap = SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, num_subgroups=num_subgroups, write_results_in_file=True, file_path="./results.txt", fp_tree_implementation=fp_tree_implementation)
+                self.assertEqual(sdmap.fp_tree_implementation, fp_tree_implementation)
+                sdmap.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results.append((sdmap.selected_subgroups, sdmap.pruned_subgroups, sdmap.conditional_pruned_branches, sdmap.k_subgroups, file_to_read.read()))
+                file_to_read.close()
+                remove("./results.txt")
+        self.assertEqual(list_of_written_results[:2], list_of_written_results[2:])
+
+    def test_SDMapStar_n_jobs(self) -> None:
+        self.assertRaises(TypeError, SDMapStar, WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, n_jobs=2.0)
+        self.assertRaises(ValueError, SDMapStar, WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, n_jobs=0)
+        self.assertGreaterEqual(SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, n_jobs=-1).n_jobs, 1)
+        df = DataFrame({"a1" : ["a","b","c","c","a","b","a","c"], "a2" : ["q","q","s","q","s","s","q","q"], "a3" : ["f","g","f","g","f","g","h","f"], "class" : ["n","y","n","y","y","y","n","n"]})
+        target = ("class", "y")
+        for fp_tree_implementation in SDMapStar.FP_TREE_IMPLEMENTATION:
+            # Without the SDMapStar pruning, the parallel execution must generate the same subgroups in the same order as the sequential one.
+            list_of_written_results = []
+            for n_jobs in [1, 2]:
+                sdmap = SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=1, write_results_in_file=True, file_path="./results.txt", fp_tree_implementation=fp_tree_implementation, n_jobs=n_jobs)
+                sdmap.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results.append((sdmap.selected_subgroups, sdmap.unselected_subgroups, file_to_read.read()))
+                file_to_read.close()
+                remove("./results.txt")
+            self.assertEqual(list_of_written_results[0], list_of_written_results[1])
+        # With the SDMapStar pruning, the best k quality measure values must be the same (and the exact ones), although the branches are searched in a different order.
+        df = datasets.load_tic_tac_toe_csv()
+        target = ("class", "positive")
+        for n_jobs in [1, 2]:
+            sdmap = SDMapStar(PiatetskyShapiro(), PiatetskyShapiroOptimisticEstimate1(), -1, minimum_n=1, num_subgroups=20, n_jobs=n_jobs)
+            sdmap.fit(df, target)
+            self.assertEqual(len(sdmap.k_subgroups), 20)
+            self.assertAlmostEqual(sdmap.k_subgroups[0], 23.427974947807932)
+            self.assertAlmostEqual(sum(sdmap.k_subgroups), 598.592902, places=5)
+
+    def test_SDMapStar_single_path(self) -> None:
+        # A dataset whose FPTree is a single path with 8 selectors. The 128 combinations with the less frequent selector ("a7 = 'x'") are pruned.
+        df = DataFrame({"a" + str(i) : ["x" if row < 20 - 2*i else "z" + str(row) for row in range(20)] for i in range(8)})
+        df["class"] = ["y" if (row < 12) and (row % 2 == 0) else "n" for row in range(20)]
+        target = ("class", "y")
+        for fp_tree_implementation in SDMapStar.FP_TREE_IMPLEMENTATION:
+            for num_subgroups, selected_subgroups, pruned_subgroups in [(0, 255, 0), (1, 127, 128), (5, 127, 128), (300, 255, 0)]:
+                sdmap = SDMapStar(PiatetskyShapiro(), PiatetskyShapiroOptimisticEstimate2(), -20, minimum_n=2, num_subgroups=num_subgroups, fp_tree_implementation=fp_tree_implementation)
+                sdmap.fit(df, target)
+                self.assertEqual(sdmap.selected_subgroups, selected_subgroups)
+                self.assertEqual(sdmap.unselected_subgroups, 0)
+                self.assertEqual(sdmap.pruned_subgroups, pruned_subgroups)
+            self.assertEqual(sdmap.k_subgroups[-1], 2.4000000000000004)
+
+    def test_SDMapStar_max_depth(self) -> None:
+        self.assertRaises(TypeError, SDMapStar, WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, max_depth=2.0)
+        self.assertRaises(ValueError, SDMapStar, WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, max_depth=0)
+        self.assertIsNone(SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0).max_depth)
+        df = DataFrame({"a1" : ["a","b","c","c","a","b","a","c"], "a2" : ["q","q","s","q","s","s","q","q"], "a3" : ["f","g","f","g","f","g","h","f"], "class" : ["n","y","n","y","y","y","n","n"]})
+        target = ("class", "y")
+        for fp_tree_implementation in SDMapStar.FP_TREE_IMPLEMENTATION:
+            # The subgroups generated with a maximum depth must be those generated without it whose description has at most that number of selectors (in the same order).
+            list_of_written_results = []
+            for max_depth in [None, 1, 2]:
+                sdmap = SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=1, write_results_in_file=True, file_path="./results.txt", fp_tree_implementation=fp_tree_implementation, max_depth=max_depth)
+                sdmap.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results.append(file_to_read.read().splitlines())
+                file_to_read.close()
+                remove("./results.txt")
+            for max_depth in [1, 2]:
+                self.assertEqual(list_of_written_results[max_depth], [line for line in list_of_written_results[0] if line.split("]")[0].count(" = ") <= max_depth])
+        # A dataset whose FPTree is a single path with 8 selectors: the combinations have at most 3 selectors (8 + 28 + 56) and the 29 combinations with the less frequent selector ("a7 = 'x'") are pruned.
+        df = DataFrame({"a" + str(i) : ["x" if row < 20 - 2*i else "z" + str(row) for row in range(20)] for i in range(8)})
+        df["class"] = ["y" if (row < 12) and (row % 2 == 0) else "n" for row in range(20)]
+        for num_subgroups, selected_subgroups, pruned_subgroups in [(0, 92, 0), (1, 63, 29)]:
+            sdmap = SDMapStar(PiatetskyShapiro(), PiatetskyShapiroOptimisticEstimate2(), -20, minimum_n=2, num_subgroups=num_subgroups, max_depth=3)
+            sdmap.fit(df, ("class", "y"))
+            self.assertEqual(sdmap.selected_subgroups, selected_subgroups)
+            self.assertEqual(sdmap.pruned_subgroups, pruned_subgroups)
+
+    def test_SDMapStar_minimum_tp_of_the_k_subgroups(self) -> None:
+        # WRAcc and Piatetsky-Shapiro: tp*FP/(TP+FP)^2 and tp*FP/(TP+FP) must reach the worst quality measure value in k subgroups (only if k subgroups is full).
+        sdmap = SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=1, num_subgroups=2)
+        sdmap._k_subgroups = [0.1]
+        self.assertIsNone(sdmap._get_minimum_tp_of_the_k_subgroups(3, 7))
+        sdmap._k_subgroups = [0.1, 0.2]
+        self.assertEqual(sdmap._get_minimum_tp_of_the_k_subgroups(3, 7), 1)
+        sdmap._k_subgroups = [-0.1, 0.2]
+        self.assertIsNone(sdmap._get_minimum_tp_of_the_k_subgroups(3, 7))
+        sdmap = SDMapStar(PiatetskyShapiro(), PiatetskyShapiroOptimisticEstimate2(), -1, minimum_n=1, num_subgroups=2)
+        sdmap._k_subgroups = [1.5, 2.0]
+        self.assertEqual(sdmap._get_minimum_tp_of_the_k_subgroups(3, 7), 2)
+        self.assertIsNone(sdmap._get_minimum_tp_of_the_k_subgroups(3, 0))
+        sdmap = SDMapStar(BinomialTest(), BinomialTestOptimisticEstimate1(), -1, minimum_n=1, num_subgroups=2)
+        sdmap._k_subgroups = [1.5, 2.0]
+        self.assertIsNone(sdmap._get_minimum_tp_of_the_k_subgroups(3, 7))
+        # The conditional FPTrees are pruned with the minimum tp, but the best k quality measure values are the same.
+        df = datasets.load_car_evaluation_csv()
+        target = ("class", "unacc")
+        for fp_tree_implementation in SDMapStar.FP_TREE_IMPLEMENTATION:
+            for thresholds, visited_nodes in [({"minimum_n" : 10}, 50), ({"minimum_tp" : 10, "minimum_fp" : 0}, 34)]:
+                sdmap = SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, num_subgroups=5, fp_tree_implementation=fp_tree_implementation, **thresholds)
+                sdmap.fit(df, target)
+                self.assertEqual(sdmap.k_subgroups, [0.03330761316872428, 0.03330761316872428, 0.03330761316872428, 0.09992283950617283, 0.09992283950617283])
+                self.assertEqual(sdmap.visited_nodes, visited_nodes)
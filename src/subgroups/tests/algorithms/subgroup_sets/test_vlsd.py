@@ -7,14 +7,22 @@
 """
 
 from pandas import DataFrame
-from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD, VLSDResult, _query_triangular_matrix
+from numpy import arange
 from subgroups.quality_measures.wracc import WRAcc
 from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
 from subgroups.quality_measures.qg import Qg
+from subgroups.quality_measures.piatetsky_shapiro import PiatetskyShapiro
+from subgroups.quality_measures.piatetsky_shapiro_optimistic_estimate_2 import PiatetskyShapiroOptimisticEstimate2
 from subgroups.exceptions import DatasetAttributeTypeError
 from subgroups.core.subgroup import Subgroup
 from os import remove
 import unittest
+import tracemalloc
+
+def _sort_the_elements_of_the_sets(list_of_results : list[str]) -> list[list[str]]:
+    # The elements of the python sets written in the results (and the rest of parts of the results) are sorted, so that the order of the elements of the sets is not compared.
+    return [sorted(result.replace("{", ", ").replace("}", ", ").split(", ")) for result in list_of_results]
 
 class TestVLSD(unittest.TestCase):
 
@@ -148,6 +156,206 @@ class TestVLSD(unittest.TestCase):
         self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a2 = q], Target: class = 'y'"), list_of_subgroups)
         file_to_read.close()
         remove("./results.txt")
+        ### VERTICAL LISTS IMPLEMENTED WITH WORD ARRAYS ###
+        # IMPORTANT: WRAcc quality measure is defined between -1 and 1.
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_WORD_ARRAYS, write_results_in_file=True, file_path="./results.txt")
+        self.assertEqual(vlsd._vertical_lists_implementation, VLSD.VERTICAL_LISTS_WITH_WORD_ARRAYS)
+        vlsd.fit(df, target)
+        self.assertEqual(vlsd.selected_subgroups, 25)
+        self.assertEqual(vlsd.unselected_subgroups, 0)
+        self.assertEqual(vlsd.visited_nodes, 25)
+        list_of_written_results = []
+        file_to_read = open("./results.txt", "r")
+        for line in file_to_read:
+            list_of_written_results.append(line)
+        list_of_subgroups = [Subgroup.generate_from_str(elem.split(";")[0][:-1]) for elem in list_of_written_results]
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        file_to_read.close()
+        remove("./results.txt")
+        ### VERTICAL LISTS IMPLEMENTED WITH DIFFSETS ###
+        # IMPORTANT: WRAcc quality measure is defined between -1 and 1.
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_DIFFSETS, write_results_in_file=True, file_path="./results.txt")
+        self.assertEqual(vlsd._vertical_lists_implementation, VLSD.VERTICAL_LISTS_WITH_DIFFSETS)
+        vlsd.fit(df, target)
+        self.assertEqual(vlsd.selected_subgroups, 25)
+        self.assertEqual(vlsd.unselected_subgroups, 0)
+        self.assertEqual(vlsd.visited_nodes, 25)
+        list_of_written_results = []
+        file_to_read = open("./results.txt", "r")
+        for line in file_to_read:
+            list_of_written_results.append(line)
+        list_of_subgroups = [Subgroup.generate_from_str(elem.split(";")[0][:-1]) for elem in list_of_written_results]
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        file_to_read.close()
+        remove("./results.txt")
+        ### VERTICAL LISTS IMPLEMENTED WITH COMPRESSED BITMAPS ###
+        # IMPORTANT: WRAcc quality measure is defined between -1 and 1.
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_COMPRESSED_BITMAPS, write_results_in_file=True, file_path="./results.txt")
+        self.assertEqual(vlsd._vertical_lists_implementation, VLSD.VERTICAL_LISTS_WITH_COMPRESSED_BITMAPS)
+        vlsd.fit(df, target)
+        self.assertEqual(vlsd.selected_subgroups, 25)
+        self.assertEqual(vlsd.unselected_subgroups, 0)
+        self.assertEqual(vlsd.visited_nodes, 25)
+        list_of_written_results = []
+        file_to_read = open("./results.txt", "r")
+        for line in file_to_read:
+            list_of_written_results.append(line)
+        list_of_subgroups = [Subgroup.generate_from_str(elem.split(";")[0][:-1]) for elem in list_of_written_results]
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        file_to_read.close()
+        remove("./results.txt")
+        ### VERTICAL LISTS IMPLEMENTED WITH SORTED ARRAYS ###
+        # IMPORTANT: WRAcc quality measure is defined between -1 and 1.
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_SORTED_ARRAYS, write_results_in_file=True, file_path="./results.txt")
+        self.assertEqual(vlsd._vertical_lists_implementation, VLSD.VERTICAL_LISTS_WITH_SORTED_ARRAYS)
+        vlsd.fit(df, target)
+        self.assertEqual(vlsd.selected_subgroups, 25)
+        self.assertEqual(vlsd.unselected_subgroups, 0)
+        self.assertEqual(vlsd.visited_nodes, 25)
+        list_of_written_results = []
+        file_to_read = open("./results.txt", "r")
+        for line in file_to_read:
+            list_of_written_results.append(line)
+        list_of_subgroups = [Subgroup.generate_from_str(elem.split(";")[0][:-1]) for elem in list_of_written_results]
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        file_to_read.close()
+        remove("./results.txt")
+        ### VERTICAL LISTS IMPLEMENTED WITH HYBRID SEQUENCES ###
+        # IMPORTANT: WRAcc quality measure is defined between -1 and 1.
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_HYBRID_SEQUENCES, write_results_in_file=True, file_path="./results.txt")
+        self.assertEqual(vlsd._vertical_lists_implementation, VLSD.VERTICAL_LISTS_WITH_HYBRID_SEQUENCES)
+        vlsd.fit(df, target)
+        self.assertEqual(vlsd.selected_subgroups, 25)
+        self.assertEqual(vlsd.unselected_subgroups, 0)
+        self.assertEqual(vlsd.visited_nodes, 25)
+        list_of_written_results = []
+        file_to_read = open("./results.txt", "r")
+        for line in file_to_read:
+            list_of_written_results.append(line)
+        list_of_subgroups = [Subgroup.generate_from_str(elem.split(";")[0][:-1]) for elem in list_of_written_results]
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = a, a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = b, a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a2 = s, a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = f, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = g, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = h, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a1 = c, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        self.assertIn(Subgroup.generate_from_str("Description: [a3 = k, a2 = q], Target: class = 'y'"), list_of_subgroups)
+        file_to_read.close()
+        remove("./results.txt")
 
     def test_VLSD_fit_method_3(self) -> None:
         df = DataFrame({"a1" : ["a","b","c","c"], "a2" : ["q","q","s","q"], "a3" : ["f","g","h","k"], "class" : ["n","y","n","y"]})
@@ -322,3 +530,351 @@ class TestVLSD(unittest.TestCase):
         vlsd_3 = VLSD(WRAcc(), 0.1, WRAccOptimisticEstimate1(), 0.1, additional_parameters_for_the_quality_measure={"tp" : 10, "fp" : 20, "TP" : 100, "FP" : 200, "a" : 0.1}, additional_parameters_for_the_optimistic_estimate={"tp" : 10, "fp" : 20, "TP" : 100, "FP" : 200, "b" : 0.1})
         self.assertEqual(len(vlsd_3._additional_parameters_for_the_quality_measure), 1)
         self.assertEqual(len(vlsd_3._additional_parameters_for_the_optimistic_estimate), 1)
+
+    def test_VLSD_n_jobs(self) -> None:
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, n_jobs = 2.0)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, n_jobs = 0)
+        self.assertGreaterEqual(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, n_jobs = -1).n_jobs, 1)
+        df = DataFrame({"a1" : ["a","b","c","c"], "a2" : ["q","q","s","q"], "a3" : ["f","g","h","k"], "class" : ["n","y","n","y"]})
+        target = ("class", "y")
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            # Sequential execution.
+            vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt")
+            vlsd.fit(df, target)
+            file_to_read = open("./results.txt", "r")
+            sequential_results = file_to_read.readlines()
+            file_to_read.close()
+            remove("./results.txt")
+            # Parallel execution (the results must be the same and in the same order).
+            vlsd_parallel = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", n_jobs = 2)
+            self.assertEqual(vlsd_parallel.n_jobs, 2)
+            vlsd_parallel.fit(df, target)
+            file_to_read = open("./results.txt", "r")
+            parallel_results = file_to_read.readlines()
+            file_to_read.close()
+            remove("./results.txt")
+            self.assertEqual(parallel_results, sequential_results)
+            self.assertEqual(vlsd_parallel.selected_subgroups, vlsd.selected_subgroups)
+            self.assertEqual(vlsd_parallel.unselected_subgroups, vlsd.unselected_subgroups)
+            self.assertEqual(vlsd_parallel.visited_nodes, 25)
+
+    def test_VLSD_num_subgroups(self) -> None:
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups = 2.0)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups = -1)
+        self.assertEqual(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).num_subgroups, 0)
+        self.assertEqual(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).k_subgroups, [])
+        df = DataFrame({"a1" : [str(i % 3) for i in range(60)], "a2" : [str(i % 4) for i in range(60)], "a3" : [str(i % 5) for i in range(60)], "a4" : [str((i // 7) % 2) for i in range(60)], "class" : ["y" if (i % 3 == 0) or (i % 4 == 1) else "n" for i in range(60)]})
+        target = ("class", "y")
+        # All the subgroups (without the top-k mode).
+        vlsd = VLSD(PiatetskyShapiro(), 0, PiatetskyShapiroOptimisticEstimate2(), 0, sort_criterion_in_s1 = VLSD.SORT_CRITERION_QUALITY_DESCENDING, write_results_in_file=True, file_path="./results.txt")
+        vlsd.fit(df, target)
+        file_to_read = open("./results.txt", "r")
+        all_the_quality_values = sorted([float(line.split(" ; ")[3].split(" = ")[1]) for line in file_to_read], reverse=True)
+        file_to_read.close()
+        remove("./results.txt")
+        self.assertEqual(vlsd.k_subgroups, [])
+        self.assertEqual(vlsd.current_oe_minimum_threshold, 0)
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            for n_jobs in [1, 2]:
+                vlsd_top_k = VLSD(PiatetskyShapiro(), 0, PiatetskyShapiroOptimisticEstimate2(), 0, sort_criterion_in_s1 = VLSD.SORT_CRITERION_QUALITY_DESCENDING, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", n_jobs = n_jobs, num_subgroups = 5)
+                self.assertEqual(vlsd_top_k.num_subgroups, 5)
+                vlsd_top_k.fit(df, target)
+                # The best 5 subgroups are returned as objects, sorted descending by quality value.
+                self.assertEqual(len(vlsd_top_k.k_subgroups), 5)
+                self.assertEqual([quality_value for _, quality_value in vlsd_top_k.k_subgroups], all_the_quality_values[:5])
+                self.assertTrue(all(type(subgroup) is Subgroup for subgroup, _ in vlsd_top_k.k_subgroups))
+                # The threshold for the optimistic estimate has been raised, so less nodes are visited.
+                self.assertEqual(vlsd_top_k.current_oe_minimum_threshold, all_the_quality_values[4])
+                self.assertLess(vlsd_top_k.visited_nodes, vlsd.visited_nodes)
+                # Only the best 5 subgroups are written in the file.
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results = file_to_read.readlines()
+                file_to_read.close()
+                remove("./results.txt")
+                self.assertEqual([Subgroup.generate_from_str(elem.split(";")[0][:-1]) for elem in list_of_written_results], [subgroup for subgroup, _ in vlsd_top_k.k_subgroups])
+        # If there are less subgroups than 'num_subgroups', all of them are returned.
+        vlsd_top_k = VLSD(PiatetskyShapiro(), 0, PiatetskyShapiroOptimisticEstimate2(), 0, num_subgroups = 100000)
+        vlsd_top_k.fit(df, target)
+        self.assertEqual([quality_value for _, quality_value in vlsd_top_k.k_subgroups], all_the_quality_values)
+        self.assertEqual(vlsd_top_k.current_oe_minimum_threshold, 0)
+
+    def test_VLSD_max_depth(self) -> None:
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, max_depth = 2.0)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, max_depth = 0)
+        self.assertIsNone(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).max_depth)
+        df = DataFrame({"a1" : ["a","b","c","c"], "a2" : ["q","q","s","q"], "a3" : ["f","g","h","k"], "class" : ["n","y","n","y"]})
+        target = ("class", "y")
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            # All the subgroups (without maximum depth).
+            vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt")
+            vlsd.fit(df, target)
+            file_to_read = open("./results.txt", "r")
+            all_the_results = file_to_read.readlines()
+            file_to_read.close()
+            remove("./results.txt")
+            self.assertEqual(vlsd.visited_nodes, 25)
+            for max_depth, visited_nodes in [(1, 9), (2, 21), (3, 25), (4, 25)]:
+                vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", max_depth = max_depth)
+                self.assertEqual(vlsd.max_depth, max_depth)
+                vlsd.fit(df, target)
+                self.assertEqual(vlsd.visited_nodes, visited_nodes)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results = file_to_read.readlines()
+                file_to_read.close()
+                remove("./results.txt")
+                # The results are the same (and in the same order) as without maximum depth, but only the subgroups with 'max_depth' selectors or less.
+                self.assertEqual(list_of_written_results, [result for result in all_the_results if len(Subgroup.generate_from_str(result.split(";")[0][:-1]).description) <= max_depth])
+
+    def test_VLSD_checkpoints(self) -> None:
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, checkpoint_path = 1)
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, checkpoint_path = "./checkpoint.bin", checkpoint_interval = "1")
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, checkpoint_path = "./checkpoint.bin", checkpoint_interval = -1)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, checkpoint_path = "./checkpoint.bin", n_jobs = 2)
+        self.assertIsNone(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).checkpoint_path)
+        self.assertEqual(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).checkpoint_interval, 600)
+        # VLSD algorithm which is interrupted after handling a number of subgroups.
+        class InterruptedVLSD(VLSD):
+            __slots__ = "_remaining_handled_subgroups"
+            def _handle_individual_result(self, individual_result):
+                if self._remaining_handled_subgroups == 0:
+                    raise KeyboardInterrupt()
+                self._remaining_handled_subgroups = self._remaining_handled_subgroups - 1
+                return super()._handle_individual_result(individual_result)
+        df = DataFrame({"a1" : [str(i % 3) for i in range(60)], "a2" : [str(i % 4) for i in range(60)], "a3" : [str(i % 5) for i in range(60)], "a4" : [str((i // 7) % 2) for i in range(60)], "class" : ["y" if (i % 3 == 0) or (i % 4 == 1) else "n" for i in range(60)]})
+        target = ("class", "y")
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            for num_subgroups in [0, 5]:
+                # Uninterrupted execution.
+                vlsd = VLSD(PiatetskyShapiro(), 0, PiatetskyShapiroOptimisticEstimate2(), 0, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", num_subgroups = num_subgroups)
+                vlsd.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                all_the_results = file_to_read.readlines()
+                file_to_read.close()
+                remove("./results.txt")
+                # Interrupted in the middle of the search (a checkpoint is saved whenever possible).
+                for remaining_handled_subgroups in [vlsd.visited_nodes // 2, vlsd.visited_nodes - 3]:
+                    interrupted_vlsd = InterruptedVLSD(PiatetskyShapiro(), 0, PiatetskyShapiroOptimisticEstimate2(), 0, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", num_subgroups = num_subgroups, checkpoint_path = "./checkpoint.bin", checkpoint_interval = 0)
+                    interrupted_vlsd._remaining_handled_subgroups = remaining_handled_subgroups
+                    self.assertRaises(KeyboardInterrupt, interrupted_vlsd.fit, df, target)
+                    interrupted_vlsd._file.close()
+                    # A different configuration cannot resume the search.
+                    self.assertRaises(ValueError, VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", num_subgroups = num_subgroups).fit, df, target, "./checkpoint.bin")
+                    # The resumed execution obtains the same results as the uninterrupted one.
+                    resumed_vlsd = VLSD(PiatetskyShapiro(), 0, PiatetskyShapiroOptimisticEstimate2(), 0, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", num_subgroups = num_subgroups, checkpoint_path = "./checkpoint.bin")
+                    resumed_vlsd.fit(df, target, resume_from = "./checkpoint.bin")
+                    self.assertRaises(FileNotFoundError, open, "./checkpoint.bin", "r")
+                    file_to_read = open("./results.txt", "r")
+                    list_of_written_results = file_to_read.readlines()
+                    file_to_read.close()
+                    remove("./results.txt")
+                    if (num_subgroups > 0) and (vertical_lists_implementation in [VLSD.VERTICAL_LISTS_WITH_SETS, VLSD.VERTICAL_LISTS_WITH_DIFFSETS]):
+                        # The python sets of the best k subgroups are restored from the checkpoint, so their elements might be written in a different order.
+                        self.assertEqual(_sort_the_elements_of_the_sets(list_of_written_results), _sort_the_elements_of_the_sets(all_the_results))
+                    else:
+                        self.assertEqual(list_of_written_results, all_the_results)
+                    self.assertEqual(resumed_vlsd.selected_subgroups, vlsd.selected_subgroups)
+                    self.assertEqual(resumed_vlsd.unselected_subgroups, vlsd.unselected_subgroups)
+                    self.assertEqual(resumed_vlsd.k_subgroups, vlsd.k_subgroups)
+
+    def test_VLSD_multiple_target_values(self) -> None:
+        df = DataFrame({"a1" : [str(i % 3) for i in range(60)], "a2" : [str(i % 4) for i in range(60)], "a3" : [str(i % 5) for i in range(60)], "class" : [str((i % 7) % 3) for i in range(60)]})
+        self.assertRaises(ValueError, VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).fit, df, ("class", []))
+        self.assertRaises(TypeError, VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).fit, df, ("class", ["0", 1]))
+        self.assertRaises(ValueError, VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, checkpoint_path = "./checkpoint.bin").fit, df, ("class", ["0", "1"]))
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            for n_jobs in [1, 2]:
+                for num_subgroups in [0, 3]:
+                    # One execution per target value.
+                    list_of_all_the_results = []
+                    selected_subgroups = 0
+                    unselected_subgroups = 0
+                    k_subgroups = []
+                    for target_value in ["2", "0", "1"]:
+                        vlsd = VLSD(PiatetskyShapiro(), 0, PiatetskyShapiroOptimisticEstimate2(), 0, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", n_jobs = n_jobs, num_subgroups = num_subgroups)
+                        vlsd.fit(df, ("class", target_value))
+                        file_to_read = open("./results.txt", "r")
+                        list_of_all_the_results.extend(file_to_read.readlines())
+                        file_to_read.close()
+                        remove("./results.txt")
+                        selected_subgroups = selected_subgroups + vlsd.selected_subgroups
+                        unselected_subgroups = unselected_subgroups + vlsd.unselected_subgroups
+                        k_subgroups.extend(vlsd.k_subgroups)
+                    # Only one execution with all the target values (the results are the same and in the same order).
+                    vlsd = VLSD(PiatetskyShapiro(), 0, PiatetskyShapiroOptimisticEstimate2(), 0, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", n_jobs = n_jobs, num_subgroups = num_subgroups)
+                    vlsd.fit(df, ("class", ["2", "0", "1"]))
+                    file_to_read = open("./results.txt", "r")
+                    list_of_written_results = file_to_read.readlines()
+                    file_to_read.close()
+                    remove("./results.txt")
+                    self.assertEqual(list_of_written_results, list_of_all_the_results)
+                    self.assertEqual(vlsd.selected_subgroups, selected_subgroups)
+                    self.assertEqual(vlsd.unselected_subgroups, unselected_subgroups)
+                    self.assertEqual(vlsd.k_subgroups, k_subgroups)
+
+    def test_VLSD_closed_only(self) -> None:
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, closed_only = 1)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, closed_only = True, n_jobs = 2)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, closed_only = True, max_depth = 2)
+        self.assertFalse(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).closed_only)
+        # The attribute 'a4' is equal to 'a1' except in 2 instances and the attribute 'a5' is equal to 'a2'.
+        df = DataFrame({"a1" : [str(i % 3) for i in range(30)], "a2" : [str(i % 4) for i in range(30)], "a3" : [str((i // 5) % 2) for i in range(30)], "a4" : [str(i % 3) if i > 1 else "x" for i in range(30)], "a5" : [str(i % 4) for i in range(30)], "class" : ["y" if (i % 3 == 0) or (i % 5 == 1) else "n" for i in range(30)]})
+        target = ("class", "y")
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            for sort_criterion in [VLSD.SORT_CRITERION_NO_ORDER, VLSD.SORT_CRITERION_QUALITY_ASCENDING, VLSD.SORT_CRITERION_QUALITY_DESCENDING]:
+                # All the subgroups.
+                vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, sort_criterion_in_s1 = sort_criterion, sort_criterion_in_other_sizes = sort_criterion, vertical_lists_implementation = vertical_lists_implementation)
+                all_the_subgroups = {frozenset(result.list_of_selectors) : (result.tp, result.fp, result.quality_value) for result in vlsd.iter_subgroups(df, target)}
+                # The closed subgroups are those which have no superset with the same tp and fp.
+                closed_subgroups = {description : values for description, values in all_the_subgroups.items() if not any((description < other_description) and (values[:2] == other_values[:2]) for other_description, other_values in all_the_subgroups.items())}
+                vlsd_closed = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, sort_criterion_in_s1 = sort_criterion, sort_criterion_in_other_sizes = sort_criterion, vertical_lists_implementation = vertical_lists_implementation, closed_only = True)
+                self.assertTrue(vlsd_closed.closed_only)
+                list_of_results = list(vlsd_closed.iter_subgroups(df, target))
+                self.assertEqual(len(list_of_results), len(closed_subgroups))
+                self.assertEqual({frozenset(result.list_of_selectors) : (result.tp, result.fp, result.quality_value) for result in list_of_results}, closed_subgroups)
+                self.assertLess(vlsd_closed.visited_nodes, vlsd.visited_nodes)
+                # The same results are written by the 'fit' method.
+                vlsd_closed = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, sort_criterion_in_s1 = sort_criterion, sort_criterion_in_other_sizes = sort_criterion, vertical_lists_implementation = vertical_lists_implementation, closed_only = True, write_results_in_file=True, file_path="./results.txt")
+                vlsd_closed.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results = file_to_read.readlines()
+                file_to_read.close()
+                remove("./results.txt")
+                self.assertEqual(vlsd_closed.visited_nodes, len(closed_subgroups))
+                self.assertEqual([Subgroup.generate_from_str(elem.split(";")[0][:-1]) for elem in list_of_written_results], [result.to_subgroup(target) for result in list_of_results])
+
+    def test_VLSD_memory_limit(self) -> None:
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, memory_limit = 1.5)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, memory_limit = 0)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, memory_limit = 1000, checkpoint_path = "./checkpoint.bin")
+        self.assertIsNone(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).memory_limit)
+        # VLSD algorithm which counts the number of times that the frames are spilled.
+        class SpillingVLSD(VLSD):
+            __slots__ = "_number_of_spills"
+            def _spill_frames(self, stack, memory_of_the_frames, number_of_instance_ids, scratch_file):
+                self._number_of_spills = self._number_of_spills + 1
+                return super()._spill_frames(stack, memory_of_the_frames, number_of_instance_ids, scratch_file)
+        df = DataFrame({"a1" : [str(i % 3) for i in range(60)], "a2" : [str(i % 4) for i in range(60)], "a3" : [str(i % 5) for i in range(60)], "a4" : [str((i // 7) % 2) for i in range(60)], "class" : ["y" if (i % 3 == 0) or (i % 4 == 1) else "n" for i in range(60)]})
+        target = ("class", "y")
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            for additional_parameters in [dict(), {"closed_only" : True}, {"num_subgroups" : 5}]:
+                vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", **additional_parameters)
+                vlsd.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                all_the_results = file_to_read.readlines()
+                file_to_read.close()
+                remove("./results.txt")
+                # With a very low memory limit, all the frames which are not processed next are spilled, but the results are the same.
+                vlsd_with_memory_limit = SpillingVLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt", memory_limit = 1, **additional_parameters)
+                vlsd_with_memory_limit._number_of_spills = 0
+                self.assertEqual(vlsd_with_memory_limit.memory_limit, 1)
+                vlsd_with_memory_limit.fit(df, target)
+                file_to_read = open("./results.txt", "r")
+                list_of_written_results = file_to_read.readlines()
+                file_to_read.close()
+                remove("./results.txt")
+                self.assertGreater(vlsd_with_memory_limit._number_of_spills, 0)
+                self.assertEqual(vlsd_with_memory_limit.visited_nodes, vlsd.visited_nodes)
+                if (vertical_lists_implementation in [VLSD.VERTICAL_LISTS_WITH_SETS, VLSD.VERTICAL_LISTS_WITH_DIFFSETS]):
+                    # The python sets of the spilled Vertical Lists are rebuilt, so their elements (and the elements of their refinements) might be written in a different order.
+                    self.assertEqual(_sort_the_elements_of_the_sets(list_of_written_results), _sort_the_elements_of_the_sets(all_the_results))
+                else:
+                    self.assertEqual(list_of_written_results, all_the_results)
+                # A high memory limit is never exceeded.
+                vlsd_with_memory_limit = SpillingVLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, memory_limit = 10**12, **additional_parameters)
+                vlsd_with_memory_limit._number_of_spills = 0
+                vlsd_with_memory_limit.fit(df, target)
+                self.assertEqual(vlsd_with_memory_limit._number_of_spills, 0)
+
+    def test_VLSD_memory_limit_peak(self) -> None:
+        # Dataset with a deep search space, in which the memory of the stack of the search is greater than the memory of the Vertical Lists of size 1.
+        dict_of_columns = {"a" + str(index) : [str((i // divisor) % 2) for i in range(1000)] for index, divisor in enumerate([1, 2, 3, 5, 7, 11, 13, 17])}
+        dict_of_columns["class"] = ["y" if (i % 3 == 0) or (i % 4 == 1) else "n" for i in range(1000)]
+        df = DataFrame(dict_of_columns)
+        target = ("class", "y")
+        # The implementations in which the sequences are python sets (i.e., in which the Vertical Lists use much more memory than the scratch file machinery).
+        for vertical_lists_implementation in [VLSD.VERTICAL_LISTS_WITH_SETS, VLSD.VERTICAL_LISTS_WITH_DIFFSETS]:
+            # First execution with a memory limit, so that the one-time allocations (e.g., imports) are not measured.
+            VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, memory_limit = 20000).fit(df, target)
+            peaks = []
+            results = []
+            for memory_limit in [None, 20000]:
+                vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, memory_limit = memory_limit)
+                tracemalloc.start()
+                vlsd.fit(df, target)
+                peaks.append(tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+                results.append( (vlsd.visited_nodes, vlsd.selected_subgroups, vlsd.unselected_subgroups) )
+            # The memory limit does not increase the peak of memory and the results are the same.
+            self.assertLessEqual(peaks[1], peaks[0])
+            self.assertEqual(results[1], results[0])
+
+    def test_VLSD_iter_subgroups(self) -> None:
+        df = DataFrame({"a1" : ["a","b","c","c"], "a2" : ["q","q","s","q"], "a3" : ["f","g","h","k"], "class" : ["n","y","n","y"]})
+        target = ("class", "y")
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1)
+        # The parameters are checked when the method is called (not when the first subgroup is requested).
+        self.assertRaises(TypeError, vlsd.iter_subgroups, "df", target)
+        self.assertRaises(TypeError, vlsd.iter_subgroups, df, target, include_sequences_of_instances = 1)
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            vlsd = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results.txt")
+            vlsd.fit(df, target)
+            file_to_read = open("./results.txt", "r")
+            list_of_written_results = file_to_read.readlines()
+            file_to_read.close()
+            remove("./results.txt")
+            # The same subgroups (and in the same order) as the 'fit' method, but nothing is written in the file.
+            vlsd_iter = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = vertical_lists_implementation, write_results_in_file=True, file_path="./results_iter.txt")
+            results = list(vlsd_iter.iter_subgroups(df, target))
+            self.assertTrue(all(type(result) is VLSDResult for result in results))
+            self.assertEqual([result.to_subgroup(target) for result in results], [Subgroup.generate_from_str(elem.split(";")[0][:-1]) for elem in list_of_written_results])
+            self.assertEqual([result.quality_value for result in results], [float(elem.split(" ; ")[3].split(" = ")[1]) for elem in list_of_written_results])
+            self.assertEqual([result.tp for result in results], [int(elem.split(" ; ")[5].split(" = ")[1]) for elem in list_of_written_results])
+            self.assertEqual([result.fp for result in results], [int(elem.split(" ; ")[6].split(" = ")[1]) for elem in list_of_written_results])
+            self.assertTrue(all(result.sequence_of_instances_tp is None for result in results))
+            self.assertEqual(vlsd_iter.selected_subgroups, vlsd.selected_subgroups)
+            self.assertEqual(vlsd_iter.unselected_subgroups, vlsd.unselected_subgroups)
+            self.assertRaises(FileNotFoundError, open, "./results_iter.txt", "r")
+        # The search only advances when the next subgroup is requested.
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1)
+        iterator = vlsd.iter_subgroups(df, target, include_sequences_of_instances = True)
+        self.assertEqual(vlsd.visited_nodes, 0)
+        first_result = next(iterator)
+        self.assertEqual(vlsd.visited_nodes, 1)
+        self.assertEqual(first_result.to_subgroup(target), Subgroup.generate_from_str("Description: [a1 = a], Target: class = 'y'"))
+        self.assertEqual(first_result.tp, 0)
+        self.assertEqual(first_result.fp, 1)
+        self.assertEqual(first_result.quality_value, -0.125)
+        self.assertEqual(first_result.optimistic_estimate_value, 0)
+        self.assertEqual(list(first_result.sequence_of_instances_fp.search(1)), [0])
+        self.assertEqual(len(list(iterator)), 24)
+        self.assertEqual(vlsd.visited_nodes, 25)
+
+    def test_VLSD_query_triangular_matrix(self) -> None:
+        # Triangular matrix with 4 rows: [0][1]=0, [0][2]=1, [0][3]=2, [1][2]=3, [1][3]=4, [2][3]=5.
+        matrix = arange(6)
+        self.assertEqual(_query_triangular_matrix(matrix, 4, 0, 1), 0)
+        self.assertEqual(_query_triangular_matrix(matrix, 4, 0, 3), 2)
+        self.assertEqual(_query_triangular_matrix(matrix, 4, 1, 2), 3)
+        self.assertEqual(_query_triangular_matrix(matrix, 4, 3, 1), 4)
+        self.assertEqual(_query_triangular_matrix(matrix, 4, 2, 3), 5)
+        self.assertEqual(_query_triangular_matrix(matrix, 4, 3, 2), 5)
+
+    def test_VLSD_attribute_exclusivity(self) -> None:
+        df = DataFrame({"a1" : ["a", "b", "c", "a"], "a2" : ["x", "x", "y", "y"], "class" : ["y", "n", "y", "n"]})
+        target = ("class", "y")
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1)
+        target_attribute_as_a_mask = (df[target[0]] == target[1]).to_numpy()
+        S1 = vlsd._generate_subgroups_s1(vlsd._generate_covers_of_the_selectors(df, target[0]), target_attribute_as_a_mask, 2, 2)
+        self.assertEqual([str(s.list_of_selectors[-1]) for s in S1], ["a1 = 'a'", "a1 = 'b'", "a1 = 'c'", "a2 = 'x'", "a2 = 'y'"])
+        self.assertEqual(VLSD._generate_attribute_ids(S1), [0, 0, 0, 1, 1])
+        # The pairs of selectors with the same attribute are never joined, so their entries in M are -inf (even if the threshold is -inf).
+        vlsd._current_oe_minimum_threshold = float("-inf")
+        M = vlsd._generate_triangular_matrix_M(S1, 2, 2)
+        for index_a in range(len(S1)):
+            for index_b in range(index_a+1, len(S1)):
+                same_attribute = S1[index_a].list_of_selectors[-1].attribute_name == S1[index_b].list_of_selectors[-1].attribute_name
+                self.assertEqual(_query_triangular_matrix(M, len(S1), index_a, index_b) == float("-inf"), same_attribute or (S1[index_a].join(S1[index_b], WRAccOptimisticEstimate1(), {"TP" : 2, "FP" : 2}, return_None_if_n_is_0 = True) is None))
+        # Only the 4 pairs of selectors with different attributes which appear together in the dataset are visited (apart from the selectors).
+        results = list(vlsd.iter_subgroups(df, target))
+        self.assertEqual(vlsd.visited_nodes, 5 + 4)
+        self.assertTrue(all(len(set(selector.attribute_name for selector in result.list_of_selectors)) == len(result.list_of_selectors) for result in results))
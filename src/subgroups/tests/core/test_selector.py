@@ -9,6 +9,7 @@
 from subgroups.core.selector import Selector
 from weakref import WeakValueDictionary
 from subgroups.core.operator import Operator
+from pickle import dumps, loads
 import unittest
 
 class TestSelector(unittest.TestCase):
@@ -389,3 +390,17 @@ class TestSelector(unittest.TestCase):
         self.assertLessEqual(selector1, selector5)
         self.assertLessEqual(selector1, selector5)
         self.assertLess(selector1, selector5)
+
+    def test_Selector_serialization(self) -> None:
+        selector1 = Selector("a", Operator.EQUAL, "value")
+        selector2 = Selector("b", Operator.LESS, 23.5)
+        # The deserialized selectors must be the same objects (selector pool).
+        self.assertIs(loads(dumps(selector1)), selector1)
+        self.assertIs(loads(dumps(selector2)), selector2)
+        self.assertEqual(len(Selector._dict_of_selectors), 2)
+        # If the selector does not exist, it is created again.
+        serialized_selector = dumps(Selector("c", Operator.NOT_EQUAL, 5))
+        self.assertEqual(len(Selector._dict_of_selectors), 2)
+        selector3 = loads(serialized_selector)
+        self.assertEqual(selector3, Selector("c", Operator.NOT_EQUAL, 5))
+        self.assertEqual(len(Selector._dict_of_selectors), 3)
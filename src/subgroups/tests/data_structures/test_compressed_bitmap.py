@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/compressed_bitmap.py'.
+"""
+
+from subgroups.data_structures.compressed_bitmap import CompressedBitmap
+from numpy import array, uint16, uint64
+import unittest
+
+class TestCompressedBitmap(unittest.TestCase):
+
+    def test_compressed_bitmap_creation(self) -> None:
+        cb_1 = CompressedBitmap([5, 1, 70000, 1, 3])
+        self.assertEqual(len(cb_1), 4)
+        self.assertEqual(list(cb_1), [1, 3, 5, 70000])
+        self.assertIn(70000, cb_1)
+        self.assertIn(1, cb_1)
+        self.assertNotIn(2, cb_1)
+        self.assertNotIn(70001, cb_1)
+        self.assertNotIn(200000, cb_1)
+        self.assertEqual(sorted(cb_1._containers), [0, 1])
+        self.assertEqual(cb_1._containers[0].dtype, uint16) # Array container.
+        cb_2 = CompressedBitmap(array(range(0, 20000, 2)))
+        self.assertEqual(len(cb_2), 10000)
+        self.assertEqual(cb_2._containers[0].dtype, uint64) # Bitmap container.
+        self.assertEqual(list(cb_2), list(range(0, 20000, 2)))
+        self.assertIn(19998, cb_2)
+        self.assertNotIn(19999, cb_2)
+        self.assertEqual(len(CompressedBitmap()), 0)
+        self.assertEqual(list(CompressedBitmap(set())), [])
+        self.assertEqual(CompressedBitmap({3, 4}), CompressedBitmap([4, 3]))
+        self.assertNotEqual(CompressedBitmap({3, 4}), CompressedBitmap([4]))
+        self.assertRaises(TypeError, CompressedBitmap, 3)
+        self.assertRaises(ValueError, CompressedBitmap, [-1, 3])
+
+    def test_compressed_bitmap_intersection(self) -> None:
+        set_1 = set(range(0, 30000, 3)) | {65536, 65537, 140000}
+        set_2 = set(range(0, 24000, 2)) | {65537, 140000, 140001}
+        set_3 = {6, 65537, 140001, 300000}
+        cb_1 = CompressedBitmap(set_1)
+        cb_2 = CompressedBitmap(set_2)
+        cb_3 = CompressedBitmap(set_3)
+        for (cb_a, set_a) in [(cb_1, set_1), (cb_2, set_2), (cb_3, set_3)]:
+            for (cb_b, set_b) in [(cb_1, set_1), (cb_2, set_2), (cb_3, set_3)]:
+                self.assertEqual(list(cb_a.intersection(cb_b)), sorted(set_a & set_b))
+                self.assertEqual(len(cb_a.intersection(cb_b)), len(set_a & set_b))
+                self.assertEqual(cb_a.intersection_cardinality(cb_b), len(set_a & set_b))
+        # The intersection of two bitmap containers with few elements is an array container.
+        self.assertEqual(cb_1.intersection(cb_2)._containers[0].dtype, uint16)
+        self.assertEqual(len(cb_1.intersection(CompressedBitmap())), 0)
+        self.assertRaises(TypeError, cb_1.intersection, set_1)
+        self.assertRaises(TypeError, cb_1.intersection_cardinality, set_1)
@@ -15,6 +15,10 @@ from numpy import concatenate, quantile
 from subgroups.exceptions import InconsistentMethodParametersError
 import unittest
 
+def _fp_tree_as_tuple(node) -> tuple:
+    # The selector, the counters and the children (in insertion order) of each node, but not the ids of the nodes.
+    return (str(node.selector), node.counters, [_fp_tree_as_tuple(node._childs[key]) for key in node._childs])
+
 class TestFPTreeForSDMap(unittest.TestCase):
 
     def test_FPTreeForSDMap_generate_set_of_frequent_selectors_1(self) -> None:
@@ -694,3 +698,50 @@ class TestFPTreeForSDMap(unittest.TestCase):
         self.assertRaises(InconsistentMethodParametersError, fp_tree_for_sdmap.generate_conditional_fp_tree, [Selector.generate_from_str("c = c")], minimum_tp=0, minimum_n=0)
         self.assertRaises(InconsistentMethodParametersError, fp_tree_for_sdmap.generate_conditional_fp_tree, [Selector.generate_from_str("c = c")], minimum_fp=0, minimum_n=0)
         self.assertRaises(InconsistentMethodParametersError, fp_tree_for_sdmap.generate_conditional_fp_tree, [Selector.generate_from_str("c = c")], minimum_tp=0, minimum_fp=0, minimum_n=0)
+
+    def test_FPTreeForSDMap_build_tree_5(self) -> None:
+        # The tree built from the whole DataFrame must be the same as the one built by inserting the rows one by one.
+        seed(0)
+        df = DataFrame({"a1" : [choice(["a", "b", "c"]) for _ in range(300)], "a2" : [choice(["x", "y"]) for _ in range(300)], "a3" : [choice(["k", "l", "m", "n"]) for _ in range(300)], "target" : [choice(["Y", "N"]) for _ in range(300)]})
+        target = ("target", "Y")
+        for thresholds in [{"minimum_tp" : 40, "minimum_fp" : 0}, {"minimum_n" : 0}]:
+            fp_tree_for_sdmap = FPTreeForSDMap()
+            set_of_frequent_selectors = fp_tree_for_sdmap.generate_set_of_frequent_selectors(df, target, **thresholds)
+            fp_tree_for_sdmap.build_tree(df, set_of_frequent_selectors, target)
+            expected_fp_tree = FPTreeForSDMap()
+            for row in df.index:
+                selectors_in_the_current_row = [set_of_frequent_selectors[column+repr(df.loc[row, column])][0] for column in ["a1", "a2", "a3"] if column+repr(df.loc[row, column]) in set_of_frequent_selectors]
+                selectors_in_the_current_row.sort(key = lambda x : set_of_frequent_selectors[x.attribute_name+repr(x.value)][2])
+                selectors_in_the_current_row.sort(key = lambda x : sum(set_of_frequent_selectors[x.attribute_name+repr(x.value)][1]), reverse=True)
+                expected_fp_tree._insert_tree(selectors_in_the_current_row, expected_fp_tree.root_node, df.loc[row, "target"] == "Y")
+            self.assertEqual(_fp_tree_as_tuple(fp_tree_for_sdmap.root_node), _fp_tree_as_tuple(expected_fp_tree.root_node))
+            self.assertEqual(list(fp_tree_for_sdmap.header_table), list(expected_fp_tree.header_table))
+            for selector in expected_fp_tree.header_table:
+                self.assertEqual(fp_tree_for_sdmap.header_table[selector][0], expected_fp_tree.header_table[selector][0])
+                self.assertTrue(all(type(counter) is int for counter in fp_tree_for_sdmap.header_table[selector][0]))
+                # The nodes of the horizontal lists must be in the same order.
+                node, expected_node = fp_tree_for_sdmap.header_table[selector][1], expected_fp_tree.header_table[selector][1]
+                while expected_node is not None:
+                    self.assertEqual(node.counters, expected_node.counters)
+                    self.assertEqual(str(node.parent.selector), str(expected_node.parent.selector))
+                    node, expected_node = node.node_link, expected_node.node_link
+                self.assertIsNone(node)
+            self.assertEqual(fp_tree_for_sdmap.sorted_header_table, sorted(expected_fp_tree.header_table, key=lambda x : sum(expected_fp_tree.header_table[x][0])))
+
+    def test_FPTreeForSDMap_generate_conditional_fp_tree_3(self) -> None:
+        # IMPORTANT: a new selector object is created in each insertion, so equal selectors are different objects in the tree.
+        fp_tree_for_sdmap = FPTreeForSDMap()
+        for row, target_match in ([["a = a", "b = b", "c = c"], True], [["a = a", "d = d", "c = c"], False], [["b = b", "c = c"], True], [["a = a", "b = b", "c = c"], False], [["a = a", "c = c"], False]):
+            fp_tree_for_sdmap._insert_tree([Selector.generate_from_str(elem) for elem in row], fp_tree_for_sdmap.root_node, target_match)
+        # The paths [a = a, d = d] and [a = a] are identical after pruning 'd = d', so they are merged.
+        conditional_fp_tree = fp_tree_for_sdmap.generate_conditional_fp_tree([Selector.generate_from_str("c = c")], minimum_n=2)
+        self.assertEqual(_fp_tree_as_tuple(conditional_fp_tree.root_node), ("None = 'None'", [-1, -1], [("a = 'a'", [1, 3], [("b = 'b'", [1, 1], [])]), ("b = 'b'", [1, 0], [])]))
+        self.assertEqual(list(conditional_fp_tree.header_table), [Selector.generate_from_str("a = a"), Selector.generate_from_str("b = b")])
+        self.assertEqual(conditional_fp_tree.header_table[Selector.generate_from_str("a = a")][0], [1, 3])
+        self.assertEqual(conditional_fp_tree.header_table[Selector.generate_from_str("b = b")][0], [2, 1])
+        self.assertEqual([node.counters for node in conditional_fp_tree.horizontal_list(Selector.generate_from_str("b = b"))], [[1, 1], [1, 0]])
+        self.assertEqual(conditional_fp_tree.sorted_header_table, [Selector.generate_from_str("b = b"), Selector.generate_from_str("a = a")])
+        self.assertFalse(conditional_fp_tree.there_is_a_single_path())
+        # The same conditional FPTree is generated with the tp and fp thresholds ('d = d' is also pruned).
+        conditional_fp_tree = fp_tree_for_sdmap.generate_conditional_fp_tree([Selector.generate_from_str("c = c")], minimum_tp=1, minimum_fp=1)
+        self.assertEqual(_fp_tree_as_tuple(conditional_fp_tree.root_node), ("None = 'None'", [-1, -1], [("a = 'a'", [1, 3], [("b = 'b'", [1, 1], [])]), ("b = 'b'", [1, 0], [])]))
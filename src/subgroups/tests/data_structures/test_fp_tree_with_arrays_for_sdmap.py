@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the files 'data_structures/fp_tree_with_arrays_for_sdmap.py' and 'data_structures/fp_tree_with_arrays_for_sdmapstar.py'.
+"""
+
+from pandas import DataFrame
+from subgroups.data_structures.fp_tree_for_sdmap import FPTreeForSDMap
+from subgroups.data_structures.fp_tree_for_sdmapstar import FPTreeForSDMapStar
+from subgroups.data_structures.fp_tree_with_arrays_for_sdmap import FPTreeWithArraysForSDMap
+from subgroups.data_structures.fp_tree_with_arrays_for_sdmapstar import FPTreeWithArraysForSDMapStar
+from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups.exceptions import InconsistentMethodParametersError
+from random import seed, choice
+import unittest
+
+def _fp_tree_as_tuple(node) -> tuple:
+    # The selector, the counters and the children (in insertion order) of each node of a FPTreeForSDMap.
+    return (str(node.selector), node.counters, [_fp_tree_as_tuple(node._childs[key]) for key in node._childs])
+
+def _fp_tree_with_arrays_as_tuple(fp_tree, node = 0) -> tuple:
+    # The selector, the counters and the children (in insertion order) of each node of a FPTreeWithArraysForSDMap.
+    children = [child for child in range(1, fp_tree.number_of_nodes) if fp_tree.parents[child] == node]
+    if node == 0:
+        return ("None = 'None'", [-1, -1], [_fp_tree_with_arrays_as_tuple(fp_tree, child) for child in children])
+    return (str(fp_tree.selectors[fp_tree.items[node]]), [fp_tree.tps[node], fp_tree.fps[node]], [_fp_tree_with_arrays_as_tuple(fp_tree, child) for child in children])
+
+def _generate_dataset(n_rows : int, random_seed : int) -> DataFrame:
+    seed(random_seed)
+    df = DataFrame()
+    for att_name in ["att1", "att2", "att3", "att4", "att5"]:
+        df[att_name] = [choice(["value1", "value2", "value3", "value4"]) for _ in range(n_rows)]
+    df["target"] = [choice(["Y", "N"]) for _ in range(n_rows)]
+    return df
+
+class TestFPTreeWithArraysForSDMap(unittest.TestCase):
+
+    def _assert_equivalent_fp_trees(self, fp_tree_with_arrays, fp_tree) -> None:
+        # Same tree (nodes, counters and order of the children).
+        self.assertEqual(_fp_tree_with_arrays_as_tuple(fp_tree_with_arrays), _fp_tree_as_tuple(fp_tree.root_node))
+        self.assertEqual(fp_tree_with_arrays.is_empty(), fp_tree.is_empty())
+        self.assertEqual(fp_tree_with_arrays.there_is_a_single_path(), fp_tree.there_is_a_single_path())
+        # Same header table, horizontal lists and sorted header table (with the same order).
+        self.assertEqual(fp_tree_with_arrays.get_selectors(list(fp_tree_with_arrays.header_table)), list(fp_tree.header_table))
+        self.assertEqual(fp_tree_with_arrays.get_selectors(fp_tree_with_arrays.sorted_header_table), fp_tree.sorted_header_table)
+        for item, selector in zip(fp_tree_with_arrays.header_table, fp_tree.header_table):
+            self.assertEqual(fp_tree_with_arrays.header_table[item][0], fp_tree.header_table[selector][0])
+            self.assertTrue(all(type(counter) is int for counter in fp_tree_with_arrays.header_table[item][0]))
+            expected_node = fp_tree.header_table[selector][1]
+            for node in fp_tree_with_arrays.horizontal_list(item):
+                self.assertEqual([fp_tree_with_arrays.tps[node], fp_tree_with_arrays.fps[node]], expected_node.counters)
+                expected_node = expected_node.node_link
+            self.assertIsNone(expected_node)
+
+    def _assert_equivalent_conditional_fp_trees(self, fp_tree_with_arrays, fp_tree, alpha_with_arrays, alpha, **thresholds) -> None:
+        # All the conditional FPTrees (recursively) must be equivalent.
+        for item, selector in zip(fp_tree_with_arrays.sorted_header_table, fp_tree.sorted_header_table):
+            conditional_fp_tree_with_arrays = fp_tree_with_arrays.generate_conditional_fp_tree([item] + alpha_with_arrays, **thresholds)
+            conditional_fp_tree = fp_tree.generate_conditional_fp_tree([selector] + alpha, **thresholds)
+            self._assert_equivalent_fp_trees(conditional_fp_tree_with_arrays, conditional_fp_tree)
+            self._assert_equivalent_conditional_fp_trees(conditional_fp_tree_with_arrays, conditional_fp_tree, [item] + alpha_with_arrays, [selector] + alpha, **thresholds)
+
+    def test_FPTreeWithArraysForSDMap_init_method(self) -> None:
+        fp_tree = FPTreeWithArraysForSDMap()
+        self.assertTrue(fp_tree.is_empty())
+        self.assertTrue(fp_tree.there_is_a_single_path())
+        self.assertEqual(fp_tree.number_of_nodes, 1)
+        self.assertEqual(fp_tree.header_table, dict())
+        self.assertEqual(fp_tree.sorted_header_table, [])
+        self.assertRaises(TypeError, FPTreeWithArraysForSDMapStar, 1.0, 2)
+        self.assertRaises(TypeError, FPTreeWithArraysForSDMapStar, 1, "2")
+
+    def test_FPTreeWithArraysForSDMap_build_tree(self) -> None:
+        df = _generate_dataset(500, 123)
+        target = ("target", "Y")
+        for thresholds in ({"minimum_tp" : 20, "minimum_fp" : 20}, {"minimum_n" : 100}, {"minimum_n" : 500}):
+            fp_tree_with_arrays = FPTreeWithArraysForSDMap()
+            fp_tree_with_arrays.build_tree(df, fp_tree_with_arrays.generate_set_of_frequent_selectors(df, target, **thresholds), target)
+            fp_tree = FPTreeForSDMap()
+            fp_tree.build_tree(df, fp_tree.generate_set_of_frequent_selectors(df, target, **thresholds), target)
+            self._assert_equivalent_fp_trees(fp_tree_with_arrays, fp_tree)
+            self.assertEqual(fp_tree_with_arrays.tree_as_str().count("\n"), fp_tree_with_arrays.number_of_nodes)
+        self.assertRaises(TypeError, FPTreeWithArraysForSDMap().build_tree, df, [], target)
+
+    def test_FPTreeWithArraysForSDMap_single_path(self) -> None:
+        df = DataFrame({"a1" : ["a","a","a","b"], "a2" : ["q","q","s","s"], "class" : ["y","n","y","n"]})
+        target = ("class", "y")
+        fp_tree_with_arrays = FPTreeWithArraysForSDMap()
+        fp_tree_with_arrays.build_tree(df, fp_tree_with_arrays.generate_set_of_frequent_selectors(df, target, minimum_n=2), target)
+        self.assertFalse(fp_tree_with_arrays.is_empty())
+        self.assertFalse(fp_tree_with_arrays.there_is_a_single_path())
+        conditional_fp_tree_with_arrays = fp_tree_with_arrays.generate_conditional_fp_tree([fp_tree_with_arrays.sorted_header_table[0]], minimum_n=2)
+        self.assertTrue(conditional_fp_tree_with_arrays.there_is_a_single_path())
+        self.assertEqual(conditional_fp_tree_with_arrays.number_of_nodes, 2)
+        self.assertEqual([str(selector) for selector in conditional_fp_tree_with_arrays.get_selectors(conditional_fp_tree_with_arrays.sorted_header_table)], ["a1 = 'a'"])
+
+    def test_FPTreeWithArraysForSDMap_generate_conditional_fp_tree(self) -> None:
+        df = _generate_dataset(300, 456)
+        target = ("target", "Y")
+        for thresholds in ({"minimum_tp" : 5, "minimum_fp" : 5}, {"minimum_n" : 15}):
+            fp_tree_with_arrays = FPTreeWithArraysForSDMap()
+            fp_tree_with_arrays.build_tree(df, fp_tree_with_arrays.generate_set_of_frequent_selectors(df, target, **thresholds), target)
+            fp_tree = FPTreeForSDMap()
+            fp_tree.build_tree(df, fp_tree.generate_set_of_frequent_selectors(df, target, **thresholds), target)
+            self._assert_equivalent_conditional_fp_trees(fp_tree_with_arrays, fp_tree, [], [], **thresholds)
+        self.assertRaises(TypeError, fp_tree_with_arrays.generate_conditional_fp_tree, (0,), minimum_n=15)
+        self.assertRaises(InconsistentMethodParametersError, fp_tree_with_arrays.generate_conditional_fp_tree, [0], minimum_tp=1, minimum_n=15)
+
+    def test_FPTreeWithArraysForSDMapStar_generate_conditional_fp_tree_star(self) -> None:
+        df = _generate_dataset(300, 789)
+        target = ("target", "Y")
+        TP = int((df["target"] == "Y").sum())
+        FP = len(df.index) - TP
+        fp_tree_with_arrays = FPTreeWithArraysForSDMapStar(TP, FP)
+        fp_tree_with_arrays.build_tree(df, fp_tree_with_arrays.generate_set_of_frequent_selectors(df, target, minimum_n=10), target)
+        fp_tree = FPTreeForSDMapStar(TP, FP)
+        fp_tree.build_tree(df, fp_tree.generate_set_of_frequent_selectors(df, target, minimum_n=10), target)
+        for min_optimistic_estimate in (-1, 0.005, 0.01):
+            for item, selector in zip(fp_tree_with_arrays.sorted_header_table, fp_tree.sorted_header_table):
+                conditional_fp_tree_with_arrays, pruned_branches_with_arrays = fp_tree_with_arrays.generate_conditional_fp_tree_star([item], min_optimistic_estimate, WRAccOptimisticEstimate1(), minimum_n=10)
+                conditional_fp_tree, pruned_branches = fp_tree.generate_conditional_fp_tree_star([selector], min_optimistic_estimate, WRAccOptimisticEstimate1(), minimum_n=10)
+                self.assertIs(type(conditional_fp_tree_with_arrays), FPTreeWithArraysForSDMapStar)
+                self.assertEqual(pruned_branches_with_arrays, pruned_branches)
+                self._assert_equivalent_fp_trees(conditional_fp_tree_with_arrays, conditional_fp_tree)
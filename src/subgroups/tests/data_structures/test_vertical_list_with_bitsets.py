@@ -8,6 +8,7 @@
 
 from subgroups.data_structures.vertical_list_with_bitsets import VerticalListWithBitsets
 from bitarray import bitarray
+from numpy import array, zeros
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from pandas import DataFrame
@@ -112,6 +113,49 @@ class TestVerticalListWithBitsets(unittest.TestCase):
         vl_2 = VerticalListWithBitsets([Selector("at2", Operator.EQUAL, "b")], [0], [1], 5, -45) # number_of_dataset_instances = 5
         self.assertRaises(VerticalListSizeError, vl_1.join, vl_2, Coverage(), {"TP" : 5, "FP" : 5})
 
+    def test_vertical_list_minimum_quality_value(self) -> None:
+        TP = 24
+        FP = 26
+        vl_1 = VerticalListWithBitsets([Selector("at1", Operator.EQUAL, "a")], [0,1,5], [2,3,7], 50, -45)
+        vl_2 = VerticalListWithBitsets([Selector("at2", Operator.EQUAL, "b")], [0,1], [2,3,4], 50, -45)
+        vl_3 = VerticalListWithBitsets([Selector("at3", Operator.EQUAL, "c")], [5], [6], 50, -45)
+        # Coverage of the join of vl_1 and vl_2: 4/50 = 0.08. Coverage of the join of vl_1 and vl_3: 1/50 = 0.02.
+        join_1 = vl_1.join(vl_2, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0.08)
+        self.assertEqual(join_1.list_of_selectors, [Selector("at1", Operator.EQUAL, "a"), Selector("at2", Operator.EQUAL, "b")])
+        self.assertEqual(join_1.tp, 2)
+        self.assertEqual(join_1.fp, 2)
+        self.assertEqual(join_1.quality_value, 0.08)
+        self.assertEqual(join_1.sequence_of_instances_tp, vl_1.join(vl_2, Coverage(), {"TP" : TP, "FP" : FP}).sequence_of_instances_tp)
+        self.assertIsNone(vl_1.join(vl_3, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0.05))
+        self.assertIsNotNone(vl_1.join(vl_3, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0))
+        self.assertIsNone(vl_2.join(vl_3, Coverage(), {"TP" : TP, "FP" : FP}, return_None_if_n_is_0 = True, minimum_quality_value = -1))
+        self.assertEqual(vl_2.join(vl_3, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0).n, 0)
+        self.assertEqual(vl_1.join_with_many([vl_2, vl_3], Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0.05)[1], None)
+        self.assertRaises(TypeError, vl_1.join, vl_2, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = "0")
+
+    def test_vertical_list_numpy_sequences(self) -> None:
+        list_of_selectors = [Selector("at1", Operator.EQUAL, "a")]
+        for number_of_dataset_instances in [0, 1, 8, 13, 64]:
+            sequence_tp = [index for index in range(number_of_dataset_instances) if index % 3 == 0]
+            sequence_fp = [index for index in range(number_of_dataset_instances) if index % 5 == 1]
+            vl = VerticalListWithBitsets(list_of_selectors, sequence_tp, sequence_fp, number_of_dataset_instances, -45)
+            # Arrays with the IDs of the instances.
+            vl_from_arrays = VerticalListWithBitsets(list_of_selectors, array(sequence_tp, dtype=int), array(sequence_fp, dtype=int), number_of_dataset_instances, -45)
+            # Boolean masks.
+            mask_tp = zeros(number_of_dataset_instances, dtype=bool)
+            mask_tp[sequence_tp] = True
+            mask_fp = zeros(number_of_dataset_instances, dtype=bool)
+            mask_fp[sequence_fp] = True
+            vl_from_masks = VerticalListWithBitsets(list_of_selectors, mask_tp, mask_fp, number_of_dataset_instances, -45)
+            for other_vl in [vl_from_arrays, vl_from_masks]:
+                self.assertEqual(other_vl.sequence_of_instances_tp, vl.sequence_of_instances_tp)
+                self.assertEqual(other_vl.sequence_of_instances_fp, vl.sequence_of_instances_fp)
+                self.assertEqual(len(other_vl.sequence_of_instances_tp), number_of_dataset_instances)
+                self.assertEqual(other_vl.tp, vl.tp)
+                self.assertEqual(other_vl.fp, vl.fp)
+                self.assertEqual(type(other_vl.tp), int)
+        self.assertRaises(ValueError, VerticalListWithBitsets, list_of_selectors, zeros(3, dtype=bool), [], 5, -45)
+
     def test_vertical_list_str_method(self) -> None:
         vl_1 = VerticalListWithBitsets([Selector("at1", Operator.EQUAL, "a")], [], [], 4, 20)
         vl_2 = VerticalListWithBitsets([Selector("at2", Operator.EQUAL, "b"), Selector("at3", Operator.NOT_EQUAL, "c")], [0,1], [], 4, -45)
@@ -112,6 +112,26 @@ class TestVerticalListWithSets(unittest.TestCase):
         vl_2 = VerticalListWithSets([Selector("at2", Operator.EQUAL, "b")], [0], [1], 5, -45) # number_of_dataset_instances = 5
         self.assertRaises(VerticalListSizeError, vl_1.join, vl_2, Coverage(), {"TP" : 5, "FP" : 5})
 
+    def test_vertical_list_minimum_quality_value(self) -> None:
+        TP = 24
+        FP = 26
+        vl_1 = VerticalListWithSets([Selector("at1", Operator.EQUAL, "a")], [0,1,5], [2,3,7], 50, -45)
+        vl_2 = VerticalListWithSets([Selector("at2", Operator.EQUAL, "b")], [0,1], [2,3,4], 50, -45)
+        vl_3 = VerticalListWithSets([Selector("at3", Operator.EQUAL, "c")], [5], [6], 50, -45)
+        # Coverage of the join of vl_1 and vl_2: 4/50 = 0.08. Coverage of the join of vl_1 and vl_3: 1/50 = 0.02.
+        join_1 = vl_1.join(vl_2, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0.08)
+        self.assertEqual(join_1.list_of_selectors, [Selector("at1", Operator.EQUAL, "a"), Selector("at2", Operator.EQUAL, "b")])
+        self.assertEqual(join_1.tp, 2)
+        self.assertEqual(join_1.fp, 2)
+        self.assertEqual(join_1.quality_value, 0.08)
+        self.assertEqual(join_1.sequence_of_instances_tp, vl_1.join(vl_2, Coverage(), {"TP" : TP, "FP" : FP}).sequence_of_instances_tp)
+        self.assertIsNone(vl_1.join(vl_3, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0.05))
+        self.assertIsNotNone(vl_1.join(vl_3, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0))
+        self.assertIsNone(vl_2.join(vl_3, Coverage(), {"TP" : TP, "FP" : FP}, return_None_if_n_is_0 = True, minimum_quality_value = -1))
+        self.assertEqual(vl_2.join(vl_3, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0).n, 0)
+        self.assertEqual(vl_1.join_with_many([vl_2, vl_3], Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = 0.05)[1], None)
+        self.assertRaises(TypeError, vl_1.join, vl_2, Coverage(), {"TP" : TP, "FP" : FP}, minimum_quality_value = "0")
+
     def test_vertical_list_str_method(self) -> None:
         vl_1 = VerticalListWithSets([Selector("at1", Operator.EQUAL, "a")], [], [], 4, 20)
         vl_2 = VerticalListWithSets([Selector("at2", Operator.EQUAL, "b"), Selector("at3", Operator.NOT_EQUAL, "c")], [0,1], [], 4, -45)